@@ -0,0 +1,40 @@
+import timeit
+from src.models.hn_parser import PARSER_BACKENDS, get_parser
+from tests.constants import MOCK_HTML_HN_ENTRIES_NUM
+from tests.utils import get_mocked_hn_html
+
+# Number of parses timed per repetition
+BENCH_PARSE_NUMBER = 20
+
+# Number of repetitions, the best of which is reported
+BENCH_PARSE_REPEAT = 5
+
+def bench_parsers() -> dict[str, float]:
+    """
+    Times every available parser backend against the mock yCombinator html file.
+
+    Returns:
+        dict[str, float]: The best time per parse in milliseconds, keyed by backend name.
+    """
+    content = get_mocked_hn_html().encode('utf-8')
+    reference = None
+    results = {}
+    for name in PARSER_BACKENDS:
+        try:
+            parser = get_parser(name)
+        except ImportError as e:
+            print(f"{name:<12} skipped ({e})")
+            continue
+        entries = parser.parse(content, MOCK_HTML_HN_ENTRIES_NUM)
+        if reference is None:
+            reference = entries
+        elif entries != reference:
+            print(f"{name:<12} WARNING: entries differ from the {next(iter(results))} backend")
+        times = timeit.repeat(lambda: parser.parse(content, MOCK_HTML_HN_ENTRIES_NUM),
+                              number=BENCH_PARSE_NUMBER, repeat=BENCH_PARSE_REPEAT)
+        results[name] = min(times) / BENCH_PARSE_NUMBER * 1000
+        print(f"{name:<12} {results[name]:8.3f} ms/page")
+    return results
+
+if __name__ == "__main__":
+    bench_parsers()
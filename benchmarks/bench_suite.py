@@ -0,0 +1,261 @@
+import argparse
+import datetime
+import json
+import random
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable
+from unittest.mock import Mock, patch
+from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_scraper import HackerNewsScraper
+from tests.constants import MOCK_HTML_HN_ENTRIES_NUM
+from tests.utils import get_mocked_hn_html
+
+# Baseline results compared against by default. It stores each benchmark's time divided by the time of the
+# reference workload measured in the same run, so that it can be compared against on machines of any speed.
+BENCH_BASELINE_PATH = Path(__file__).with_name('baseline.json')
+
+# Number of values built and sorted by the reference workload
+BENCH_REFERENCE_SIZE = 100_000
+
+# Root of the repository, from which the modules timed by bench_imports are imported in a fresh interpreter
+BENCH_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules whose import time is measured, with the module whose own import time is left out of each
+BENCH_IMPORTS = {'src.main': None, 'src.models.hn_scraper': 'requests'}
+
+# Entry counts the filter and sort methods are timed at
+BENCH_SIZES = (30, 10_000, 1_000_000)
+
+# Number of entries built per construction benchmark run
+BENCH_CONSTRUCTION_COUNT = 10_000
+
+# Minimum total time of one repetition in seconds, used to pick how many calls are timed per repetition
+BENCH_MIN_REPEAT_TIME = 0.2
+
+# Number of repetitions, the best of which is reported
+BENCH_REPEAT = 5
+
+# Relative slowdown over the baseline above which a benchmark is reported as a regression
+BENCH_REGRESSION_TOLERANCE = 0.25
+
+# Benchmarks that should be faster than another one whatever the machine, such as a bulk path against the per-row
+# path it replaces, mapped to that other benchmark
+BENCH_EXPECTED_FASTER = {
+    f'HackerNewsEntry.bulk_trusted[{BENCH_CONSTRUCTION_COUNT}]': f'HackerNewsEntry.trusted[{BENCH_CONSTRUCTION_COUNT}]',
+}
+
+# Seed of the synthetic entries, so every run times the same data
+BENCH_SEED = 0
+
+_WORDS = ('show', 'hn', 'rust', 'python', 'database', 'release', 'open', 'source', 'the', 'a', 'of', 'new', 'why',
+          'how', 'we', 'built', 'fast', 'compiler', 'model', 'linux')
+
+def _time(fn: Callable[[], object], setup: Callable[[], object] | None = None) -> float:
+    """
+    Returns the best time of one call to fn in milliseconds. setup runs untimed before every call.
+    """
+    def run(number: int) -> float:
+        total = 0.0
+        for _ in range(number):
+            if setup is not None:
+                setup()
+            start = timeit.default_timer()
+            fn()
+            total += timeit.default_timer() - start
+        return total
+
+    number = 1
+    while (elapsed := run(number)) < BENCH_MIN_REPEAT_TIME and number < 1_000_000:
+        number *= 10
+    best = min([elapsed] + [run(number) for _ in range(BENCH_REPEAT - 1)])
+    return best / number * 1000
+
+def synthetic_entries(count: int, seed: int = BENCH_SEED) -> list[HackerNewsEntry]:
+    """
+    Builds count entries with random titles of 1 to 15 words and random comment counts and points.
+    """
+    rng = random.Random(seed)
+    return HackerNewsEntry.bulk_trusted(
+        (' '.join(rng.choices(_WORDS, k=rng.randint(1, 15))), i + 1, rng.randint(0, 2000), rng.randint(0, 5000), i + 1,
+         None, None, None)
+        for i in range(count))
+
+def bench_reference(size: int = BENCH_REFERENCE_SIZE) -> float:
+    """
+    Times the reference workload, building and sorting size tuples with a key function, in milliseconds. It exercises
+    the interpreter the way the other benchmarks do, so dividing by its time cancels out the speed of the machine.
+    """
+    rng = random.Random(BENCH_SEED)
+    values = [rng.randint(0, size) for _ in range(size)]
+    return _time(lambda: sorted([(value, -value) for value in values], key=lambda pair: pair[1]))
+
+def relative_to_reference(results: dict[str, float], reference: float) -> dict[str, float]:
+    """
+    Divides timings by the time of the reference workload measured in the same run.
+
+    Args:
+        results (dict[str, float]): Timings in milliseconds, keyed by benchmark name.
+        reference (float): The time of bench_reference in milliseconds.
+
+    Returns:
+        dict[str, float]: The timings as multiples of the reference time.
+    """
+    return {name: current / reference for name, current in results.items()}
+
+def bench_fetch(scraper: HackerNewsScraper) -> dict[str, float]:
+    """
+    Times fetch_hn_entries against the mock yCombinator html file, with requests.get mocked out.
+    """
+    mock_response = Mock(status_code=200, content=get_mocked_hn_html().encode('utf-8'))
+
+    def reset() -> None:
+        # Every timed call should fetch and parse, rather than hit the fetch delay or the parse cache
+        scraper.last_fetch_time = datetime.datetime.min
+        scraper._parse_cache.clear()
+
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        return {'fetch_hn_entries': _time(lambda: scraper.fetch_hn_entries(MOCK_HTML_HN_ENTRIES_NUM), reset)}
+
+def _import_times(module: str) -> dict[str, float]:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=BENCH_REPO_ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1]) / 1000
+    return times
+
+def bench_imports() -> dict[str, float]:
+    """
+    Times importing the command line and the scraper in a fresh interpreter with -X importtime, so that heavy imports
+    creeping back onto start-up show up as regressions. requests is left out of the scraper's time, since every fetch
+    needs it anyway.
+    """
+    results = {}
+    for module, excluded in BENCH_IMPORTS.items():
+        runs = [_import_times(module) for _ in range(BENCH_REPEAT)]
+        results[f'import {module}'] = min(times[module] - times.get(excluded, 0) for times in runs)
+    return results
+
+def bench_construction() -> dict[str, float]:
+    """
+    Times building BENCH_CONSTRUCTION_COUNT entries with validation, one by one without it, and in bulk without it.
+    """
+    rows = [(entry.title, entry.order_num, entry.comment_count, entry.points, entry.item_id, entry.url, entry.author,
+             entry.posted_at) for entry in synthetic_entries(BENCH_CONSTRUCTION_COUNT)]
+    key = f'[{BENCH_CONSTRUCTION_COUNT}]'
+    trusted = HackerNewsEntry.trusted
+    return {
+        'HackerNewsEntry' + key: _time(lambda: [HackerNewsEntry(*row) for row in rows]),
+        'HackerNewsEntry.trusted' + key: _time(lambda: [trusted(*row) for row in rows]),
+        'HackerNewsEntry.bulk_trusted' + key: _time(lambda: HackerNewsEntry.bulk_trusted(rows)),
+    }
+
+def bench_filters(scraper: HackerNewsScraper, sizes=BENCH_SIZES) -> dict[str, float]:
+    """
+    Times the filter and sort methods of the scraper at each size.
+    """
+    results = {}
+    for size in sizes:
+        entries = synthetic_entries(size)
+
+        def reset() -> None:
+            scraper.entries = entries
+
+        benchmarks = {
+            'filter_by_min_title_length': lambda: scraper.filter_by_min_title_length(5),
+            'filter_by_max_title_length': lambda: scraper.filter_by_max_title_length(5),
+            'sort_by_comments': scraper.sort_by_comments,
+            'sort_by_points': scraper.sort_by_points,
+        }
+        for name, fn in benchmarks.items():
+            results[f'{name}[{size}]'] = _time(fn, reset)
+    return results
+
+def run_benchmarks(sizes=BENCH_SIZES) -> dict[str, float]:
+    """
+    Runs every benchmark.
+
+    Returns:
+        dict[str, float]: The best time per call in milliseconds, keyed by benchmark name.
+    """
+    HackerNewsScraper._instance = None
+    scraper = HackerNewsScraper(fetch=False)
+    try:
+        results = {}
+        results.update(bench_imports())
+        results.update(bench_fetch(scraper))
+        results.update(bench_construction())
+        results.update(bench_filters(scraper, sizes))
+        return results
+    finally:
+        HackerNewsScraper._instance = None
+
+def find_regressions(results: dict[str, float], baseline: dict[str, float],
+                     tolerance: float = BENCH_REGRESSION_TOLERANCE) -> dict[str, tuple[float, float]]:
+    """
+    Compares results against a baseline. Both should be in the same unit, such as multiples of the reference time.
+
+    Args:
+        results (dict[str, float]): Timings keyed by benchmark name.
+        baseline (dict[str, float]): Baseline timings. Benchmarks missing from either side are skipped.
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        dict[str, tuple[float, float]]: (baseline, current) timings of every benchmark slower than allowed.
+    """
+    return {name: (baseline[name], current) for name, current in results.items()
+            if name in baseline and current > baseline[name] * (1 + tolerance)}
+
+def find_inversions(results: dict[str, float],
+                    expected_faster: dict[str, str] = BENCH_EXPECTED_FASTER) -> dict[str, tuple[float, float]]:
+    """
+    Checks that benchmarks expected to beat another one do.
+
+    Args:
+        results (dict[str, float]): Timings keyed by benchmark name.
+        expected_faster (dict[str, str]): Names of benchmarks, each mapped to the benchmark it should be faster than.
+            Pairs missing from results are skipped.
+
+    Returns:
+        dict[str, tuple[float, float]]: (own, other) timings of every benchmark that was not faster than its pair.
+    """
+    return {name: (results[name], results[other]) for name, other in expected_faster.items()
+            if name in results and other in results and results[name] >= results[other]}
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parse, construct, filter and sort hot paths.")
+    parser.add_argument('--baseline', type=Path, default=BENCH_BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=BENCH_REGRESSION_TOLERANCE,
+                        help="allowed relative slowdown before a benchmark counts as a regression")
+    parser.add_argument('--sizes', type=int, nargs='+', default=BENCH_SIZES, help="entry counts for filters and sorts")
+    args = parser.parse_args(argv)
+
+    reference = bench_reference()
+    results = run_benchmarks(args.sizes)
+    ratios = relative_to_reference(results, reference)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print(f"{'reference':<45} {reference:12.4f} ms")
+    for name, current in results.items():
+        change = f"({ratios[name] / baseline[name] - 1:+.0%} against the baseline)" if name in baseline else ""
+        print(f"{name:<45} {current:12.4f} ms  {ratios[name]:12.6f} x reference  {change}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(ratios, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    regressions = find_regressions(ratios, baseline, args.tolerance)
+    for name, (before, after) in regressions.items():
+        print(f"REGRESSION {name}: {before:.6f} x reference -> {after:.6f} x reference")
+    inversions = find_inversions(results)
+    for name, (own, other) in inversions.items():
+        print(f"SLOWER {name}: {own:.4f} ms, not faster than {BENCH_EXPECTED_FASTER[name]} at {other:.4f} ms")
+    return 1 if regressions or inversions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,24 @@ HN_HTTP_REQUEST_HEADER = {
 # URL for the YCombinator news page
 HN_URL = "https://news.ycombinator.com/news"
 
+# URLs for each of the YCombinator listing feeds
+HN_FEED_URLS = {
+    'news': HN_URL,
+    'newest': "https://news.ycombinator.com/newest",
+    'ask': "https://news.ycombinator.com/ask",
+    'show': "https://news.ycombinator.com/show",
+    'best': "https://news.ycombinator.com/best",
+    }
+
 # Delay between fetch requests in seconds
 HN_FETCH_DELAY = 30
 
+# Minimum delay between two requests to the same host from any scraper in the process in seconds
+HN_HOST_REQUEST_DELAY = 1
+
+# Maximum number of scheduled fetches run at the same time
+FETCH_SCHEDULER_MAX_WORKERS = 4
+
 # HTML tag and class where each entry begins
 HN_ENTRY_START_TAG = 'tr'
 HN_ENTRY_START_CLASS = 'athing'
@@ -26,14 +41,156 @@ HN_ORDER_NUM_CLASS = 'rank'
 # HTML tag where the comment_count can be found
 HN_COMMENT_COUNT_TAG = 'a'
 
+# HTML tag where the subtext (points, comment_count) of an entry can be found, in the row after the entry start
+HN_SUBTEXT_TAG = 'td'
+# HTML class where the subtext can be found within the tag
+HN_SUBTEXT_CLASS = 'subtext'
+
 # HTML tag where the points can be found
 HN_POINTS_TAG = 'span'
 # HTML class where the points can be found within the tag
 HN_POINTS_CLASS = 'score'
 
+# HTML tag where the submission time can be found, in its 'title' attribute
+HN_AGE_TAG = 'span'
+# HTML class where the submission time can be found within the tag
+HN_AGE_CLASS = 'age'
+
+# HTML tag and class of a user link, such as the author of an entry or a comment
+HN_USER_TAG = 'a'
+HN_USER_CLASS = 'hnuser'
+
+# Base URL that relative story links, such as those of Ask HN posts, are resolved against
+HN_BASE_URL = "https://news.ycombinator.com/"
+
+# Parser backend used to extract entries from the HTML content ('stream', 'html.parser' or 'lxml'). lxml builds the
+# document tree in C and parses a listing page about three times faster than the pure Python streaming extractor
+HN_PARSER_BACKEND = 'lxml'
+
+# Parser backend used instead of the default one when lxml cannot be imported. HackerNewsScraper.iter_entries uses
+# the streaming extractor whatever the configured backend, since it yields entries before the whole page is read
+HN_PARSER_FALLBACK_BACKEND = 'stream'
+
+# Size in characters of the chunks fed to the streaming parser
+HN_STREAM_CHUNK_SIZE = 16 * 1024
+
+# Number of documents sent to a worker process at a time during bulk archive ingestion
+BULK_INGEST_CHUNK_SIZE = 8
+
 # Maximum umber of entries to fetch from Hacker News
 HN_MAX_ENTRIES = 30
 
+# Number of entries listed on each Hacker News page
+HN_PAGE_SIZE = 30
+
+# Query parameter used by Hacker News for pagination
+HN_PAGE_PARAM = 'p'
+
+# Maximum number of pages fetched concurrently during a crawl
+HN_CRAWL_MAX_WORKERS = 4
+
+# Minimum delay between the start of two page requests during a crawl in seconds
+HN_CRAWL_PAGE_DELAY = 1
+
+# URL of Hacker News item (discussion) pages, and the query parameter holding the item id
+HN_ITEM_URL = "https://news.ycombinator.com/item"
+HN_ITEM_PARAM = 'id'
+
+# HTML tag and class of a comment row on an item page
+HN_COMMENT_ROW_TAG = 'tr'
+HN_COMMENT_ROW_CLASS = 'comtr'
+
+# HTML tag and class of the cell holding the nesting depth of a comment, in its 'indent' attribute
+HN_COMMENT_INDENT_TAG = 'td'
+HN_COMMENT_INDENT_CLASS = 'ind'
+
+# Width in pixels of one nesting level, used when a comment has no 'indent' attribute
+HN_COMMENT_INDENT_WIDTH = 40
+
+# HTML class of the element holding a comment body
+HN_COMMENT_TEXT_CLASS = 'commtext'
+
+# HTML class of the link to the next page of a comment thread too long for one item page
+HN_MORE_LINK_CLASS = 'morelink'
+
+# Maximum number of pages of one comment thread fetched by the comment crawler
+HN_COMMENT_MAX_PAGES = 10
+
+# Maximum number of item pages fetched concurrently by the comment crawler
+HN_COMMENT_CRAWL_MAX_WORKERS = 4
+
+# Seconds to wait for a connection to be established, and for each read from the server, before giving up
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 10
+
+# Number of attempts made for a request that fails with a transient error, including the first one
+FETCH_RETRY_MAX_ATTEMPTS = 3
+
+# Upper bounds in seconds of the jittered wait before the first retry, and of any wait between retries
+FETCH_RETRY_BASE_DELAY = 0.5
+FETCH_RETRY_MAX_DELAY = 8
+
+# HTTP status codes of responses worth retrying
+FETCH_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Number of consecutive transient failures after which requests to a host fail fast
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+
+# Seconds requests to a host fail fast before a trial request is let through
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+
+# Maximum number of keep-alive connections kept in the shared HTTP connection pool
+HTTP_POOL_MAX_CONNECTIONS = 10
+
+# Maximum number of concurrent requests to the same host from the shared HTTP connection pool
+HTTP_POOL_MAX_CONNECTIONS_PER_HOST = 4
+
+# Maximum number of responses kept in memory by the HTTP cache
+HTTP_CACHE_MAX_MEMORY_ENTRIES = 64
+
+# Maximum number of responses kept on disk by the HTTP cache
+HTTP_CACHE_MAX_DISK_ENTRIES = 256
+
+# Number of parsed pages remembered by a scraper, keyed by content hash, to skip re-parsing identical bodies
+HN_PARSE_CACHE_MAX_ENTRIES = 8
+
+# Gravity of the Hacker News ranking formula: how quickly scores decay with age
+RANKING_GRAVITY = 1.8
+
+# Hours added to the age of an entry by the gravity ranking formula
+RANKING_GRAVITY_AGE_OFFSET_HOURS = 2
+
+# Shortest and longest time between two polls of the watcher in seconds, and the time between its first two polls
+WATCH_MIN_INTERVAL = 30
+WATCH_MAX_INTERVAL = 15 * 60
+WATCH_INITIAL_INTERVAL = 60
+
+# Share of the front page that must have been added, moved or dropped for the watcher to poll sooner
+WATCH_HIGH_CHANGE_RATIO = 0.2
+
+# Share of the front page at or below which the watcher polls less often
+WATCH_LOW_CHANGE_RATIO = 0.05
+
+# Factors the watcher divides its interval by after a busy poll and multiplies it by after a quiet one
+WATCH_SPEEDUP_FACTOR = 2
+WATCH_SLOWDOWN_FACTOR = 1.5
+
+# Factors the watcher multiplies its interval by after a failed poll, and after a throttled one
+WATCH_ERROR_BACKOFF_FACTOR = 2
+WATCH_THROTTLE_BACKOFF_FACTOR = 4
+
+# HTTP status codes that mean the server is asking clients to slow down
+WATCH_THROTTLE_STATUS_CODES = (429, 503)
+
+# Default SQLite database file of the entry store
+ENTRY_STORE_PATH = 'entries.db'
+
+# Whether the scraper records metrics from the start of the process (see src.utils.metrics.enable_metrics)
+METRICS_ENABLED = False
+
+# Default upper bounds of histogram buckets, in seconds
+METRICS_HISTOGRAM_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
 # Log file name
 LOG_FILE_NAME = 'log.log'
 
@@ -41,4 +198,16 @@ LOG_FILE_NAME = 'log.log'
 LOG_FILE_MAX_BYTES = 5 * 1024 * 1024  # 5MB
 
 # Maximum number of log files
-LOG_FILE_MAX_NUM = 3
\ No newline at end of file
+LOG_FILE_MAX_NUM = 3
+
+# Maximum number of log records written between two flushes in queue logging mode
+LOG_QUEUE_BATCH_SIZE = 64
+
+# Window in seconds over which repeated log messages are deduplicated in queue logging mode
+LOG_DEDUP_INTERVAL = 10
+
+# Number of log records with the same message template let through per deduplication window
+LOG_DEDUP_BURST = 5
+
+# Maximum number of message templates tracked by the log deduplication filter
+LOG_DEDUP_MAX_KEYS = 1024
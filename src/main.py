@@ -1,20 +1,176 @@
-from src.models.hn_scraper import HackerNewsScraper
-
-def main():
-    scraper = HackerNewsScraper(30)
-    if not scraper.fetch_error:
-        original_entries = scraper.entries
-        scraper.filter_by_min_title_length(5)
-        scraper.sort_by_comments()
-        print("\nTitles Longer than 5 Words Sorted by Comments\n")
-        for hn_entry in scraper.entries:
-            print(hn_entry)
-        scraper.entries = original_entries
-        scraper.filter_by_max_title_length(5)
-        scraper.sort_by_points()
-        print("\nTitles Shorter than or Equal to 5 Words Sorted by Points\n")
-        for hn_entry in scraper.entries:
-            print(hn_entry)
+import argparse
+import sys
+from src.constants import (HN_FEED_URLS, HN_PAGE_SIZE, HN_PARSER_BACKEND, WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL,
+                           WATCH_INITIAL_INTERVAL)
+
+# Only argparse and the constants are imported up front: the scraper, and with it requests and the parsers, is
+# imported once the arguments are valid, so --help and usage errors return without loading the HTTP stack.
+
+# Output formats of the command line
+OUTPUT_FORMATS = ('text', 'json', 'csv')
+
+# Parser backends that can be chosen on the command line (see src.models.hn_parser.PARSER_BACKENDS)
+PARSER_CHOICES = ('stream', 'html.parser', 'lxml')
+
+# Entry attributes written by the json and csv output formats, in column order
+OUTPUT_FIELDS = ('order_num', 'title', 'points', 'comment_count', 'item_id', 'url', 'author', 'posted_at')
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Builds the parser of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog='python -m src.main',
+                                     description="Scrape a Hacker News listing, then filter and sort its entries.")
+    parser.add_argument('--feed', choices=tuple(HN_FEED_URLS), default='news', help="listing to scrape")
+    parser.add_argument('--pages', type=_positive_int, default=1,
+                        help=f"number of listing pages to fetch, {HN_PAGE_SIZE} entries each")
+    parser.add_argument('--min-words', type=int, help="keep titles with more than this many words")
+    parser.add_argument('--max-words', type=int, help="keep titles with at most this many words")
+    parser.add_argument('--sort', help="sort by a field (comments, points, order_num, word_count) or a score "
+                                       "formula (gravity, points_per_comment), highest first")
+    parser.add_argument('--ascending', action='store_true', help="sort lowest first")
+    parser.add_argument('--limit', type=_positive_int, help="print at most this many entries")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text', help="output format")
+    parser.add_argument('--parser', choices=PARSER_CHOICES, default=HN_PARSER_BACKEND, help="HTML parser backend")
+    watch = parser.add_argument_group('watch mode', "Poll the first listing page on an adaptive schedule until "
+                                                    "interrupted, printing a summary of every poll.")
+    watch.add_argument('--watch', action='store_true', help="keep polling instead of scraping once")
+    watch.add_argument('--interval', type=_positive_float,
+                       help=f"seconds between the first two polls, {WATCH_INITIAL_INTERVAL} by default or the nearest "
+                            f"bound if that is outside the minimum and maximum")
+    watch.add_argument('--min-interval', type=_positive_float, default=WATCH_MIN_INTERVAL,
+                       help="shortest time between two polls in seconds")
+    watch.add_argument('--max-interval', type=_positive_float, default=WATCH_MAX_INTERVAL,
+                       help="longest time between two polls in seconds")
+    watch.add_argument('--store', metavar='PATH', help="also record every poll as a snapshot in this SQLite database")
+    watch.add_argument('--cycles', type=_positive_int, help="stop after this many polls")
+    return parser
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a number greater than 0, got {value}")
+    return number
+
+def _positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"expected a number greater than 0, got {value}")
+    return number
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the command line.
+
+    Without filter, sort or limit options and with the text format, prints the long titles sorted by comments and
+    the short titles sorted by points, as earlier versions did.
+
+    Args:
+        argv (list[str] | None): The arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status: 0 on success, 1 if the listing could not be fetched.
+    """
+    arg_parser = build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.watch:
+        if args.pages > 1 or args.format != 'text' or \
+                any(option is not None for option in (args.min_words, args.max_words, args.sort, args.limit)):
+            arg_parser.error("--watch cannot be combined with --pages, --format or the filter, sort and limit options")
+    elif args.store is not None or args.cycles is not None:
+        arg_parser.error("--store and --cycles require --watch")
+
+    from src.models.hn_scraper import HackerNewsFeedScraper
+
+    scraper = HackerNewsFeedScraper(args.feed, parser=args.parser, fetch=False)
+    if args.watch:
+        return _watch(scraper, args, arg_parser)
+    max_entries = args.pages * HN_PAGE_SIZE
+    if args.pages > 1:
+        scraper.crawl_hn_entries(max_entries)
+    else:
+        scraper.fetch_hn_entries(max_entries)
+    if scraper.fetch_error:
+        print(f"Failed to fetch the '{args.feed}' listing.", file=sys.stderr)
+        return 1
+
+    query_options = (args.min_words, args.max_words, args.sort, args.limit)
+    if args.format == 'text' and all(option is None for option in query_options):
+        _print_report(scraper)
+        return 0
+
+    query = scraper.query()
+    try:
+        if args.min_words is not None:
+            query = query.min_words(args.min_words)
+        if args.max_words is not None:
+            query = query.max_words(args.max_words)
+        if args.sort is not None:
+            query = query.rank_by(args.sort, descending=not args.ascending)
+    except (TypeError, ValueError) as e:
+        arg_parser.error(str(e))
+    if args.limit is not None:
+        query = query.limit(args.limit)
+    _write_entries(query.execute(), args.format, sys.stdout)
+    return 0
+
+def _watch(scraper, args: argparse.Namespace, arg_parser: argparse.ArgumentParser) -> int:
+    """
+    Runs a HackerNewsWatcher on the scraper until SIGINT or until --cycles polls have run.
+
+    SIGINT stops the watcher instead of raising KeyboardInterrupt, so the current poll and its sinks finish and the
+    store is closed before returning.
+    """
+    import signal
+    from src.models.hn_watcher import HackerNewsWatcher, EntryStoreSink, print_sink
+    sinks = [print_sink]
+    store = None
+    if args.store is not None:
+        from src.models.entry_store import EntryStore
+        store = EntryStore(args.store)
+        sinks.append(EntryStoreSink(store, scraper.url))
+    interval = args.interval
+    if interval is None:
+        interval = min(max(WATCH_INITIAL_INTERVAL, args.min_interval), args.max_interval)
+    try:
+        try:
+            watcher = HackerNewsWatcher(scraper, sinks, HN_PAGE_SIZE, min_interval=args.min_interval,
+                                        max_interval=args.max_interval, initial_interval=interval)
+        except ValueError as e:
+            arg_parser.error(str(e))
+        previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: watcher.stop())
+        try:
+            watcher.run(args.cycles)
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+    finally:
+        if store is not None:
+            store.close()
+    return 0
+
+def _print_report(scraper) -> None:
+    print("\nTitles Longer than 5 Words Sorted by Comments\n")
+    for hn_entry in scraper.query().min_words(5).sort_by('comments'):
+        print(hn_entry)
+    print("\nTitles Shorter than or Equal to 5 Words Sorted by Points\n")
+    for hn_entry in scraper.query().max_words(5).sort_by('points'):
+        print(hn_entry)
+
+def _write_entries(entries: list, output_format: str, stream) -> None:
+    if output_format == 'text':
+        for entry in entries:
+            print(entry, file=stream)
+        return
+    rows = [{field: getattr(entry, field) for field in OUTPUT_FIELDS} for entry in entries]
+    if output_format == 'json':
+        import json
+        json.dump(rows, stream, ensure_ascii=False, indent=2)
+        stream.write('\n')
+    else:
+        import csv
+        writer = csv.DictWriter(stream, fieldnames=OUTPUT_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
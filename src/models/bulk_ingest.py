@@ -0,0 +1,139 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+from src.constants import HN_MAX_ENTRIES, HN_PARSER_BACKEND, BULK_INGEST_CHUNK_SIZE
+from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_parser import HackerNewsParser, get_parser
+
+# Value stored in the item_ids column of an EntryBatch for entries without an item id
+MISSING_ITEM_ID = -1
+
+# Value stored in the posted_ats column of an EntryBatch for entries without a submission time
+MISSING_POSTED_AT = -1
+
+class EntryBatch:
+    """
+    Compact, picklable batch of the entries parsed from one HTML document.
+
+    Fields are stored column by column, with numeric fields in typed arrays, so a batch pickles to a fraction of the
+    size of the equivalent list of HackerNewsEntry objects.
+    """
+    __slots__ = ('source', 'titles', 'order_nums', 'comment_counts', 'points', 'item_ids', 'urls', 'authors',
+                 'posted_ats')
+
+    def __init__(self, source: str, entries: list[HackerNewsEntry]):
+        """
+        Args:
+            source (str): Name of the document the entries were parsed from.
+            entries (list[HackerNewsEntry]): The parsed entries.
+        """
+        self.source = source
+        self.titles = [entry.title for entry in entries]
+        self.order_nums = array('q', [entry.order_num for entry in entries])
+        self.comment_counts = array('q', [entry.comment_count for entry in entries])
+        self.points = array('q', [entry.points for entry in entries])
+        self.item_ids = array('q', [MISSING_ITEM_ID if entry.item_id is None else entry.item_id for entry in entries])
+        self.urls = [entry.url for entry in entries]
+        self.authors = [entry.author for entry in entries]
+        self.posted_ats = array('q', [MISSING_POSTED_AT if entry.posted_at is None else entry.posted_at for entry in entries])
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __repr__(self):
+        return f"<EntryBatch(source='{self.source}', entries={len(self)})>"
+
+    def to_entries(self) -> list[HackerNewsEntry]:
+        """
+        Rebuilds the HackerNewsEntry objects of the batch. The values were validated when the document was parsed.
+
+        Returns:
+            list[HackerNewsEntry]: The entries in page order.
+        """
+        item_ids = [None if item_id == MISSING_ITEM_ID else item_id for item_id in self.item_ids]
+        posted_ats = [None if posted_at == MISSING_POSTED_AT else posted_at for posted_at in self.posted_ats]
+        return HackerNewsEntry.bulk_trusted(zip(self.titles, self.order_nums, self.comment_counts, self.points, item_ids,
+                                                self.urls, self.authors, posted_ats))
+
+# Parser backend of the current worker process, created once per process rather than once per document
+_worker_parser: HackerNewsParser | None = None
+
+def _init_worker(parser: str) -> None:
+    global _worker_parser
+    _worker_parser = get_parser(parser)
+
+def _parse_document(document: tuple[str, Path | bytes | str], max_entries: int) -> EntryBatch:
+    source, content = document
+    if isinstance(content, Path):
+        content = content.read_bytes()
+    return EntryBatch(source, _worker_parser.parse(content, max_entries))
+
+def _parse_documents(documents: list[tuple[str, Path | bytes | str]], max_entries: int) -> list[EntryBatch]:
+    return [_parse_document(document, max_entries) for document in documents]
+
+def _iter_documents(source: str | Path | Iterable[bytes | str]) -> Iterator[tuple[str, Path | bytes | str]]:
+    if isinstance(source, (str, Path)):
+        # Workers read the files themselves, so only paths cross the process boundary
+        for path in sorted(Path(source).glob('*.htm*')):
+            yield path.name, path
+    else:
+        for i, content in enumerate(source):
+            yield str(i), content
+
+def ingest_archive(source: str | Path | Iterable[bytes | str], max_entries: int = HN_MAX_ENTRIES,
+                   parser: str = HN_PARSER_BACKEND, max_workers: int | None = None,
+                   chunk_size: int = BULK_INGEST_CHUNK_SIZE) -> Iterator[EntryBatch]:
+    """
+    Parses saved Hacker News listing pages across a pool of processes.
+
+    Each document goes through the same parser backends HackerNewsScraper uses, in a separate worker process, and
+    comes back as an EntryBatch. Documents are read from source only as workers become free, so at most
+    max_workers * chunk_size documents are held in memory at a time, however large the archive. The arguments are
+    checked when ingest_archive is called, before any document is read.
+
+    Args:
+        source (str | Path | Iterable[bytes | str]): A directory of .html/.htm files, parsed in file name order,
+            or an iterable of HTML documents, whose batches are named after their position.
+        max_entries (int): The maximum number of entries to parse from each document.
+        parser (str): The parser backend used by the workers.
+        max_workers (int | None): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int): The number of documents sent to a worker at a time.
+
+    Returns:
+        Iterator[EntryBatch]: One batch per document, in source order.
+
+    Raises:
+        ValueError: If parser is not a known backend, or chunk_size is less than 1.
+        NotADirectoryError: If source is a path that is not a directory.
+    """
+    # Fail early, in this process, on unknown or unavailable backends
+    get_parser(parser)
+    if isinstance(source, (str, Path)) and not Path(source).is_dir():
+        raise NotADirectoryError(f"Expected '{source}' to be a directory.")
+    if chunk_size < 1:
+        raise ValueError("Expected 'chunk_size' to be at least 1.")
+
+    return _ingest(_iter_documents(source), max_entries, parser, max_workers or os.cpu_count() or 1, chunk_size)
+
+def _ingest(documents: Iterator[tuple[str, Path | bytes | str]], max_entries: int, parser: str, max_workers: int,
+            chunk_size: int) -> Iterator[EntryBatch]:
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(parser,)) as executor:
+        try:
+            while True:
+                # Wait for the oldest chunk before reading more, so one chunk per worker is in flight at most
+                if len(pending) >= max_workers:
+                    yield from pending.popleft().result()
+                chunk = list(islice(documents, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_parse_documents, chunk, max_entries))
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
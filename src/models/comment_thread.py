@@ -0,0 +1,313 @@
+import functools
+import requests
+import sys
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Iterable
+from urllib.parse import parse_qs, urlsplit
+from requests.exceptions import RequestException
+from src.constants import (HN_HTTP_REQUEST_HEADER, HN_ITEM_URL, HN_ITEM_PARAM, HN_PAGE_PARAM, HN_COMMENT_ROW_TAG,
+                           HN_COMMENT_ROW_CLASS, HN_COMMENT_INDENT_TAG, HN_COMMENT_INDENT_CLASS,
+                           HN_COMMENT_INDENT_WIDTH, HN_COMMENT_TEXT_CLASS, HN_USER_TAG, HN_USER_CLASS,
+                           HN_MORE_LINK_CLASS, HN_COMMENT_MAX_PAGES, HN_COMMENT_CRAWL_MAX_WORKERS)
+from src.models.hn_entry import HackerNewsEntry
+from src.utils.html_utils import decode_content, has_class, parse_int, parse_item_id
+from src.utils.http_cache import HttpCache
+from src.utils.log_config import setup_logger
+from src.utils.rate_limiter import HostRateLimiter, get_host_rate_limiter
+from src.utils.resilience import FetchPolicy, get_fetch_policy
+
+logger = setup_logger(__name__)
+
+# Value stored in the parents column of a CommentThread for top-level comments
+NO_PARENT = -1
+
+class CommentThread:
+    """
+    Comment tree of one Hacker News item, stored as parallel columns in page order.
+
+    Instead of nested objects, each comment records the position of its parent in the columns, or NO_PARENT for
+    top-level comments. Since the page lists comments depth first, a comment always comes after its parent. Long
+    threads span several pages, which are appended in order; truncated is set when pages were left unfetched.
+    """
+    __slots__ = ('item_id', 'comment_ids', 'parents', 'depths', 'authors', 'bodies', 'truncated', '_ancestors')
+
+    def __init__(self, item_id: int):
+        """
+        Args:
+            item_id (int): The id of the story the comments belong to.
+        """
+        self.item_id = item_id
+        self.comment_ids = array('q')
+        self.parents = array('q')
+        self.depths = array('H')
+        # Author names are interned, since the same users reply many times in a thread
+        self.authors: list[str | None] = []
+        self.bodies: list[str] = []
+        self.truncated = False
+        # Position of the last comment seen at each depth, down to the one most recently appended
+        self._ancestors: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.comment_ids)
+
+    def __repr__(self):
+        return f"<CommentThread(item_id={self.item_id}, comments={len(self)})>"
+
+    def append(self, comment_id: int, depth: int, author: str | None, body: str) -> int:
+        """
+        Appends a comment after every comment already in the thread.
+
+        Args:
+            comment_id (int): The item id of the comment.
+            depth (int): The nesting depth, 0 for a top-level comment.
+            author (str | None): The user name, or None for deleted or flagged comments.
+            body (str): The comment text, with paragraphs separated by blank lines.
+
+        Returns:
+            int: The position of the comment.
+        """
+        position = len(self.comment_ids)
+        # The parent is the closest preceding comment at a lower depth
+        del self._ancestors[depth:]
+        parent = self._ancestors[-1] if self._ancestors else NO_PARENT
+        self._ancestors.append(position)
+        self.comment_ids.append(comment_id)
+        self.parents.append(parent)
+        self.depths.append(depth)
+        self.authors.append(sys.intern(author) if author is not None else None)
+        self.bodies.append(body)
+        return position
+
+    def roots(self) -> list[int]:
+        """
+        Returns the positions of the top-level comments.
+        """
+        return [position for position, parent in enumerate(self.parents) if parent == NO_PARENT]
+
+    def children(self, position: int) -> list[int]:
+        """
+        Returns the positions of the direct replies to the comment at position.
+        """
+        return [child for child in range(position + 1, len(self.parents)) if self.parents[child] == position]
+
+class CommentTreeExtractor(HTMLParser):
+    """
+    Single-pass extractor of the comment rows of an item page.
+
+    Like StreamingEntryExtractor, it keeps only the state of the comment currently being read. The nesting depth of
+    a comment is taken from the 'indent' attribute of its indentation cell, or from the width of the spacer image in
+    it on older pages. The number of the next page of the thread is read from its 'More' link, if there is one.
+    """
+    def __init__(self, item_id: int, thread: CommentThread | None = None):
+        super().__init__(convert_charrefs=True)
+        self.thread = thread or CommentThread(item_id)
+        self.next_page: int | None = None
+        self._pending: dict | None = None
+        self._in_indent = False
+        self._capture: str | None = None
+        self._text: list[str] = []
+
+    def close(self) -> None:
+        super().close()
+        self._finish_comment()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a' and has_class(attrs, HN_MORE_LINK_CLASS):
+            page = parse_qs(urlsplit(dict(attrs).get('href') or '').query).get(HN_PAGE_PARAM)
+            self.next_page = parse_int(page[0]) if page else None
+            return
+        if tag == HN_COMMENT_ROW_TAG and has_class(attrs, HN_COMMENT_ROW_CLASS):
+            self._finish_comment()
+            self._pending = {'comment_id': parse_item_id(dict(attrs).get('id')), 'depth': 0, 'author': None,
+                             'body': ''}
+            return
+        if self._pending is None:
+            return
+        if self._capture == 'body':
+            if tag == 'div' and has_class(attrs, 'reply'):
+                self._end_capture()
+            elif tag == 'p':
+                self._text.append('\n\n')
+            return
+        if tag == HN_COMMENT_INDENT_TAG and has_class(attrs, HN_COMMENT_INDENT_CLASS):
+            indent = parse_int(dict(attrs).get('indent') or '')
+            self._in_indent = indent is None
+            self._pending['depth'] = indent or 0
+        elif tag == 'img' and self._in_indent:
+            width = parse_int(dict(attrs).get('width') or '')
+            self._pending['depth'] = (width or 0) // HN_COMMENT_INDENT_WIDTH
+            self._in_indent = False
+        elif tag == HN_USER_TAG and has_class(attrs, HN_USER_CLASS):
+            self._start_capture('author')
+        elif has_class(attrs, HN_COMMENT_TEXT_CLASS):
+            self._start_capture('body')
+
+    def handle_endtag(self, tag):
+        if self._pending is None:
+            return
+        if self._capture == 'author' and tag == HN_USER_TAG:
+            self._end_capture()
+        elif self._capture == 'body' and tag == 'td':
+            self._end_capture()
+        elif tag == HN_COMMENT_INDENT_TAG:
+            self._in_indent = False
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+
+    def _start_capture(self, field: str) -> None:
+        self._capture = field
+        self._text = []
+
+    def _end_capture(self) -> None:
+        self._pending[self._capture] = ''.join(self._text).strip()
+        self._capture = None
+        self._text = []
+
+    def _finish_comment(self) -> None:
+        if self._pending is None:
+            return
+        if self._capture is not None:
+            self._end_capture()
+        if self._pending['comment_id'] is not None:
+            self.thread.append(**self._pending)
+        self._pending = None
+        self._in_indent = False
+
+def parse_comment_thread(content: bytes | str, item_id: int) -> CommentThread:
+    """
+    Parses the comments of an item page. Comments on later pages of a long thread are not included, see
+    CommentCrawler.
+
+    Args:
+        content (bytes | str): The HTML content of the item page.
+        item_id (int): The id of the item.
+
+    Returns:
+        CommentThread: The comments, in page order.
+    """
+    return parse_comment_page(content, item_id)[0]
+
+def parse_comment_page(content: bytes | str, item_id: int,
+                       thread: CommentThread | None = None) -> tuple[CommentThread, int | None]:
+    """
+    Parses the comments of one page of an item's thread.
+
+    Args:
+        content (bytes | str): The HTML content of the page.
+        item_id (int): The id of the item.
+        thread (CommentThread | None): The thread of the previous pages, which the comments are appended to.
+
+    Returns:
+        tuple[CommentThread, int | None]: The thread, and the number of the next page or None on the last page.
+    """
+    extractor = CommentTreeExtractor(item_id, thread)
+    extractor.feed(decode_content(content))
+    extractor.close()
+    return extractor.thread, extractor.next_page
+
+class CommentCrawler:
+    """
+    Fetches and parses the item pages of many stories with a bounded pool of worker threads.
+
+    Every request waits for a slot from the per-host rate limiter, shared by default with HackerNewsFeedScraper, so
+    the crawl never exceeds the politeness budget no matter how many workers there are. The pages of a long thread
+    are followed through their 'More' links, up to max_pages pages per item.
+    """
+    def __init__(self, max_workers: int = HN_COMMENT_CRAWL_MAX_WORKERS, rate_limiter: HostRateLimiter | None = None,
+                 http_cache: HttpCache | None = None, url: str = HN_ITEM_URL, fetch_policy: FetchPolicy | None = None,
+                 max_pages: int = HN_COMMENT_MAX_PAGES):
+        """
+        Args:
+            max_workers (int): Maximum number of item pages fetched at the same time.
+            rate_limiter (HostRateLimiter | None): The per-host rate limiter. Defaults to the shared one.
+            http_cache (HttpCache | None): Cache used to revalidate item pages instead of downloading them again.
+            url (str): The item page URL.
+            fetch_policy (FetchPolicy | None): Timeouts, retries and circuit breakers. Defaults to the shared policy.
+            max_pages (int): Maximum number of pages fetched per item. Threads with more pages are returned
+                truncated, with a warning.
+
+        Raises:
+            ValueError: If max_workers or max_pages is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("Expected 'max_workers' to be greater than 0.")
+        if max_pages < 1:
+            raise ValueError("Expected 'max_pages' to be greater than 0.")
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or get_host_rate_limiter()
+        self.http_cache = http_cache
+        self.url = url
+        self.fetch_policy = fetch_policy or get_fetch_policy()
+        self.max_pages = max_pages
+
+    def crawl(self, items: Iterable[int | HackerNewsEntry]) -> dict[int, CommentThread]:
+        """
+        Fetches the comment threads of the given items. Each item is fetched at most once per call, even if it is
+        listed several times, and entries without an item id are skipped. Items whose first page cannot be fetched
+        are logged and left out of the result; if a later page cannot be fetched, the thread is returned truncated.
+
+        Args:
+            items (Iterable[int | HackerNewsEntry]): Item ids, or entries whose item_id is used.
+
+        Returns:
+            dict[int, CommentThread]: The comment threads by item id, in the order the items were first listed.
+        """
+        item_ids = []
+        for item in items:
+            item_id = item.item_id if isinstance(item, HackerNewsEntry) else item
+            if item_id is not None:
+                item_ids.append(item_id)
+        # dict.fromkeys drops duplicates while keeping the first occurrence of each id
+        item_ids = list(dict.fromkeys(item_ids))
+        if not item_ids:
+            return {}
+
+        threads = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(item_ids)),
+                                thread_name_prefix='comment-crawler') as executor:
+            for item_id, thread in zip(item_ids, executor.map(self._fetch_thread, item_ids)):
+                if thread is not None:
+                    threads[item_id] = thread
+        return threads
+
+    def _fetch_thread(self, item_id: int) -> CommentThread | None:
+        host = urlsplit(self.url).netloc
+        thread = None
+        page = 1
+        while True:
+            try:
+                content = self.fetch_policy.call(host, self._fetch_item_page, item_id, page)
+            except RequestException as e:
+                if thread is None:
+                    logger.error(f"Failed to fetch comments of item {item_id}. Request Error: {e}")
+                    return None
+                logger.warning(f"Failed to fetch page {page} of the comments of item {item_id}, returning the "
+                               f"first {len(thread)} comments. Request Error: {e}")
+                thread.truncated = True
+                return thread
+            thread, next_page = parse_comment_page(content, item_id, thread)
+            if next_page is None or next_page <= page:
+                return thread
+            if page >= self.max_pages:
+                logger.warning(f"Comments of item {item_id} span more than {self.max_pages} pages, returning the "
+                               f"first {len(thread)} comments.")
+                thread.truncated = True
+                return thread
+            page = next_page
+
+    def _fetch_item_page(self, item_id: int, page: int = 1) -> bytes:
+        params = {HN_ITEM_PARAM: item_id}
+        if page > 1:
+            params[HN_PAGE_PARAM] = page
+        time.sleep(self.rate_limiter.reserve(urlsplit(self.url).netloc))
+        if self.http_cache is not None:
+            return self.http_cache.get(functools.partial(requests.get, timeout=self.fetch_policy.timeout), self.url,
+                                       params=params, headers=HN_HTTP_REQUEST_HEADER)
+        response = requests.get(self.url, params=params, headers=HN_HTTP_REQUEST_HEADER, timeout=self.fetch_policy.timeout)
+        response.raise_for_status()
+        return response.content
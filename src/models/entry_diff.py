@@ -0,0 +1,71 @@
+from src.models.hn_entry import HackerNewsEntry
+
+class EntryChangeSet:
+    """
+    Changes between two snapshots of a listing, as produced by merge_entries.
+
+    Attributes:
+        added (list[HackerNewsEntry]): Entries that were not in the previous snapshot.
+        moved (list[HackerNewsEntry]): Entries whose order_num changed.
+        updated (list[HackerNewsEntry]): Entries whose title, points, comment_count, url, author or
+            posted_at changed.
+        dropped (list[HackerNewsEntry]): Entries of the previous snapshot that are no longer listed.
+
+    An entry can be both moved and updated.
+    """
+    __slots__ = ('added', 'moved', 'updated', 'dropped')
+
+    def __init__(self):
+        self.added: list[HackerNewsEntry] = []
+        self.moved: list[HackerNewsEntry] = []
+        self.updated: list[HackerNewsEntry] = []
+        self.dropped: list[HackerNewsEntry] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.moved or self.updated or self.dropped)
+
+    def __repr__(self):
+        return (f"<EntryChangeSet(added={len(self.added)}, moved={len(self.moved)}, "
+                f"updated={len(self.updated)}, dropped={len(self.dropped)})>")
+
+def merge_entries(current: list[HackerNewsEntry], fresh: list[HackerNewsEntry]) -> tuple[list[HackerNewsEntry], EntryChangeSet]:
+    """
+    Merges a freshly parsed snapshot into the current entries, keyed by item id.
+
+    Entries that are still listed keep their identity: their fields are updated in place, so references held by
+    consumers stay valid. Entries without an item id cannot be matched and are always reported as added or dropped.
+
+    Args:
+        current (list[HackerNewsEntry]): The current entries. Matching entries are modified in place.
+        fresh (list[HackerNewsEntry]): The newly parsed entries.
+
+    Returns:
+        tuple[list[HackerNewsEntry], EntryChangeSet]: The merged entries in the order of fresh, and the changes.
+    """
+    changes = EntryChangeSet()
+    by_id = {entry.item_id: entry for entry in current if entry.item_id is not None}
+    merged = []
+    seen_ids = set()
+    for entry in fresh:
+        existing = by_id.get(entry.item_id) if entry.item_id is not None else None
+        if existing is None or entry.item_id in seen_ids:
+            changes.added.append(entry)
+            merged.append(entry)
+            continue
+        seen_ids.add(entry.item_id)
+        if existing.order_num != entry.order_num:
+            existing.order_num = entry.order_num
+            changes.moved.append(existing)
+        if (existing.title != entry.title or existing.points != entry.points
+                or existing.comment_count != entry.comment_count or existing.url != entry.url
+                or existing.author != entry.author or existing.posted_at != entry.posted_at):
+            existing.title = entry.title
+            existing.points = entry.points
+            existing.comment_count = entry.comment_count
+            existing.url = entry.url
+            existing.author = entry.author
+            existing.posted_at = entry.posted_at
+            changes.updated.append(existing)
+        merged.append(existing)
+    changes.dropped = [entry for entry in current if entry.item_id is None or entry.item_id not in seen_ids]
+    return merged, changes
@@ -0,0 +1,283 @@
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+from src.models.bulk_ingest import MISSING_ITEM_ID, MISSING_POSTED_AT
+from src.models.hn_entry import HackerNewsEntry
+
+# File signatures of the two export formats. The last byte is the format version: version 2 added the url, author
+# and posted_at fields, and files of version 1 are rejected.
+COLUMNAR_MAGIC = b'HNCOL\x00\x00\x02'
+ROW_MAGIC = b'HNROW\x00\x00\x02'
+
+# Columnar header: magic, row count, then the size of the UTF-8 blob of each string column
+_COLUMNAR_HEADER = struct.Struct('<8sQQQQ')
+# Row record: order_num, comment_count, points, item_id, posted_at and the sizes of the title, url and author,
+# followed by the UTF-8 title, url and author
+_ROW_RECORD = struct.Struct('<qqqqqIII')
+
+# Integer columns of the columnar format, in file order
+_INT_COLUMNS = ('order_num', 'comment_count', 'points', 'item_id', 'posted_at')
+# String columns of the columnar format, in file order. Each has an offsets column of n + 1 values, written after
+# the integer columns, and a blob, written after the offsets. An empty url or author is read back as None.
+_STR_COLUMNS = ('title', 'url', 'author')
+
+# Both formats store integers little-endian; arrays are byte swapped on big-endian machines
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+def _to_le_bytes(values: array) -> bytes:
+    if not _NATIVE_LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _encode_optional(value: str | None) -> bytes:
+    return b'' if value is None else value.encode('utf-8')
+
+def _decode_optional(value: bytes | memoryview) -> str | None:
+    return str(value, 'utf-8') if value else None
+
+def write_columnar(entries: Iterable[HackerNewsEntry], path: str | Path) -> int:
+    """
+    Writes entries to a columnar binary file that ColumnarEntryFile can memory-map.
+
+    The file holds a fixed header, one little-endian int64 array per numeric field, one array of n + 1 offsets per
+    string field, and the UTF-8 encoded titles, urls and authors. Every array starts on an 8 byte boundary.
+
+    Args:
+        entries (Iterable[HackerNewsEntry]): The entries to write.
+        path (str | Path): The output file.
+
+    Returns:
+        int: The number of entries written.
+
+    Raises:
+        TypeError: If an item of entries is not a HackerNewsEntry.
+    """
+    columns = {name: array('q') for name in _INT_COLUMNS}
+    offsets = {name: array('q', [0]) for name in _STR_COLUMNS}
+    blobs = {name: bytearray() for name in _STR_COLUMNS}
+    for entry in entries:
+        if not isinstance(entry, HackerNewsEntry):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        columns['order_num'].append(entry.order_num)
+        columns['comment_count'].append(entry.comment_count)
+        columns['points'].append(entry.points)
+        columns['item_id'].append(MISSING_ITEM_ID if entry.item_id is None else entry.item_id)
+        columns['posted_at'].append(MISSING_POSTED_AT if entry.posted_at is None else entry.posted_at)
+        for name, value in (('title', entry.title.encode('utf-8')), ('url', _encode_optional(entry.url)),
+                            ('author', _encode_optional(entry.author))):
+            blobs[name] += value
+            offsets[name].append(len(blobs[name]))
+
+    count = len(columns['order_num'])
+    with open(path, 'wb') as file:
+        file.write(_COLUMNAR_HEADER.pack(COLUMNAR_MAGIC, count, *(len(blobs[name]) for name in _STR_COLUMNS)))
+        for name in _INT_COLUMNS:
+            file.write(_to_le_bytes(columns[name]))
+        for name in _STR_COLUMNS:
+            file.write(_to_le_bytes(offsets[name]))
+        for name in _STR_COLUMNS:
+            file.write(blobs[name])
+    return count
+
+class ColumnarEntryFile:
+    """
+    Memory-mapped reader for files written by write_columnar.
+
+    Numeric columns are exposed as memoryviews over the mapping, so reading a column copies nothing, and entries are
+    only built when they are indexed or iterated. Memoryviews returned by column() must be released before the file
+    is closed.
+    """
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path (str | Path): A file written by write_columnar.
+
+        Raises:
+            ValueError: If the file is not a columnar entry file.
+        """
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _COLUMNAR_HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"Expected '{path}' to be a columnar entry file.")
+        magic, count, *blob_sizes = _COLUMNAR_HEADER.unpack_from(self._mmap)
+        expected_size = (_COLUMNAR_HEADER.size + 8 * (len(_INT_COLUMNS) * count + len(_STR_COLUMNS) * (count + 1))
+                         + sum(blob_sizes))
+        if magic != COLUMNAR_MAGIC or len(self._mmap) != expected_size:
+            self._mmap.close()
+            raise ValueError(f"Expected '{path}' to be a columnar entry file.")
+        self._count = count
+        self._buffer = memoryview(self._mmap)
+        self._columns: dict[str, memoryview | array] = {}
+        position = _COLUMNAR_HEADER.size
+        columns = [(name, count) for name in _INT_COLUMNS] + [(f'{name}_offset', count + 1) for name in _STR_COLUMNS]
+        for name, length in columns:
+            self._columns[name] = self._int_column(position, length)
+            position += 8 * length
+        self._blobs: dict[str, memoryview] = {}
+        for name, size in zip(_STR_COLUMNS, blob_sizes):
+            self._blobs[name] = self._buffer[position:position + size]
+            position += size
+
+    def _int_column(self, position: int, length: int) -> memoryview | array:
+        view = self._buffer[position:position + 8 * length]
+        if _NATIVE_LITTLE_ENDIAN:
+            return view.cast('q')
+        values = array('q', view.tobytes())
+        values.byteswap()
+        return values
+
+    def __enter__(self) -> 'ColumnarEntryFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> HackerNewsEntry:
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("ColumnarEntryFile index out of range")
+        columns = self._columns
+        title, url, author = (self._string(name, position) for name in _STR_COLUMNS)
+        item_id = columns['item_id'][position]
+        posted_at = columns['posted_at'][position]
+        return HackerNewsEntry.trusted(str(title, 'utf-8'), columns['order_num'][position],
+                                       columns['comment_count'][position], columns['points'][position],
+                                       None if item_id == MISSING_ITEM_ID else item_id, _decode_optional(url),
+                                       _decode_optional(author), None if posted_at == MISSING_POSTED_AT else posted_at)
+
+    def _string(self, name: str, position: int) -> memoryview:
+        offsets = self._columns[f'{name}_offset']
+        return self._blobs[name][offsets[position]:offsets[position + 1]]
+
+    def __iter__(self) -> Iterator[HackerNewsEntry]:
+        for position in range(self._count):
+            yield self[position]
+
+    def column(self, name: str) -> memoryview | array:
+        """
+        Returns a numeric column without copying it.
+
+        Args:
+            name (str): One of 'order_num', 'comment_count', 'points', 'item_id' or 'posted_at'. Missing item ids
+                and submission times are -1.
+
+        Returns:
+            memoryview | array: The column values as int64, in file order.
+
+        Raises:
+            ValueError: If there is no numeric column with that name.
+        """
+        if name not in _INT_COLUMNS:
+            raise ValueError(f"Unknown column '{name}'.")
+        return self._columns[name]
+
+    def close(self) -> None:
+        """
+        Releases the views held by the reader and unmaps the file.
+        """
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        for blob in self._blobs.values():
+            blob.release()
+        self._buffer.release()
+        self._mmap.close()
+
+def write_rows(entries: Iterable[HackerNewsEntry], stream: BinaryIO) -> int:
+    """
+    Writes entries to a binary stream in the compact row format, one record at a time.
+
+    Entries are consumed as they are written, so a generator such as HackerNewsScraper.iter_entries can be piped
+    straight to a file or socket.
+
+    Args:
+        entries (Iterable[HackerNewsEntry]): The entries to write.
+        stream (BinaryIO): The output stream.
+
+    Returns:
+        int: The number of entries written.
+
+    Raises:
+        TypeError: If an item of entries is not a HackerNewsEntry.
+    """
+    stream.write(ROW_MAGIC)
+    count = 0
+    pack = _ROW_RECORD.pack
+    for entry in entries:
+        if not isinstance(entry, HackerNewsEntry):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        title = entry.title.encode('utf-8')
+        url = _encode_optional(entry.url)
+        author = _encode_optional(entry.author)
+        item_id = MISSING_ITEM_ID if entry.item_id is None else entry.item_id
+        posted_at = MISSING_POSTED_AT if entry.posted_at is None else entry.posted_at
+        stream.write(pack(entry.order_num, entry.comment_count, entry.points, item_id, posted_at,
+                          len(title), len(url), len(author)))
+        stream.write(title + url + author)
+        count += 1
+    return count
+
+def read_rows(stream: BinaryIO) -> Iterator[HackerNewsEntry]:
+    """
+    Reads entries written by write_rows, one record at a time.
+
+    Args:
+        stream (BinaryIO): The input stream.
+
+    Yields:
+        HackerNewsEntry: The entries, in the order they were written.
+
+    Raises:
+        ValueError: If the stream is not in the row format or ends in the middle of a record.
+    """
+    if stream.read(len(ROW_MAGIC)) != ROW_MAGIC:
+        raise ValueError("Expected the stream to be in the entry row format.")
+    record_size = _ROW_RECORD.size
+    unpack = _ROW_RECORD.unpack
+    while header := stream.read(record_size):
+        if len(header) != record_size:
+            raise ValueError("Unexpected end of stream in the middle of an entry record.")
+        order_num, comment_count, points, item_id, posted_at, title_size, url_size, author_size = unpack(header)
+        strings = stream.read(title_size + url_size + author_size)
+        if len(strings) != title_size + url_size + author_size:
+            raise ValueError("Unexpected end of stream in the middle of an entry record.")
+        url_start = title_size
+        author_start = title_size + url_size
+        yield HackerNewsEntry.trusted(strings[:url_start].decode('utf-8'), order_num, comment_count, points,
+                                      None if item_id == MISSING_ITEM_ID else item_id,
+                                      _decode_optional(strings[url_start:author_start]),
+                                      _decode_optional(strings[author_start:]),
+                                      None if posted_at == MISSING_POSTED_AT else posted_at)
+
+def load_entries(path: str | Path) -> Iterator[HackerNewsEntry]:
+    """
+    Lazily loads the entries of a file in either export format, detected from its signature.
+
+    Args:
+        path (str | Path): A file written by write_columnar or write_rows.
+
+    Yields:
+        HackerNewsEntry: The entries, in file order.
+
+    Raises:
+        ValueError: If the file is in neither format.
+    """
+    with open(path, 'rb') as file:
+        magic = file.read(len(ROW_MAGIC))
+        if magic == ROW_MAGIC:
+            file.seek(0)
+            yield from read_rows(file)
+            return
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError(f"Expected '{path}' to be an entry export file.")
+    with ColumnarEntryFile(path) as columnar:
+        yield from columnar
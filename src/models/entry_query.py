@@ -0,0 +1,160 @@
+import heapq
+from itertools import islice
+from typing import Callable, Iterable
+from src.models.hn_entry import HackerNewsEntry
+from src.models.ranking import FIELD_KEYS, ScoreFunction, get_score_function
+
+class EntryQuery:
+    """
+    Lazy, composable query over a collection of HackerNewsEntry objects.
+
+    Every builder method returns a new EntryQuery and leaves both the original query and the source entries untouched,
+    so many queries can share one fetched dataset. Nothing runs until the query is executed: all filters are then
+    applied in a single pass, and when a limit is set together with a sort only the top entries are kept in a heap
+    instead of sorting the whole collection.
+
+    Example:
+        scraper.query().min_words(5).sort_by('comments').limit(10).execute()
+        scraper.query().rank_by('points_per_comment').limit(50).execute()
+    """
+    _sort_keys: dict[str, Callable[[HackerNewsEntry], int]] = FIELD_KEYS
+
+    def __init__(self, entries: Iterable[HackerNewsEntry]):
+        """
+        Args:
+            entries (Iterable[HackerNewsEntry]): The source entries. They are read, never modified.
+        """
+        self._entries = entries
+        self._min_words: int | None = None
+        self._max_words: int | None = None
+        self._predicates: tuple[Callable[[HackerNewsEntry], bool], ...] = ()
+        self._sort_key: Callable[[HackerNewsEntry], int] | None = None
+        self._descending = True
+        self._limit: int | None = None
+
+    def _derive(self, **changes) -> 'EntryQuery':
+        query = EntryQuery.__new__(EntryQuery)
+        query.__dict__.update(self.__dict__)
+        query.__dict__.update(changes)
+        return query
+
+    def min_words(self, min_words: int) -> 'EntryQuery':
+        """
+        Keeps entries whose titles have more than min_words words. A value less than or equal to zero matches nothing.
+
+        Raises:
+            TypeError: If min_words is not an integer.
+        """
+        if not isinstance(min_words, int):
+            raise TypeError("Expected 'min_words' to be an integer.")
+        if self._min_words is not None:
+            # A non-positive bound matches nothing, so it wins over any other bound
+            bounds = (min_words, self._min_words)
+            min_words = min(bounds) if min(bounds) <= 0 else max(bounds)
+        return self._derive(_min_words=min_words)
+
+    def max_words(self, max_words: int) -> 'EntryQuery':
+        """
+        Keeps entries whose titles have at most max_words words. A value less than or equal to zero matches nothing.
+
+        Raises:
+            TypeError: If max_words is not an integer.
+        """
+        if not isinstance(max_words, int):
+            raise TypeError("Expected 'max_words' to be an integer.")
+        if self._max_words is not None:
+            max_words = min(max_words, self._max_words)
+        return self._derive(_max_words=max_words)
+
+    def where(self, predicate: Callable[[HackerNewsEntry], bool]) -> 'EntryQuery':
+        """
+        Keeps entries for which predicate returns a truthy value.
+
+        Raises:
+            TypeError: If predicate is not callable.
+        """
+        if not callable(predicate):
+            raise TypeError("Expected 'predicate' to be callable.")
+        return self._derive(_predicates=self._predicates + (predicate,))
+
+    def sort_by(self, field: str, descending: bool = True) -> 'EntryQuery':
+        """
+        Sorts entries by 'comments', 'points', 'order_num' or 'word_count'. Entries with equal values keep their
+        relative order.
+
+        Raises:
+            ValueError: If field is not a supported sort field.
+        """
+        if field not in self._sort_keys:
+            raise ValueError(f"Unknown sort field '{field}'. Expected one of {', '.join(self._sort_keys)}.")
+        return self._derive(_sort_key=self._sort_keys[field], _descending=descending)
+
+    def rank_by(self, score: str | ScoreFunction, descending: bool = True, **options) -> 'EntryQuery':
+        """
+        Sorts entries by a scoring function or a built-in formula from src.models.ranking, such as 'gravity' or
+        'points_per_comment'. Entries with equal scores keep their relative order.
+
+        Raises:
+            ValueError: If score is an unknown name.
+            TypeError: If score is neither a name nor callable.
+        """
+        return self._derive(_sort_key=get_score_function(score, **options), _descending=descending)
+
+    def limit(self, count: int) -> 'EntryQuery':
+        """
+        Keeps at most count entries.
+
+        Raises:
+            TypeError: If count is not an integer.
+            ValueError: If count is negative.
+        """
+        if not isinstance(count, int):
+            raise TypeError("Expected 'count' to be an integer.")
+        if count < 0:
+            raise ValueError("Expected 'count' to be zero or greater.")
+        if self._limit is not None:
+            count = min(count, self._limit)
+        return self._derive(_limit=count)
+
+    def execute(self) -> list[HackerNewsEntry]:
+        """
+        Runs the query.
+
+        Returns:
+            list[HackerNewsEntry]: A new list with the matching entries.
+        """
+        min_words, max_words = self._min_words, self._max_words
+        if (min_words is not None and min_words <= 0) or (max_words is not None and max_words <= 0) or self._limit == 0:
+            return []
+
+        rows = self._entries
+        if min_words is not None or max_words is not None or self._predicates:
+            rows = filter(self._build_matcher(), rows)
+
+        if self._sort_key is None:
+            return list(rows if self._limit is None else islice(rows, self._limit))
+        if self._limit is not None:
+            select = heapq.nlargest if self._descending else heapq.nsmallest
+            return select(self._limit, rows, key=self._sort_key)
+        return sorted(rows, key=self._sort_key, reverse=self._descending)
+
+    def __iter__(self):
+        return iter(self.execute())
+
+    def _build_matcher(self) -> Callable[[HackerNewsEntry], bool]:
+        # Fuse every filter into one function so that each entry is visited only once
+        min_words = self._min_words if self._min_words is not None else -1
+        max_words = self._max_words
+        predicates = self._predicates
+        check_words = self._min_words is not None or max_words is not None
+
+        def matches(entry: HackerNewsEntry) -> bool:
+            if check_words:
+                word_count = entry.word_count
+                if word_count <= min_words or (max_words is not None and word_count > max_words):
+                    return False
+            for predicate in predicates:
+                if not predicate(entry):
+                    return False
+            return True
+        return matches
@@ -0,0 +1,227 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+from src.constants import HN_URL, ENTRY_STORE_PATH
+from src.models.hn_entry import HackerNewsEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    item_id INTEGER,
+    order_num INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    points INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    url TEXT,
+    author TEXT,
+    posted_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_fetched_at ON snapshots(fetched_at);
+CREATE INDEX IF NOT EXISTS idx_entries_snapshot_id ON entries(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_entries_item_id ON entries(item_id);
+CREATE INDEX IF NOT EXISTS idx_entries_points ON entries(points);
+CREATE INDEX IF NOT EXISTS idx_entries_comment_count ON entries(comment_count);
+"""
+
+# Version of the schema above, stored in the database's user_version
+_SCHEMA_VERSION = 2
+
+# Columns added to entries by each schema version, added with ALTER TABLE to databases written by older versions
+_SCHEMA_MIGRATIONS: dict[int, tuple[tuple[str, str], ...]] = {
+    2: (('url', 'TEXT'), ('author', 'TEXT'), ('posted_at', 'INTEGER')),
+}
+
+class EntryStore:
+    """
+    Persistent store of timestamped entry snapshots, backed by SQLite.
+
+    Each call to record_snapshot stores one fetch: a row in snapshots with its fetch time (in epoch seconds) and URL,
+    and one row per entry in entries, all written in a single transaction. Item id, fetch time, points and comment
+    count are indexed so trajectories and rankings can be queried without scanning the whole history.
+    """
+    def __init__(self, path: str | Path = ENTRY_STORE_PATH):
+        """
+        Args:
+            path (str | Path): The SQLite database file, or ':memory:' for a temporary in-memory store.
+        """
+        self.path = str(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            if self.path != ':memory:':
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA foreign_keys=ON")
+            self._connection.executescript(_SCHEMA)
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """
+        Brings a database written by an older version of the store up to _SCHEMA_VERSION. CREATE TABLE IF NOT EXISTS
+        leaves existing tables alone, so columns added since are added here, keeping the rows already stored.
+        """
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(entries)")}
+        for migration_version in range(version + 1, _SCHEMA_VERSION + 1):
+            for name, column_type in _SCHEMA_MIGRATIONS.get(migration_version, ()):
+                if name not in columns:
+                    self._connection.execute(f"ALTER TABLE entries ADD COLUMN {name} {column_type}")
+        self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def __enter__(self) -> 'EntryStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def record_snapshot(self, entries: list[HackerNewsEntry], fetched_at: float | None = None, url: str = HN_URL) -> int:
+        """
+        Stores the entries of one fetch as a snapshot.
+
+        Args:
+            entries (list[HackerNewsEntry]): The fetched entries.
+            fetched_at (float | None): The fetch time in epoch seconds. Defaults to now.
+            url (str): The URL the entries were fetched from.
+
+        Returns:
+            int: The id of the new snapshot.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        return self.record_snapshots([(entries, fetched_at, url)])[0]
+
+    def record_snapshots(self, snapshots: Iterable[tuple[list[HackerNewsEntry], float | None, str]]) -> list[int]:
+        """
+        Stores several snapshots in a single transaction, as for a backfill.
+
+        Args:
+            snapshots (Iterable[tuple[list[HackerNewsEntry], float | None, str]]): (entries, fetched_at, url) tuples.
+
+        Returns:
+            list[int]: The ids of the new snapshots, in order.
+
+        Raises:
+            TypeError: If any entries value is not a list of HackerNewsEntry objects.
+        """
+        snapshots = list(snapshots)
+        for entries, _, _ in snapshots:
+            if not isinstance(entries, list) or not all(isinstance(entry, HackerNewsEntry) for entry in entries):
+                raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        snapshot_ids = []
+        with self._lock, self._connection:
+            for entries, fetched_at, url in snapshots:
+                cursor = self._connection.execute("INSERT INTO snapshots (fetched_at, url) VALUES (?, ?)",
+                                                  (time.time() if fetched_at is None else fetched_at, url))
+                snapshot_id = cursor.lastrowid
+                self._connection.executemany(
+                    "INSERT INTO entries (snapshot_id, item_id, order_num, title, points, comment_count, url, author, "
+                    "posted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(snapshot_id, entry.item_id, entry.order_num, entry.title, entry.points, entry.comment_count,
+                      entry.url, entry.author, entry.posted_at) for entry in entries])
+                snapshot_ids.append(snapshot_id)
+        return snapshot_ids
+
+    def snapshots(self, since: float | None = None, until: float | None = None, url: str | None = None) -> list[tuple[int, float, str]]:
+        """
+        Lists stored snapshots in fetch order.
+
+        Args:
+            since (float | None): Only include snapshots fetched at or after this epoch time.
+            until (float | None): Only include snapshots fetched at or before this epoch time.
+            url (str | None): Only include snapshots of this URL.
+
+        Returns:
+            list[tuple[int, float, str]]: (snapshot_id, fetched_at, url) tuples.
+        """
+        where, params = self._time_range('fetched_at', since, until)
+        if url is not None:
+            where.append("url = ?")
+            params.append(url)
+        query = "SELECT id, fetched_at, url FROM snapshots"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        return self._fetchall(query + " ORDER BY fetched_at, id", params)
+
+    def load_snapshot(self, snapshot_id: int) -> list[HackerNewsEntry]:
+        """
+        Returns the entries of a snapshot in rank order.
+        """
+        rows = self._fetchall("SELECT title, order_num, comment_count, points, item_id, url, author, posted_at "
+                              "FROM entries WHERE snapshot_id = ? ORDER BY order_num", (snapshot_id,))
+        return HackerNewsEntry.bulk_trusted(rows)
+
+    def item_trajectory(self, item_id: int, since: float | None = None, until: float | None = None) -> list[tuple[float, int, int, int]]:
+        """
+        Returns how an item's rank, points and comment count changed over time.
+
+        Args:
+            item_id (int): The Hacker News item id.
+            since (float | None): Only include snapshots fetched at or after this epoch time.
+            until (float | None): Only include snapshots fetched at or before this epoch time.
+
+        Returns:
+            list[tuple[float, int, int, int]]: (fetched_at, order_num, points, comment_count) tuples in fetch order.
+        """
+        where, params = self._time_range('s.fetched_at', since, until)
+        query = ("SELECT s.fetched_at, e.order_num, e.points, e.comment_count FROM entries e "
+                 "JOIN snapshots s ON s.id = e.snapshot_id WHERE e.item_id = ?")
+        if where:
+            query += " AND " + " AND ".join(where)
+        return self._fetchall(query + " ORDER BY s.fetched_at, s.id", [item_id] + params)
+
+    def top_items(self, metric: str = 'points', limit: int = 10, since: float | None = None,
+                  until: float | None = None) -> list[tuple[int, str, int]]:
+        """
+        Returns the items with the highest peak points or comment count.
+
+        Args:
+            metric (str): 'points' or 'comment_count'.
+            limit (int): The maximum number of items to return.
+            since (float | None): Only include snapshots fetched at or after this epoch time.
+            until (float | None): Only include snapshots fetched at or before this epoch time.
+
+        Returns:
+            list[tuple[int, str, int]]: (item_id, title, peak value) tuples, highest first.
+
+        Raises:
+            ValueError: If metric is not a supported column.
+        """
+        if metric not in ('points', 'comment_count'):
+            raise ValueError("Expected 'metric' to be 'points' or 'comment_count'.")
+        where, params = self._time_range('s.fetched_at', since, until)
+        query = (f"SELECT e.item_id, e.title, MAX(e.{metric}) AS peak FROM entries e "
+                 "JOIN snapshots s ON s.id = e.snapshot_id WHERE e.item_id IS NOT NULL")
+        if where:
+            query += " AND " + " AND ".join(where)
+        return self._fetchall(query + " GROUP BY e.item_id ORDER BY peak DESC, e.item_id LIMIT ?", params + [limit])
+
+    @staticmethod
+    def _time_range(column: str, since: float | None, until: float | None) -> tuple[list[str], list]:
+        where, params = [], []
+        if since is not None:
+            where.append(f"{column} >= ?")
+            params.append(since)
+        if until is not None:
+            where.append(f"{column} <= ?")
+            params.append(until)
+        return where, params
+
+    def _fetchall(self, query: str, params) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
@@ -0,0 +1,213 @@
+from array import array
+from itertools import compress, repeat
+from operator import gt, le
+from src.models.hn_entry import HackerNewsEntry
+
+class _EntryColumns:
+    """
+    Parallel column arrays shared by an EntryTable and all of its views.
+    """
+    __slots__ = ('titles', 'order_nums', 'comment_counts', 'points', 'title_word_counts', 'item_ids', 'urls',
+                 'authors', 'posted_ats')
+
+    def __init__(self):
+        self.titles: list[str] = []
+        self.order_nums = array('q')
+        self.comment_counts = array('q')
+        self.points = array('q')
+        self.title_word_counts = array('q')
+        # Optional fields, None when unknown
+        self.item_ids: list[int | None] = []
+        self.urls: list[str | None] = []
+        self.authors: list[str | None] = []
+        self.posted_ats: list[int | None] = []
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def append(self, entry: HackerNewsEntry) -> None:
+        self.titles.append(entry.title)
+        self.order_nums.append(entry.order_num)
+        self.comment_counts.append(entry.comment_count)
+        self.points.append(entry.points)
+        self.title_word_counts.append(entry.word_count)
+        self.item_ids.append(entry.item_id)
+        self.urls.append(entry.url)
+        self.authors.append(entry.author)
+        self.posted_ats.append(entry.posted_at)
+
+    def entry(self, row: int) -> HackerNewsEntry:
+        return HackerNewsEntry.trusted(self.titles[row], self.order_nums[row], self.comment_counts[row],
+                                       self.points[row], self.item_ids[row], self.urls[row], self.authors[row],
+                                       self.posted_ats[row])
+
+class EntryTable:
+    """
+    Columnar container for HackerNewsEntry data.
+
+    Each field is kept in its own array, together with the precomputed number of words of each title. Filters build
+    a mask over a column and sorts compute an argsort over a column; both return a new EntryTable that is a view over
+    the same columns with its own row index, so no entry data is copied and the source table is never modified. Masks
+    are computed with map over the operator module, so the loop over the rows runs in C rather than in bytecode.
+    Slicing a table also returns a view.
+    """
+    __slots__ = ('_columns', '_index')
+
+    def __init__(self, entries: list[HackerNewsEntry] | None = None):
+        """
+        Args:
+            entries (list[HackerNewsEntry] | None): The entries to load into the table.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        self._columns = _EntryColumns()
+        # Row numbers of the view into the columns, or None for every row in storage order
+        self._index: array | None = None
+        if entries is not None:
+            self.extend(entries)
+
+    @classmethod
+    def _view(cls, columns: _EntryColumns, index) -> 'EntryTable':
+        table = cls.__new__(cls)
+        table._columns = columns
+        table._index = array('q', index)
+        return table
+
+    def extend(self, entries: list[HackerNewsEntry]) -> None:
+        """
+        Appends entries to the table.
+
+        Args:
+            entries (list[HackerNewsEntry]): The entries to append.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+            ValueError: If the table is a view of another table.
+        """
+        if not isinstance(entries, list) or not all(isinstance(entry, HackerNewsEntry) for entry in entries):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        if self._index is not None:
+            raise ValueError("Cannot extend a view of an EntryTable.")
+        for entry in entries:
+            self._columns.append(entry)
+
+    def __len__(self) -> int:
+        return len(self._columns) if self._index is None else len(self._index)
+
+    def __iter__(self):
+        entry = self._columns.entry
+        for row in self._rows():
+            yield entry(row)
+
+    def __getitem__(self, position: int | slice) -> 'HackerNewsEntry | EntryTable':
+        if isinstance(position, slice):
+            return self._view(self._columns, self._rows()[position])
+        row = position if self._index is None else self._index[position]
+        return self._columns.entry(row)
+
+    def to_entries(self) -> list[HackerNewsEntry]:
+        """
+        Materializes the rows of the table as HackerNewsEntry objects.
+
+        Returns:
+            list[HackerNewsEntry]: The entries, in table order.
+        """
+        return list(self)
+
+    def column(self, name: str) -> list:
+        """
+        Returns the values of one column for the rows of the table, in table order.
+
+        Args:
+            name (str): One of 'title', 'order_num', 'comment_count', 'points', 'title_word_count', 'item_id',
+                'url', 'author' or 'posted_at'.
+
+        Returns:
+            list: The column values.
+
+        Raises:
+            ValueError: If there is no column with that name.
+        """
+        column_names = {'title': 'titles', 'order_num': 'order_nums', 'comment_count': 'comment_counts',
+                        'points': 'points', 'title_word_count': 'title_word_counts', 'item_id': 'item_ids',
+                        'url': 'urls', 'author': 'authors', 'posted_at': 'posted_ats'}
+        if name not in column_names:
+            raise ValueError(f"Unknown column '{name}'.")
+        values = getattr(self._columns, column_names[name])
+        if self._index is None:
+            return list(values)
+        return list(map(values.__getitem__, self._index))
+
+    def filter_by_min_title_length(self, min_words: int) -> 'EntryTable':
+        """
+        Filters rows based on number of words in their titles.
+
+        Args:
+            min_words (int): The number of words a title should exceed for the row to be included in the result.
+
+        Returns:
+            EntryTable: A view with the matching rows.
+
+        Raises:
+            TypeError: If min_words is not an integer.
+        """
+        if not isinstance(min_words, int):
+            raise TypeError("Expected 'min_words' to be an integer.")
+        if min_words <= 0:
+            return self._view(self._columns, ())
+        return self._select(gt, min_words)
+
+    def filter_by_max_title_length(self, max_words: int) -> 'EntryTable':
+        """
+        Filters rows based on the maximum number of words in their titles.
+
+        Args:
+            max_words (int): The maximum number of words a title should have for the row to be included in the result.
+
+        Returns:
+            EntryTable: A view with the matching rows.
+
+        Raises:
+            TypeError: If max_words is not an integer.
+        """
+        if not isinstance(max_words, int):
+            raise TypeError("Expected 'max_words' to be an integer.")
+        if max_words <= 0:
+            return self._view(self._columns, ())
+        return self._select(le, max_words)
+
+    def sort_by_comments(self) -> 'EntryTable':
+        """
+        Sorts rows based on their comment_count in descending order. Rows with equal counts keep their order.
+
+        Returns:
+            EntryTable: A sorted view.
+        """
+        return self._view(self._columns, sorted(self._rows(), key=self._columns.comment_counts.__getitem__, reverse=True))
+
+    def sort_by_points(self) -> 'EntryTable':
+        """
+        Sorts rows by their points in descending order. Rows with equal points keep their order.
+
+        Returns:
+            EntryTable: A sorted view.
+        """
+        return self._view(self._columns, sorted(self._rows(), key=self._columns.points.__getitem__, reverse=True))
+
+    def _rows(self):
+        return range(len(self._columns)) if self._index is None else self._index
+
+    def _select(self, compare, bound: int) -> 'EntryTable':
+        # Keeps the rows whose word count compares true against bound
+        word_counts = self._columns.title_word_counts
+        index = self._index
+        if index is None:
+            rows = compress(range(len(word_counts)), map(compare, word_counts, repeat(bound)))
+        elif 3 * len(index) < len(word_counts):
+            # Small views are cheaper to compare row by row than to mask the whole column
+            rows = compress(index, map(compare, map(word_counts.__getitem__, index), repeat(bound)))
+        else:
+            mask = bytes(map(compare, word_counts, repeat(bound)))
+            rows = compress(index, map(mask.__getitem__, index))
+        return self._view(self._columns, rows)
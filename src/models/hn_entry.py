@@ -1,8 +1,17 @@
+import itertools
+import sys
+import time
+from urllib.parse import urlsplit
 from src.utils.log_config import setup_logger
+from src.utils.metrics import VALIDATION_FAILURES
 
 logger = setup_logger(__name__)
 
 class HackerNewsEntry:
+    # Fields are stored in slots rather than a per-instance __dict__
+    __slots__ = ('_title', '_order_num', '_comment_count', '_points', '_word_count', '_item_id', '_url', '_host',
+                 '_author', '_posted_at')
+
     # Private variables
     _default_str_val = 'BAD STRING'
     _default_int_val = 0
@@ -10,13 +19,116 @@ class HackerNewsEntry:
     _order_num: int
     _comment_count: int
     _points: int
+    _word_count: int
+    _item_id: int | None
+    _url: str | None
+    _host: str | None
+    _author: str | None
+    _posted_at: int | None
 
     # Class constructor
-    def __init__(self, title: str, order_num: int, comment_count: int, points: int):
+    def __init__(self, title: str, order_num: int, comment_count: int, points: int, item_id: int | None = None,
+                 url: str | None = None, author: str | None = None, posted_at: int | None = None):
             self.title = title
             self.order_num = order_num
             self.comment_count = comment_count
             self.points = points
+            self.item_id = item_id
+            self.url = url
+            self.author = author
+            self.posted_at = posted_at
+
+    # Trusted constructors
+    @classmethod
+    def trusted(cls, title: str, order_num: int, comment_count: int, points: int, item_id: int | None = None,
+                url: str | None = None, author: str | None = None, posted_at: int | None = None) -> 'HackerNewsEntry':
+        """
+        Builds an entry without running the field validators.
+
+        Only use this for values that are already known to be valid, such as those produced by the parser backends.
+
+        Returns:
+            HackerNewsEntry: The new entry.
+        """
+        entry = cls.__new__(cls)
+        entry._title = title
+        entry._word_count = len(title.split())
+        entry._order_num = order_num
+        entry._comment_count = comment_count
+        entry._points = points
+        entry._item_id = item_id
+        entry._url = url
+        entry._host = None if url is None else _host_of(url)
+        entry._author = None if author is None else sys.intern(author)
+        entry._posted_at = posted_at
+        return entry
+
+    @classmethod
+    def bulk_trusted(cls, rows) -> list['HackerNewsEntry']:
+        """
+        Builds entries without running the field validators from an iterable of
+        (title, order_num, comment_count, points) tuples, or of
+        (title, order_num, comment_count, points, item_id, url, author, posted_at) tuples.
+
+        Only use this for values that are already known to be valid. The length of the first row sets the layout of
+        every row, so that the rows are unpacked without checking their length one by one.
+
+        Returns:
+            list[HackerNewsEntry]: The new entries, in the same order as rows.
+
+        Raises:
+            ValueError: If the rows do not have 4 or 8 fields.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return []
+        arity = len(first)
+        rows = itertools.chain((first,), rows)
+
+        new = cls.__new__
+        entries = []
+        append = entries.append
+        if arity == 4:
+            for title, order_num, comment_count, points in rows:
+                entry = new(cls)
+                entry._title = title
+                entry._word_count = len(title.split())
+                entry._order_num = order_num
+                entry._comment_count = comment_count
+                entry._points = points
+                entry._item_id = None
+                entry._url = None
+                entry._host = None
+                entry._author = None
+                entry._posted_at = None
+                append(entry)
+        elif arity == 8:
+            intern = sys.intern
+            host_of = _host_of
+            for title, order_num, comment_count, points, item_id, url, author, posted_at in rows:
+                entry = new(cls)
+                entry._title = title
+                entry._word_count = len(title.split())
+                entry._order_num = order_num
+                entry._comment_count = comment_count
+                entry._points = points
+                entry._item_id = item_id
+                entry._url = url
+                entry._host = None if url is None else host_of(url)
+                entry._author = None if author is None else intern(author)
+                entry._posted_at = posted_at
+                append(entry)
+        else:
+            raise ValueError(f"Expected 'rows' to have 4 or 8 fields, got {arity}.")
+        return entries
+
+    def copy(self) -> 'HackerNewsEntry':
+        """
+        Returns an independent copy of the entry.
+        """
+        return self.trusted(self._title, self._order_num, self._comment_count, self._points, self._item_id,
+                            self._url, self._author, self._posted_at)
 
     # Equality operator override
     def __eq__(self, other):
@@ -39,6 +151,12 @@ class HackerNewsEntry:
     @title.setter
     def title(self, value: str) -> None:
         self._title = self._validate_str(value, "'title'")
+        self._word_count = len(self._title.split())
+
+    @property
+    def word_count(self) -> int:
+        # Number of words in the title, computed once whenever the title is set
+        return self._word_count
     
     @property
     def order_num(self) -> int:
@@ -64,15 +182,94 @@ class HackerNewsEntry:
     def points(self, value: int) -> None:
         self._points = self._validate_int(value, "'points'")
 
+    @property
+    def item_id(self) -> int | None:
+        # Hacker News item id, or None if unknown
+        return self._item_id
+
+    @item_id.setter
+    def item_id(self, value: int | None) -> None:
+        self._item_id = None if value is None else self._validate_optional_int(value, "'item_id'")
+
+    @property
+    def url(self) -> str | None:
+        # Absolute URL of the story, or None if unknown
+        return self._url
+
+    @url.setter
+    def url(self, value: str | None) -> None:
+        self._url = None if value is None else self._validate_optional_str(value, "'url'")
+        self._host = _host_of(self._url)
+
+    @property
+    def host(self) -> str | None:
+        # Interned host name of the story URL, shared by every entry linking to the same site
+        return self._host
+
+    @property
+    def author(self) -> str | None:
+        # User name of the submitter, or None if unknown
+        return self._author
+
+    @author.setter
+    def author(self, value: str | None) -> None:
+        value = None if value is None else self._validate_optional_str(value, "'author'")
+        self._author = sys.intern(value) if value is not None else None
+
+    @property
+    def posted_at(self) -> int | None:
+        # Submission time in epoch seconds, or None if unknown
+        return self._posted_at
+
+    @posted_at.setter
+    def posted_at(self, value: int | None) -> None:
+        self._posted_at = None if value is None else self._validate_optional_int(value, "'posted_at'")
+
+    def age(self, now: float | None = None) -> float | None:
+        """
+        Returns the seconds elapsed since the entry was submitted, or None if its submission time is unknown.
+
+        Args:
+            now (float | None): The current time in epoch seconds. Defaults to time.time().
+        """
+        if self._posted_at is None:
+            return None
+        return (time.time() if now is None else now) - self._posted_at
+
     # Validation methods
     def _validate_str(self, value: str, value_name: str) -> str:
         if not isinstance(value, str):
-            logger.warning(f"order_num {self.order_num} received invalid {value_name} value {value}.")
+            logger.warning("order_num %s received invalid %s value %s.", getattr(self, '_order_num', None), value_name, value)
+            VALIDATION_FAILURES.inc(field=value_name.strip("'"))
             return self._default_str_val
         return value
 
     def _validate_int(self, value: int, value_name: str) -> int:
         if not isinstance(value, int) or value < 0:
-            logger.warning(f"order_num {self.order_num} received invalid {value_name} value: {value}.")
+            logger.warning("order_num %s received invalid %s value: %s.", getattr(self, '_order_num', None), value_name, value)
+            VALIDATION_FAILURES.inc(field=value_name.strip("'"))
             return self._default_int_val
         return value
+
+    def _validate_optional_int(self, value: int, value_name: str) -> int | None:
+        if not isinstance(value, int) or value < 0:
+            logger.warning("order_num %s received invalid %s value: %s.", getattr(self, '_order_num', None), value_name, value)
+            VALIDATION_FAILURES.inc(field=value_name.strip("'"))
+            return None
+        return value
+
+    def _validate_optional_str(self, value: str, value_name: str) -> str | None:
+        if not isinstance(value, str):
+            logger.warning("order_num %s received invalid %s value %s.", getattr(self, '_order_num', None), value_name, value)
+            VALIDATION_FAILURES.inc(field=value_name.strip("'"))
+            return None
+        return value
+
+def _host_of(url: str | None) -> str | None:
+    """
+    Returns the interned host name of url, or None if url is None or has no host.
+    """
+    if url is None:
+        return None
+    host = urlsplit(url).hostname
+    return sys.intern(host) if host else None
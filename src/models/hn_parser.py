@@ -0,0 +1,410 @@
+import datetime
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from src.constants import (HN_ENTRY_START_TAG, HN_ENTRY_START_CLASS, HN_TITLE_TAG, HN_TITLE_CLASS,
+                           HN_ORDER_NUM_TAG, HN_ORDER_NUM_CLASS, HN_COMMENT_COUNT_TAG, HN_POINTS_TAG,
+                           HN_POINTS_CLASS, HN_SUBTEXT_TAG, HN_SUBTEXT_CLASS, HN_AGE_TAG, HN_AGE_CLASS,
+                           HN_USER_TAG, HN_USER_CLASS, HN_BASE_URL, HN_STREAM_CHUNK_SIZE, HN_PARSER_BACKEND,
+                           HN_PARSER_FALLBACK_BACKEND)
+from src.models.hn_entry import HackerNewsEntry
+from src.utils.html_utils import decode_content, has_class, parse_int, parse_item_id
+from src.utils.log_config import setup_logger
+
+logger = setup_logger(__name__)
+
+def _parse_comment_count(s: str) -> int | None:
+    """
+    Returns the comment count in a subtext link text such as '189 comments', or None if s is not a comment link.
+    """
+    return parse_int(s) if 'comment' in s else None
+
+def _parse_url(href: str | None) -> str | None:
+    """
+    Returns the absolute URL of a story link, resolving links to Hacker News itself, or None if there is no link.
+    """
+    return urljoin(HN_BASE_URL, href) if href else None
+
+def _parse_author(s: str) -> str | None:
+    """
+    Returns the user name in the text of a user link, or None if it is empty.
+    """
+    return s.strip() or None
+
+def _parse_posted_at(s: str | None) -> int | None:
+    """
+    Returns the submission time in the title attribute of an age span as epoch seconds, or None if it is missing or
+    malformed. The attribute holds a UTC timestamp such as '2023-09-21T12:15:19', optionally followed by the same
+    time in epoch seconds.
+    """
+    if not s:
+        return None
+    timestamp, _, epoch = s.partition(' ')
+    if epoch.isascii() and epoch.isdigit():
+        return int(epoch)
+    try:
+        posted_at = datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    if posted_at.tzinfo is None:
+        posted_at = posted_at.replace(tzinfo=datetime.timezone.utc)
+    return int(posted_at.timestamp())
+
+def _build_entry(title: str | None, order_num: int | None, comment_count: int | None, points: int | None,
+                 item_id: int | None = None, url: str | None = None, author: str | None = None,
+                 posted_at: int | None = None) -> HackerNewsEntry:
+    """
+    Builds an entry from extracted values. Values extracted by the parsers are either None or already valid, so the
+    validating constructor is only needed when something is missing.
+    """
+    if title is None or order_num is None or comment_count is None or points is None:
+        return HackerNewsEntry(title=title, order_num=order_num, comment_count=comment_count, points=points,
+                               item_id=item_id, url=url, author=author, posted_at=posted_at)
+    return HackerNewsEntry.trusted(title, order_num, comment_count, points, item_id, url, author, posted_at)
+
+class HackerNewsParser(ABC):
+    """
+    Base class for parser backends that extract HackerNewsEntry objects from a Hacker News listing page.
+    """
+    name: str = ''
+
+    @abstractmethod
+    def parse(self, content: bytes | str, max_entries: int) -> list[HackerNewsEntry]:
+        """
+        Parses up to max_entries entries out of the HTML content of a Hacker News listing page.
+
+        Args:
+            content (bytes | str): The HTML content.
+            max_entries (int): The maximum number of entries to parse.
+
+        Returns:
+            list[HackerNewsEntry]: The parsed entries in page order.
+        """
+
+class SoupParser(HackerNewsParser):
+    """
+    BeautifulSoup backend. Builds the full document tree and searches it row by row.
+    bs4 is imported on first use, so the other backends do not pay for loading it.
+    """
+    name = 'html.parser'
+
+    def __init__(self, features: str = 'html.parser'):
+        self.features = features
+
+    def parse(self, content: bytes | str, max_entries: int) -> list[HackerNewsEntry]:
+        if max_entries <= 0:
+            return []
+
+        from bs4 import BeautifulSoup
+
+        # Parse the HTML content using BeautifulSoup
+        soup = BeautifulSoup(content, self.features)
+        title_containers = soup.find_all(HN_ENTRY_START_TAG, class_=HN_ENTRY_START_CLASS, limit=max_entries)
+
+        entries = []
+        for container in title_containers:
+            title_link = self._find_title_link(container)
+            title: str | None = title_link.text if title_link else None
+            url: str | None = _parse_url(title_link.get('href')) if title_link else None
+            order_num: int | None = self._extract_order_num(container)
+            item_id: int | None = parse_item_id(container.get('id'))
+            comment_count: int | None = None
+            points: int | None = None
+            author: str | None = None
+            posted_at: int | None = None
+            subtext_row = container.find_next_sibling('tr')
+            subtext_container = subtext_row.find(HN_SUBTEXT_TAG, class_=HN_SUBTEXT_CLASS) if subtext_row else None
+            if subtext_container:
+                comment_count = self._extract_comment_count(subtext_container)
+                points = self._extract_points(subtext_container)
+                author = self._extract_author(subtext_container)
+                posted_at = self._extract_posted_at(subtext_container)
+            entries.append(_build_entry(title, order_num, comment_count, points, item_id, url, author, posted_at))
+        return entries
+
+    @staticmethod
+    def _find_title_link(container):
+        title_container = container.find(HN_TITLE_TAG, class_=HN_TITLE_CLASS)
+        return title_container.a if title_container else None
+
+    @staticmethod
+    def _extract_order_num(container) -> int | None:
+        order_num_container = container.find(HN_ORDER_NUM_TAG, class_=HN_ORDER_NUM_CLASS)
+        return parse_int(order_num_container.text) if order_num_container else None
+
+    @staticmethod
+    def _extract_comment_count(container) -> int | None:
+        a_containers = container.find_all(HN_COMMENT_COUNT_TAG)
+        for container in a_containers:
+            comment_count = _parse_comment_count(container.text)
+            if comment_count is not None:
+                return comment_count
+        return 0
+
+    @staticmethod
+    def _extract_points(container) -> int | None:
+        points_container = container.find(HN_POINTS_TAG, class_=HN_POINTS_CLASS)
+        return parse_int(points_container.text) if points_container else None
+
+    @staticmethod
+    def _extract_author(container) -> str | None:
+        author_container = container.find(HN_USER_TAG, class_=HN_USER_CLASS)
+        return _parse_author(author_container.text) if author_container else None
+
+    @staticmethod
+    def _extract_posted_at(container) -> int | None:
+        age_container = container.find(HN_AGE_TAG, class_=HN_AGE_CLASS)
+        return _parse_posted_at(age_container.get('title')) if age_container else None
+
+class LxmlParser(HackerNewsParser):
+    """
+    lxml backend. Builds the document tree in C and walks it with lxml's element iterators.
+    lxml is listed in requirements.txt but only imported when the backend is created, to keep it off start-up.
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        try:
+            from lxml import html as lxml_html
+        except ImportError:
+            raise ImportError("The 'lxml' parser backend requires the lxml package.") from None
+        self._lxml_html = lxml_html
+
+    def parse(self, content: bytes | str, max_entries: int) -> list[HackerNewsEntry]:
+        if max_entries <= 0:
+            return []
+
+        root = self._lxml_html.fromstring(decode_content(content))
+        entries = []
+        for container in self._iter_by_class(root, HN_ENTRY_START_TAG, HN_ENTRY_START_CLASS):
+            title_container = next(self._iter_by_class(container, HN_TITLE_TAG, HN_TITLE_CLASS), None)
+            title_link = next(title_container.iter('a'), None) if title_container is not None else None
+            title = title_link.text_content() if title_link is not None else None
+            url = _parse_url(title_link.get('href')) if title_link is not None else None
+            order_num_container = next(self._iter_by_class(container, HN_ORDER_NUM_TAG, HN_ORDER_NUM_CLASS), None)
+            order_num = parse_int(order_num_container.text_content()) if order_num_container is not None else None
+            comment_count = None
+            points = None
+            author = None
+            posted_at = None
+            subtext_row = container.getnext()
+            while subtext_row is not None and subtext_row.tag != 'tr':
+                subtext_row = subtext_row.getnext()
+            subtext_container = None
+            if subtext_row is not None:
+                subtext_container = next(self._iter_by_class(subtext_row, HN_SUBTEXT_TAG, HN_SUBTEXT_CLASS), None)
+            if subtext_container is not None:
+                points_container = next(self._iter_by_class(subtext_container, HN_POINTS_TAG, HN_POINTS_CLASS), None)
+                points = parse_int(points_container.text_content()) if points_container is not None else None
+                comment_count = 0
+                for link in subtext_container.iter(HN_COMMENT_COUNT_TAG):
+                    link_comment_count = _parse_comment_count(link.text_content())
+                    if link_comment_count is not None:
+                        comment_count = link_comment_count
+                        break
+                author_container = next(self._iter_by_class(subtext_container, HN_USER_TAG, HN_USER_CLASS), None)
+                author = _parse_author(author_container.text_content()) if author_container is not None else None
+                age_container = next(self._iter_by_class(subtext_container, HN_AGE_TAG, HN_AGE_CLASS), None)
+                posted_at = _parse_posted_at(age_container.get('title')) if age_container is not None else None
+            entries.append(_build_entry(title, order_num, comment_count, points, parse_item_id(container.get('id')),
+                                        url, author, posted_at))
+            if len(entries) >= max_entries:
+                break
+        return entries
+
+    @staticmethod
+    def _iter_by_class(element, tag: str, class_name: str):
+        for child in element.iter(tag):
+            if class_name in (child.get('class') or '').split():
+                yield child
+
+class StreamingEntryExtractor(HTMLParser):
+    """
+    Single-pass, incremental entry extractor.
+
+    Tokenizes the page with the standard library HTMLParser and keeps only the state of the row pair currently being
+    read, so no document tree is built. Data can be fed in arbitrary chunks; each entry becomes available from
+    pop_entries() as soon as its entry row and the following subtext row have been read.
+    """
+    def __init__(self, max_entries: int | None = None):
+        super().__init__(convert_charrefs=True)
+        self.max_entries = max_entries
+        self.num_entries = 0
+        self._ready: list[HackerNewsEntry] = []
+        self._pending: dict | None = None
+        # Row currently being read: 'entry', 'after_entry' (waiting for the next row) or 'subtext'
+        self._row: str | None = None
+        self._in_title_container = False
+        self._in_subtext = False
+        self._comment_count_found = False
+        self._capture: str | None = None
+        self._capture_tag: str | None = None
+        self._text: list[str] = []
+
+    @property
+    def done(self) -> bool:
+        """
+        True once max_entries entries have been extracted.
+        """
+        return self.max_entries is not None and self.num_entries >= self.max_entries
+
+    def pop_entries(self) -> list[HackerNewsEntry]:
+        """
+        Returns the entries completed since the last call.
+        """
+        entries, self._ready = self._ready, []
+        return entries
+
+    def close(self) -> None:
+        super().close()
+        self._finish_entry()
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == HN_ENTRY_START_TAG and has_class(attrs, HN_ENTRY_START_CLASS):
+            self._finish_entry()
+            self._pending = {'title': None, 'order_num': None, 'comment_count': None, 'points': None,
+                             'item_id': parse_item_id(dict(attrs).get('id')), 'url': None, 'author': None,
+                             'posted_at': None}
+            self._row = 'entry'
+            return
+        if self._pending is None or self._capture is not None:
+            return
+        if self._row == 'entry':
+            if tag == HN_ORDER_NUM_TAG and self._pending['order_num'] is None and has_class(attrs, HN_ORDER_NUM_CLASS):
+                self._start_capture('order_num', tag)
+            elif tag == HN_TITLE_TAG and has_class(attrs, HN_TITLE_CLASS):
+                self._in_title_container = True
+            elif tag == 'a' and self._in_title_container:
+                self._in_title_container = False
+                self._pending['url'] = _parse_url(dict(attrs).get('href'))
+                self._start_capture('title', tag)
+        elif self._row == 'after_entry':
+            if tag == 'tr':
+                self._row = 'subtext'
+        elif self._row == 'subtext':
+            if not self._in_subtext:
+                if tag == HN_SUBTEXT_TAG and has_class(attrs, HN_SUBTEXT_CLASS):
+                    self._in_subtext = True
+                    self._pending['comment_count'] = 0
+            elif tag == HN_POINTS_TAG and self._pending['points'] is None and has_class(attrs, HN_POINTS_CLASS):
+                self._start_capture('points', tag)
+            elif tag == HN_USER_TAG and self._pending['author'] is None and has_class(attrs, HN_USER_CLASS):
+                self._start_capture('author', tag)
+            elif tag == HN_AGE_TAG and self._pending['posted_at'] is None and has_class(attrs, HN_AGE_CLASS):
+                self._pending['posted_at'] = _parse_posted_at(dict(attrs).get('title'))
+            elif tag == HN_COMMENT_COUNT_TAG and not self._comment_count_found:
+                self._start_capture('comment_count', tag)
+
+    def handle_endtag(self, tag):
+        if self._pending is None:
+            return
+        if self._capture is not None:
+            if tag == self._capture_tag:
+                self._end_capture()
+            return
+        if tag == 'tr':
+            if self._row == 'entry':
+                self._row = 'after_entry'
+            elif self._row == 'subtext':
+                self._finish_entry()
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+
+    def _start_capture(self, field: str, tag: str) -> None:
+        self._capture = field
+        self._capture_tag = tag
+        self._text = []
+
+    def _end_capture(self) -> None:
+        text = ''.join(self._text)
+        if self._capture == 'title':
+            self._pending['title'] = text
+        elif self._capture == 'author':
+            self._pending['author'] = _parse_author(text)
+        elif self._capture == 'comment_count':
+            comment_count = _parse_comment_count(text)
+            if comment_count is not None:
+                self._pending['comment_count'] = comment_count
+                self._comment_count_found = True
+        else:
+            self._pending[self._capture] = parse_int(text)
+        self._capture = None
+        self._capture_tag = None
+        self._text = []
+
+    def _finish_entry(self) -> None:
+        if self._pending is None:
+            return
+        if self._capture is not None:
+            self._end_capture()
+        if not self.done:
+            self._ready.append(_build_entry(**self._pending))
+            self.num_entries += 1
+        self._pending = None
+        self._row = None
+        self._in_title_container = False
+        self._in_subtext = False
+        self._comment_count_found = False
+
+class StreamingParser(HackerNewsParser):
+    """
+    Streaming backend. Feeds the page through a StreamingEntryExtractor in chunks and stops reading as soon as
+    max_entries entries have been extracted.
+    """
+    name = 'stream'
+
+    def __init__(self, chunk_size: int = HN_STREAM_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def parse(self, content: bytes | str, max_entries: int) -> list[HackerNewsEntry]:
+        if max_entries <= 0:
+            return []
+
+        text = decode_content(content)
+        extractor = StreamingEntryExtractor(max_entries)
+        entries = []
+        for start in range(0, len(text), self.chunk_size):
+            extractor.feed(text[start:start + self.chunk_size])
+            entries.extend(extractor.pop_entries())
+            if extractor.done:
+                return entries
+        extractor.close()
+        entries.extend(extractor.pop_entries())
+        return entries
+
+PARSER_BACKENDS: dict[str, type[HackerNewsParser]] = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+    StreamingParser.name: StreamingParser,
+}
+
+def get_parser(name: str) -> HackerNewsParser:
+    """
+    Returns a parser backend by name.
+
+    If name is the default backend, HN_PARSER_BACKEND, and the package it depends on is not installed,
+    HN_PARSER_FALLBACK_BACKEND is returned instead.
+
+    Args:
+        name (str): One of the keys of PARSER_BACKENDS.
+
+    Returns:
+        HackerNewsParser: A new instance of the backend.
+
+    Raises:
+        ValueError: If no backend with that name exists.
+        ImportError: If the backend depends on a package that is not installed and is not the default.
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{name}'. Expected one of {', '.join(PARSER_BACKENDS)}.")
+    try:
+        return PARSER_BACKENDS[name]()
+    except ImportError as e:
+        if name != HN_PARSER_BACKEND:
+            raise
+        logger.warning(f"{e} Falling back to the '{HN_PARSER_FALLBACK_BACKEND}' parser backend.")
+        return PARSER_BACKENDS[HN_PARSER_FALLBACK_BACKEND]()
@@ -1,13 +1,47 @@
+import codecs
+import functools
 import requests
 import datetime
-from requests.exceptions import HTTPError
-from bs4 import BeautifulSoup
-from src.constants import *
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
+from urllib.parse import urlsplit
+from src.constants import (HN_HTTP_REQUEST_HEADER, HN_URL, HN_FEED_URLS, HN_FETCH_DELAY, HN_PARSER_BACKEND,
+                           HN_STREAM_CHUNK_SIZE, HN_MAX_ENTRIES, HN_PAGE_SIZE, HN_PAGE_PARAM, HN_CRAWL_MAX_WORKERS,
+                           HN_CRAWL_PAGE_DELAY, HN_PARSE_CACHE_MAX_ENTRIES)
 from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_parser import HackerNewsParser, StreamingEntryExtractor, get_parser
+from src.utils.http_cache import HttpCache, content_hash
 from src.utils.log_config import setup_logger
+from src.utils.metrics import (ENTRY_OPERATION_SECONDS, HTTP_REQUEST_SECONDS, PARSE_CACHE_HITS, PARSE_SECONDS,
+                               PARSE_SECONDS_PER_ENTRY, ROWS_EXTRACTED, registry as metrics, timed)
+from src.utils.rate_limiter import (FetchScheduler, HostRateLimiter, Reschedule, get_fetch_scheduler,
+                                    get_host_rate_limiter)
+from src.utils.resilience import FetchPolicy, get_fetch_policy
+
+if TYPE_CHECKING:
+    # asyncio and the async connection pool are only imported once an async method runs, to keep start-up fast
+    from src.utils.async_http import AsyncHttpPool
+    # Likewise for the comment crawler, the snapshot merge and queries, which only their methods need
+    from src.models.comment_thread import CommentCrawler, CommentThread
+    from src.models.entry_diff import EntryChangeSet
+    from src.models.entry_query import EntryQuery
 
 logger = setup_logger(__name__)
 
+def _synchronized(method):
+    """
+    Runs a scraper method while holding the scraper's lock, so one instance can be shared between threads.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class HackerNewsScraper:
     _instance = None
 
@@ -16,11 +50,26 @@ class HackerNewsScraper:
             cls._instance = super(HackerNewsScraper, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, max_entries: int = HN_MAX_ENTRIES):
+    def __init__(self, max_entries: int = HN_MAX_ENTRIES, parser: str = HN_PARSER_BACKEND,
+                 http_cache: HttpCache | None = None, url: str = HN_URL, rate_limiter: HostRateLimiter | None = None,
+                 fetch: bool = True, fetch_policy: FetchPolicy | None = None):
+        self.url: str = url
+        self.parser: HackerNewsParser = get_parser(parser)
+        self.http_cache: HttpCache | None = http_cache
+        self.rate_limiter: HostRateLimiter | None = rate_limiter
+        # Timeouts, retries and circuit breakers of every request; the shared policy makes breakers process-wide
+        self.fetch_policy: FetchPolicy = fetch_policy or get_fetch_policy()
+        self._parse_cache: OrderedDict[tuple[str, int], list[HackerNewsEntry]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.entries: list[HackerNewsEntry] = []
         self.fetch_error: bool = False
+        # Exception raised by the last page request, kept so callers can inspect the status code of failed fetches
+        self.last_fetch_exception: requests.RequestException | None = None
         self.last_fetch_time = datetime.datetime.min
-        self.fetch_hn_entries(max_entries)
+        if fetch:
+            self.fetch_hn_entries(max_entries)
 
+    @_synchronized
     def fetch_hn_entries(self, max_entries: int) -> None:
         """
         Fetches up to the specified number of entries from the YCombinator news page.
@@ -32,45 +81,476 @@ class HackerNewsScraper:
             list[HackerNewsEntry]: A list of HackerNewsEntry objects.
         """
         # Check time difference
-        time_diff = datetime.datetime.now() - self.last_fetch_time
-        if time_diff.seconds < HN_FETCH_DELAY:
-            logger.warning(f"Please wait for {HN_FETCH_DELAY - time_diff.seconds} seconds before fetching again.")
+        if not self._fetch_delay_elapsed():
             return None
+        self._fetch_hn_entries(max_entries)
+
+    def schedule_fetch(self, max_entries: int, scheduler: FetchScheduler | None = None) -> Future:
+        """
+        Queues a fetch_hn_entries call to run as soon as the crawl delay and the host's rate limit allow, instead of
+        returning early when called too soon. Scheduling the same fetch again while it is still pending returns the
+        pending Future rather than queueing a duplicate. The crawl delay is checked again when the fetch runs, so
+        scheduled fetches of different sizes on the same scraper are still HN_FETCH_DELAY apart.
+
+        Args:
+            max_entries (int): The number of entries to fetch.
+            scheduler (FetchScheduler | None): The scheduler to queue the fetch on. Defaults to the shared one.
+
+        Returns:
+            Future: Resolves to the fetched entries once the fetch has run.
+        """
+        scheduler = scheduler or get_fetch_scheduler()
+        # With a rate limiter of its own, the fetch already waits for the host, so the scheduler must not reserve twice
+        host = None if self.rate_limiter is not None else urlsplit(self.url).netloc
+        return scheduler.submit(('fetch_hn_entries', id(self), max_entries),
+                                functools.partial(self._run_scheduled_fetch, max_entries),
+                                host=host, not_before=time.monotonic() + self._fetch_delay_remaining())
 
+    @_synchronized
+    def _run_scheduled_fetch(self, max_entries: int) -> list[HackerNewsEntry]:
+        # Another fetch may have run since this one was queued
+        remaining = self._fetch_delay_remaining()
+        if remaining > 0:
+            raise Reschedule(remaining)
+        return self._fetch_hn_entries(max_entries)
+
+    async def fetch_hn_entries_scheduled(self, max_entries: int, scheduler: FetchScheduler | None = None) -> list[HackerNewsEntry]:
+        """
+        Awaitable variant of schedule_fetch.
+
+        Returns:
+            list[HackerNewsEntry]: The fetched entries.
+        """
+        import asyncio
+        return await asyncio.wrap_future(self.schedule_fetch(max_entries, scheduler))
+
+    @_synchronized
+    def _fetch_hn_entries(self, max_entries: int) -> list[HackerNewsEntry]:
         # Fetch the HTML content
         # Handle HTTP errors
         try:
-            response = requests.get(HN_URL, HN_HTTP_REQUEST_HEADER)
-            response.raise_for_status()
-        except HTTPError as e:
-            logger.error(f"Failed to fetch HackerNews entries. HTTP Error: {e}")
+            content = self._fetch_page_content(self.url)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch HackerNews entries. Request Error: {e}")
+            self.fetch_error = True
+            self.entries = []
+            return self.entries
+        else:
+            self.fetch_error = False
+
+        self.entries = self._parse_hn_entries(content, max_entries)
+        self.last_fetch_time = datetime.datetime.now()
+        return self.entries
+
+    @_synchronized
+    def crawl_hn_entries(self, max_entries: int, max_workers: int = HN_CRAWL_MAX_WORKERS) -> None:
+        """
+        Fetches up to the specified number of entries by following the YCombinator news page pagination.
+
+        Pages are fetched concurrently by up to max_workers threads, but the start of each page request
+        is spaced by HN_CRAWL_PAGE_DELAY seconds, and the crawl as a whole counts as a single fetch for
+        the HN_FETCH_DELAY check. Entries are appended to self.entries in rank order as soon as every
+        preceding page has been parsed. The crawl stops early when a page yields no entries.
+
+        Args:
+            max_entries (int): The number of entries to fetch.
+            max_workers (int): The maximum number of pages to fetch concurrently.
+
+        Raises:
+            TypeError: If max_entries or max_workers is not an integer.
+            ValueError: If max_workers is less than 1.
+        """
+        if not isinstance(max_entries, int) or not isinstance(max_workers, int):
+            raise TypeError("Expected 'max_entries' and 'max_workers' to be integers.")
+        if max_workers < 1:
+            raise ValueError("Expected 'max_workers' to be at least 1.")
+
+        # Check time difference
+        if not self._fetch_delay_elapsed():
+            return None
+
+        self.fetch_error = False
+        self.entries = []
+        num_pages = -(-max_entries // HN_PAGE_SIZE)
+        page_slot_lock = threading.Lock()
+        next_page_slot = [time.monotonic()]
+
+        def fetch_page(page: int) -> bytes:
+            # Reserve the next request slot so that page requests start HN_CRAWL_PAGE_DELAY seconds apart
+            with page_slot_lock:
+                slot = max(next_page_slot[0], time.monotonic())
+                next_page_slot[0] = slot + HN_CRAWL_PAGE_DELAY
+            time.sleep(max(0, slot - time.monotonic()))
+            return self._fetch_page_content(self.url, page)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            next_page = 1
+            while next_page <= num_pages and len(pending) < max_workers:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+            while pending:
+                future = pending.popleft()
+                try:
+                    content = future.result()
+                except requests.RequestException as e:
+                    logger.error(f"Failed to crawl HackerNews entries. Request Error: {e}")
+                    self.fetch_error = True
+                    break
+                page_entries = self._parse_hn_entries(content, max_entries - len(self.entries))
+                if not page_entries:
+                    break
+                self.entries.extend(page_entries)
+                if len(self.entries) >= max_entries:
+                    break
+                if next_page <= num_pages:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+            for future in pending:
+                future.cancel()
+        self.last_fetch_time = datetime.datetime.now()
+
+    def iter_entries(self, max_entries: int) -> Iterator[HackerNewsEntry]:
+        """
+        Fetches the listing and yields each entry as soon as its rows have been received and parsed.
+
+        The response body is streamed in chunks of HN_STREAM_CHUNK_SIZE bytes through the streaming extractor,
+        whatever the configured parser backend, and the connection is closed as soon as max_entries entries have been
+        yielded. The HTTP cache is not used. Once the generator is exhausted or closed, entries holds the entries
+        yielded so far.
+
+        Args:
+            max_entries (int): The maximum number of entries to yield.
+
+        Yields:
+            HackerNewsEntry: The entries in page order.
+        """
+        # Check time difference
+        if not self._fetch_delay_elapsed():
+            return
+
+        try:
+            response = self.fetch_policy.call(urlsplit(self.url).netloc, self._request_page_stream)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch HackerNews entries. Request Error: {e}")
+            self.fetch_error = True
+            self.entries = []
+            return
+        self.fetch_error = False
+        self.last_fetch_time = datetime.datetime.now()
+
+        entries = []
+        extractor = StreamingEntryExtractor(max_entries)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        try:
+            for chunk in response.iter_content(chunk_size=HN_STREAM_CHUNK_SIZE):
+                extractor.feed(decoder.decode(chunk))
+                for entry in extractor.pop_entries():
+                    entries.append(entry)
+                    yield entry
+                if extractor.done:
+                    return
+            extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+            for entry in extractor.pop_entries():
+                entries.append(entry)
+                yield entry
+        except requests.RequestException as e:
+            # The body can only fail part way, after some entries were yielded, so those are kept
+            logger.error(f"Failed to read HackerNews entries. Request Error: {e}")
+            self.fetch_error = True
+        finally:
+            response.close()
+            self.entries = entries
+
+    @_synchronized
+    def refresh_hn_entries(self, max_entries: int) -> 'EntryChangeSet | None':
+        """
+        Fetches the YCombinator news page again and merges it into the current entries instead of rebuilding them.
+
+        Entries are matched by item id. Entries that are still listed keep their identity and only have their rank,
+        title, points and comment count updated in place. If the fetch fails, the current entries are left untouched.
+
+        Args:
+            max_entries (int): The number of entries to fetch.
+
+        Returns:
+            EntryChangeSet | None: The added, moved, updated and dropped entries, or None if nothing was fetched.
+        """
+        # Check time difference
+        if not self._fetch_delay_elapsed():
+            return None
+
+        try:
+            content = self._fetch_page_content(self.url)
+        except requests.RequestException as e:
+            logger.error(f"Failed to refresh HackerNews entries. Request Error: {e}")
+            self.fetch_error = True
+            return None
+        else:
+            self.fetch_error = False
+
+        from src.models.entry_diff import merge_entries
+        fresh = self._parse_hn_entries(content, max_entries)
+        self.entries, changes = merge_entries(self.entries, fresh)
+        self.last_fetch_time = datetime.datetime.now()
+        return changes
+
+    def crawl_comment_threads(self, crawler: 'CommentCrawler | None' = None) -> 'dict[int, CommentThread]':
+        """
+        Fetches the discussion page of every current entry that has an item id.
+
+        Args:
+            crawler (CommentCrawler | None): The crawler to use. Defaults to one sharing this scraper's rate limiter,
+                or the shared host rate limiter if the scraper has none.
+
+        Returns:
+            dict[int, CommentThread]: The comment threads by item id, in entry order.
+        """
+        from src.models.comment_thread import CommentCrawler
+        with self._lock:
+            entries = list(self.entries)
+        crawler = crawler or CommentCrawler(rate_limiter=self.rate_limiter, http_cache=self.http_cache)
+        return crawler.crawl(entries)
+
+    async def fetch_hn_entries_async(self, max_entries: int, pool: 'AsyncHttpPool | None' = None) -> None:
+        """
+        Asynchronous variant of fetch_hn_entries that does not block the event loop.
+
+        Args:
+            max_entries (int): The number of entries to fetch.
+            pool (AsyncHttpPool | None): The connection pool to fetch through. Defaults to the shared pool.
+        """
+        # Check time difference
+        if not self._fetch_delay_elapsed():
+            return None
+
+        import asyncio
+        from src.utils.async_http import get_shared_pool
+        pool = pool or get_shared_pool()
+        host = urlsplit(self.url).netloc
+
+        async def fetch_page() -> bytes:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(host))
+            return await pool.get(self.url)
+
+        try:
+            content = await self.fetch_policy.call_async(host, fetch_page)
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch HackerNews entries. Request Error: {e}")
             self.fetch_error = True
             self.entries = []
             return
         else:
             self.fetch_error = False
 
-        # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        title_containers = soup.find_all(HN_ENTRY_START_TAG, class_=HN_ENTRY_START_CLASS, limit=max_entries)
-        
-        # TODO: This is functional, but it would be better to have some indication
-        # in constants.py of underlying HTML structure after each row to make it
-        # more resilient to changes. Consider some refactoring.
+        self.entries = await asyncio.to_thread(self._parse_hn_entries, content, max_entries)
+        self.last_fetch_time = datetime.datetime.now()
+
+    async def crawl_hn_entries_async(self, max_entries: int, max_workers: int = HN_CRAWL_MAX_WORKERS,
+                                     pool: 'AsyncHttpPool | None' = None) -> None:
+        """
+        Asynchronous variant of crawl_hn_entries. Every page is fetched through the same connection pool.
+
+        Args:
+            max_entries (int): The number of entries to fetch.
+            max_workers (int): The maximum number of pages to fetch concurrently.
+            pool (AsyncHttpPool | None): The connection pool to fetch through. Defaults to the shared pool.
+
+        Raises:
+            TypeError: If max_entries or max_workers is not an integer.
+            ValueError: If max_workers is less than 1.
+        """
+        if not isinstance(max_entries, int) or not isinstance(max_workers, int):
+            raise TypeError("Expected 'max_entries' and 'max_workers' to be integers.")
+        if max_workers < 1:
+            raise ValueError("Expected 'max_workers' to be at least 1.")
+
+        # Check time difference
+        if not self._fetch_delay_elapsed():
+            return None
+
+        import asyncio
+        from src.utils.async_http import get_shared_pool
+        pool = pool or get_shared_pool()
+        self.fetch_error = False
         self.entries = []
-        for container in title_containers:
-            title: str | None = self._extract_title(container)
-            order_num: int | None = self._extract_order_num(container)
-            comment_count: int | None = None
-            points: int | None = None
-            subtext_container = container.find_next_sibling('tr').find('td', class_='subtext')
-            if subtext_container:
-                comment_count = self._extract_comment_count(subtext_container)
-                points = self._extract_points(subtext_container)
-            entry = HackerNewsEntry(title=title, order_num=order_num, comment_count=comment_count, points=points)
-            self.entries.append(entry)
+        num_pages = -(-max_entries // HN_PAGE_SIZE)
+        next_page_slot = time.monotonic()
+
+        host = urlsplit(self.url).netloc
+
+        async def request_page(params: dict | None) -> bytes:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(host))
+            return await pool.get(self.url, params)
+
+        async def fetch_page(page: int, slot: float) -> bytes:
+            await asyncio.sleep(max(0, slot - time.monotonic()))
+            params = {HN_PAGE_PARAM: page} if page > 1 else None
+            return await self.fetch_policy.call_async(host, request_page, params)
+
+        def schedule(page: int) -> asyncio.Task:
+            # Reserve the next request slot so that page requests start HN_CRAWL_PAGE_DELAY seconds apart
+            nonlocal next_page_slot
+            slot = max(next_page_slot, time.monotonic())
+            next_page_slot = slot + HN_CRAWL_PAGE_DELAY
+            return asyncio.create_task(fetch_page(page, slot))
+
+        pending = deque()
+        next_page = 1
+        while next_page <= num_pages and len(pending) < max_workers:
+            pending.append(schedule(next_page))
+            next_page += 1
+        try:
+            while pending:
+                try:
+                    content = await pending.popleft()
+                except requests.RequestException as e:
+                    logger.error(f"Failed to crawl HackerNews entries. Request Error: {e}")
+                    self.fetch_error = True
+                    break
+                page_entries = await asyncio.to_thread(self._parse_hn_entries, content, max_entries - len(self.entries))
+                if not page_entries:
+                    break
+                self.entries.extend(page_entries)
+                if len(self.entries) >= max_entries:
+                    break
+                if next_page <= num_pages:
+                    pending.append(schedule(next_page))
+                    next_page += 1
+        finally:
+            for task in pending:
+                task.cancel()
         self.last_fetch_time = datetime.datetime.now()
 
+    def _fetch_delay_elapsed(self) -> bool:
+        """
+        Checks whether HN_FETCH_DELAY seconds have passed since the last fetch, logging a warning if not.
+
+        Returns:
+            bool: True if a new fetch may be made, False otherwise.
+        """
+        remaining = self._fetch_delay_remaining()
+        if remaining > 0:
+            logger.warning(f"Please wait for {math.ceil(remaining)} seconds before fetching again.")
+            return False
+        return True
+
+    def _fetch_delay_remaining(self) -> float:
+        """
+        Returns the seconds left before HN_FETCH_DELAY has passed since the last fetch, or 0 if it already has.
+        """
+        time_diff = datetime.datetime.now() - self.last_fetch_time
+        return max(0.0, HN_FETCH_DELAY - time_diff.total_seconds())
+
+    def _fetch_page_content(self, url: str, page: int | None = None) -> bytes:
+        """
+        Fetches the raw HTML content of a Hacker News listing page, through the HTTP cache if there is one.
+
+        Args:
+            url (str): The URL of the listing.
+            page (int | None): The page number to request, or None for the first page without pagination.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            RequestException: If the request failed after the retries of the fetch policy, for instance because the
+                server responds with an error status or does not answer within the timeouts.
+        """
+        host = urlsplit(url).netloc
+        try:
+            if not metrics.enabled:
+                content = self.fetch_policy.call(host, self._request_page_content, url, page)
+            else:
+                with HTTP_REQUEST_SECONDS.time(phase='total'):
+                    content = self.fetch_policy.call(host, self._request_page_content, url, page)
+        except requests.RequestException as e:
+            self.last_fetch_exception = e
+            raise
+        self.last_fetch_exception = None
+        return content
+
+    def _request_page_content(self, url: str, page: int | None) -> bytes:
+        params = {HN_PAGE_PARAM: page} if page is not None and page > 1 else None
+        if self.rate_limiter is not None:
+            time.sleep(self.rate_limiter.reserve(urlsplit(url).netloc))
+        if self.http_cache is not None:
+            return self.http_cache.get(functools.partial(requests.get, timeout=self.fetch_policy.timeout), url,
+                                       params=params, headers=HN_HTTP_REQUEST_HEADER)
+        start = time.perf_counter() if metrics.enabled else 0.0
+        response = requests.get(url, params=params, headers=HN_HTTP_REQUEST_HEADER, timeout=self.fetch_policy.timeout)
+        if metrics.enabled and isinstance(response.elapsed, datetime.timedelta):
+            # response.elapsed stops when the headers are parsed; the rest of the call read the body
+            headers = response.elapsed.total_seconds()
+            HTTP_REQUEST_SECONDS.observe(headers, phase='headers')
+            HTTP_REQUEST_SECONDS.observe(max(0.0, time.perf_counter() - start - headers), phase='transfer')
+        response.raise_for_status()
+        return response.content
+
+    def _request_page_stream(self) -> requests.Response:
+        if self.rate_limiter is not None:
+            time.sleep(self.rate_limiter.reserve(urlsplit(self.url).netloc))
+        response = requests.get(self.url, headers=HN_HTTP_REQUEST_HEADER, stream=True, timeout=self.fetch_policy.timeout)
+        response.raise_for_status()
+        return response
+
+    @_synchronized
+    def _parse_hn_entries(self, content: bytes | str, max_entries: int) -> list[HackerNewsEntry]:
+        """
+        Parses up to max_entries entries out of the HTML content of a Hacker News listing page.
+        A body identical to one parsed recently is not parsed again.
+
+        Args:
+            content (bytes | str): The HTML content.
+            max_entries (int): The maximum number of entries to parse.
+
+        Returns:
+            list[HackerNewsEntry]: The parsed entries in page order.
+        """
+        key = (content_hash(content), max_entries)
+        entries = self._parse_cache.get(key)
+        if entries is None:
+            if metrics.enabled:
+                start = time.perf_counter()
+                entries = self.parser.parse(content, max_entries)
+                elapsed = time.perf_counter() - start
+                backend = self.parser.name
+                PARSE_SECONDS.observe(elapsed, backend=backend)
+                ROWS_EXTRACTED.inc(len(entries), backend=backend)
+                if entries:
+                    PARSE_SECONDS_PER_ENTRY.observe(elapsed / len(entries), backend=backend)
+            else:
+                entries = self.parser.parse(content, max_entries)
+            self._parse_cache[key] = entries
+            while len(self._parse_cache) > HN_PARSE_CACHE_MAX_ENTRIES:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(key)
+            PARSE_CACHE_HITS.inc()
+        # Hand out copies, since entries can be modified in place after they are returned
+        return [entry.copy() for entry in entries]
+
+    def query(self) -> 'EntryQuery':
+        """
+        Starts a lazy query over the current entries. Unlike the filter and sort methods, queries never modify entries.
+
+        Returns:
+            EntryQuery: A query over the current entries.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        # Check if the input is a list of HackerNewsEntry objects
+        if not self._validate_hnentry_list_type(self.entries):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        from src.models.entry_query import EntryQuery
+        return EntryQuery(self.entries)
+
+    @_synchronized
+    @timed(ENTRY_OPERATION_SECONDS, operation='filter_by_min_title_length')
     def filter_by_min_title_length(self, min_words: int) -> None:
         """
         Filters entries based on number of words in their titles.
@@ -93,8 +573,10 @@ class HackerNewsScraper:
         if min_words <= 0:
             self.entries = []
         # Filter entries based on title length
-        self.entries = [entry for entry in self.entries if len(entry.title.split()) > min_words]
+        self.entries = [entry for entry in self.entries if entry.word_count > min_words]
     
+    @_synchronized
+    @timed(ENTRY_OPERATION_SECONDS, operation='filter_by_max_title_length')
     def filter_by_max_title_length(self, max_words: int) -> None:
         """
         Filters entries based on the maximum number of words in their titles.
@@ -119,8 +601,10 @@ class HackerNewsScraper:
             self.entries = []
 
         # Filter entries based on title length
-        self.entries = [entry for entry in self.entries if len(entry.title.split()) <= max_words]
+        self.entries = [entry for entry in self.entries if entry.word_count <= max_words]
 
+    @_synchronized
+    @timed(ENTRY_OPERATION_SECONDS, operation='sort_by_comments')
     def sort_by_comments(self) -> None:
         """
         Sorts entries based on their comment_count attribute in descending order.
@@ -137,6 +621,8 @@ class HackerNewsScraper:
         # Sort the entries based on the comment_count attribute in descending order
         self.entries = sorted(self.entries, key=lambda x: x.comment_count, reverse=True)
 
+    @_synchronized
+    @timed(ENTRY_OPERATION_SECONDS, operation='sort_by_points')
     def sort_by_points(self) -> None:
         """
         Sorts entries by their points in descending order.
@@ -162,34 +648,36 @@ class HackerNewsScraper:
             return False
 
         return all(isinstance(entry, HackerNewsEntry) for entry in entries)
-    
-    @staticmethod
-    def _extract_numeric_chars(s: str) -> str:
-        return ''.join(filter(str.isdigit, s))
 
-    @staticmethod
-    def _extract_title(container) -> str | None:
-        title_container = container.find(HN_TITLE_TAG, class_=HN_TITLE_CLASS)
-        return title_container.a.text if title_container and title_container.a else None
+class HackerNewsFeedScraper(HackerNewsScraper):
+    """
+    Independent scraper for one Hacker News listing feed.
 
-    @staticmethod
-    def _extract_order_num(container) -> int | None:
-        order_num_container = container.find(HN_ORDER_NUM_TAG, class_=HN_ORDER_NUM_CLASS)
-        if order_num_container and any(char.isdigit() for char in order_num_container.text):
-            return int(HackerNewsScraper._extract_numeric_chars(order_num_container.text))
-        return None
+    Unlike HackerNewsScraper, every instance is a separate object with its own URL, entries and crawl delay, and
+    each instance can be shared between threads. Requests from all instances go through a shared per-host rate
+    limiter, so scraping several feeds at the same time stays polite to the host.
+    """
+    def __new__(cls, *args, **kwargs):
+        return object.__new__(cls)
 
-    @staticmethod
-    def _extract_comment_count(container) -> int | None:
-        a_containers = container.find_all(HN_COMMENT_COUNT_TAG)
-        for container in a_containers:
-            if 'comment' in container.text and any(char.isdigit() for char in container.text):
-                return int(HackerNewsScraper._extract_numeric_chars(container.text))
-        return 0
+    def __init__(self, feed: str = 'news', max_entries: int = HN_MAX_ENTRIES, parser: str = HN_PARSER_BACKEND,
+                 http_cache: HttpCache | None = None, rate_limiter: HostRateLimiter | None = None, fetch: bool = True,
+                 fetch_policy: FetchPolicy | None = None):
+        """
+        Args:
+            feed (str): One of the keys of HN_FEED_URLS.
+            max_entries (int): The number of entries to fetch on construction.
+            parser (str): The parser backend.
+            http_cache (HttpCache | None): Optional HTTP cache.
+            rate_limiter (HostRateLimiter | None): The per-host rate limiter. Defaults to the shared one.
+            fetch (bool): Whether to fetch the feed on construction.
+            fetch_policy (FetchPolicy | None): Timeouts, retries and circuit breakers. Defaults to the shared policy.
 
-    @staticmethod
-    def _extract_points(container) -> int | None:
-        points_container = container.find('span', class_='score')
-        if points_container and any(char.isdigit() for char in points_container.text):
-            return int(HackerNewsScraper._extract_numeric_chars(points_container.text))
-        return None
\ No newline at end of file
+        Raises:
+            ValueError: If feed is not a known feed.
+        """
+        if feed not in HN_FEED_URLS:
+            raise ValueError(f"Unknown feed '{feed}'. Expected one of {', '.join(HN_FEED_URLS)}.")
+        self.feed: str = feed
+        super().__init__(max_entries, parser, http_cache, url=HN_FEED_URLS[feed],
+                         rate_limiter=rate_limiter or get_host_rate_limiter(), fetch=fetch, fetch_policy=fetch_policy)
@@ -0,0 +1,190 @@
+import threading
+import time
+from typing import Callable
+from requests.exceptions import HTTPError
+from src.constants import (HN_MAX_ENTRIES, WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL, WATCH_INITIAL_INTERVAL,
+                           WATCH_HIGH_CHANGE_RATIO, WATCH_LOW_CHANGE_RATIO, WATCH_SPEEDUP_FACTOR,
+                           WATCH_SLOWDOWN_FACTOR, WATCH_ERROR_BACKOFF_FACTOR, WATCH_THROTTLE_BACKOFF_FACTOR,
+                           WATCH_THROTTLE_STATUS_CODES)
+from src.models.entry_diff import EntryChangeSet
+from src.models.entry_store import EntryStore
+from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_scraper import HackerNewsScraper
+from src.utils.log_config import setup_logger
+
+logger = setup_logger(__name__)
+
+class WatchResult:
+    """
+    Outcome of one polling cycle, handed to the watcher's sinks.
+    """
+    __slots__ = ('cycle', 'fetched_at', 'entries', 'changes', 'error', 'next_interval')
+
+    def __init__(self, cycle: int, fetched_at: float, entries: list[HackerNewsEntry], changes: EntryChangeSet | None,
+                 error: Exception | None, next_interval: float):
+        """
+        Args:
+            cycle (int): The number of the cycle, starting at 1.
+            fetched_at (float): When the cycle ran, in epoch seconds.
+            entries (list[HackerNewsEntry]): The scraper's entries after the cycle.
+            changes (EntryChangeSet | None): What changed since the previous cycle, or None if nothing was fetched.
+            error (Exception | None): The error that made the fetch fail, if it failed.
+            next_interval (float): Seconds until the next cycle.
+        """
+        self.cycle = cycle
+        self.fetched_at = fetched_at
+        self.entries = entries
+        self.changes = changes
+        self.error = error
+        self.next_interval = next_interval
+
+    def __repr__(self):
+        changes = 'None' if self.changes is None else (f"{len(self.changes.added)} added, {len(self.changes.moved)} moved, "
+                                                       f"{len(self.changes.updated)} updated, {len(self.changes.dropped)} dropped")
+        return f"<WatchResult(cycle={self.cycle}, changes={changes}, error={self.error!r}, next_interval={self.next_interval:.0f})>"
+
+# Signature of watcher sinks: called with the result of every cycle
+WatchSink = Callable[[WatchResult], None]
+
+def print_sink(result: WatchResult) -> None:
+    """
+    Sink that prints a one-line summary of each cycle.
+    """
+    print(result)
+
+class EntryStoreSink:
+    """
+    Sink that records the entries of every successful cycle as a snapshot in an EntryStore.
+    """
+    def __init__(self, store: EntryStore, url: str | None = None):
+        """
+        Args:
+            store (EntryStore): The store snapshots are written to.
+            url (str | None): The URL recorded with each snapshot. Defaults to the URL of the store's default.
+        """
+        self.store = store
+        self.url = url
+
+    def __call__(self, result: WatchResult) -> None:
+        if result.changes is None:
+            return
+        if self.url is None:
+            self.store.record_snapshot(result.entries, result.fetched_at)
+        else:
+            self.store.record_snapshot(result.entries, result.fetched_at, self.url)
+
+class HackerNewsWatcher:
+    """
+    Long-running poller that refreshes a scraper on an adaptive schedule.
+
+    After each successful cycle, the interval is shortened when a large share of the front page changed and
+    lengthened when little did, within WATCH_MIN_INTERVAL and WATCH_MAX_INTERVAL. Failed fetches back off
+    exponentially, faster still when the server answers 429 or 503, honouring its Retry-After header, and the first
+    successful cycle after them returns to the interval in effect before the errors. Each cycle's
+    result is passed to every sink and then dropped, and the scraper merges each refresh into its current entries,
+    so memory use stays flat however long the watcher runs.
+    """
+    def __init__(self, scraper: HackerNewsScraper, sinks: list[WatchSink] | None = None,
+                 max_entries: int = HN_MAX_ENTRIES, min_interval: float = WATCH_MIN_INTERVAL,
+                 max_interval: float = WATCH_MAX_INTERVAL, initial_interval: float = WATCH_INITIAL_INTERVAL):
+        """
+        Args:
+            scraper (HackerNewsScraper): The scraper to refresh. Its own fetch delay still applies, so min_interval
+                should not be shorter than HN_FETCH_DELAY.
+            sinks (list[WatchSink] | None): Callables that receive the result of every cycle.
+            max_entries (int): The number of entries to fetch each cycle.
+            min_interval (float): The shortest time between two cycles in seconds.
+            max_interval (float): The longest time between two cycles in seconds, also the cap of error backoff.
+            initial_interval (float): The time between the first two cycles in seconds.
+
+        Raises:
+            ValueError: If the intervals are not positive or not in order.
+        """
+        if not 0 < min_interval <= initial_interval <= max_interval:
+            raise ValueError("Expected 0 < 'min_interval' <= 'initial_interval' <= 'max_interval'.")
+        self.scraper = scraper
+        self.sinks: list[WatchSink] = list(sinks or [])
+        self.max_entries = max_entries
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = initial_interval
+        self.cycle = 0
+        self.consecutive_errors = 0
+        # Interval in effect before the current run of errors, restored by the next successful cycle
+        self._healthy_interval = initial_interval
+        self._stop = threading.Event()
+
+    def poll_once(self) -> WatchResult:
+        """
+        Runs one cycle: refreshes the scraper, adapts the interval and passes the result to the sinks.
+
+        Returns:
+            WatchResult: The result of the cycle.
+        """
+        self.cycle += 1
+        fetched_at = time.time()
+        # A refresh into an empty scraper only sets the baseline, so it says nothing about how busy the page is
+        had_entries = bool(self.scraper.entries)
+        changes = self.scraper.refresh_hn_entries(self.max_entries)
+        error = self.scraper.last_fetch_exception if self.scraper.fetch_error else None
+
+        if error is not None:
+            self._back_off(error)
+        elif changes is not None:
+            if self.consecutive_errors:
+                self.consecutive_errors = 0
+                self.interval = self._healthy_interval
+            elif had_entries:
+                self._adapt(changes)
+
+        result = WatchResult(self.cycle, fetched_at, self.scraper.entries, changes, error, self.interval)
+        for sink in self.sinks:
+            try:
+                sink(result)
+            except Exception as e:
+                logger.error(f"Watch sink {sink!r} failed: {e}", exc_info=1)
+        return result
+
+    def run(self, max_cycles: int | None = None) -> None:
+        """
+        Polls until stop() is called or max_cycles cycles have run.
+
+        Args:
+            max_cycles (int | None): The number of cycles to run, or None to run until stopped.
+        """
+        self._stop.clear()
+        cycles = 0
+        while not self._stop.is_set():
+            result = self.poll_once()
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                return
+            self._stop.wait(result.next_interval)
+
+    def stop(self) -> None:
+        """
+        Makes run() return, interrupting the wait for the next cycle.
+        """
+        self._stop.set()
+
+    def _adapt(self, changes: EntryChangeSet) -> None:
+        total = max(len(self.scraper.entries), 1)
+        change_ratio = (len(changes.added) + len(changes.moved) + len(changes.dropped)) / total
+        if change_ratio >= WATCH_HIGH_CHANGE_RATIO:
+            self.interval /= WATCH_SPEEDUP_FACTOR
+        elif change_ratio <= WATCH_LOW_CHANGE_RATIO:
+            self.interval *= WATCH_SLOWDOWN_FACTOR
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+    def _back_off(self, error: Exception) -> None:
+        if not self.consecutive_errors:
+            self._healthy_interval = self.interval
+        self.consecutive_errors += 1
+        response = error.response if isinstance(error, HTTPError) else None
+        throttled = response is not None and response.status_code in WATCH_THROTTLE_STATUS_CODES
+        factor = WATCH_THROTTLE_BACKOFF_FACTOR if throttled else WATCH_ERROR_BACKOFF_FACTOR
+        interval = self.interval * factor
+        retry_after = response.headers.get('Retry-After') if throttled else None
+        if retry_after is not None and retry_after.strip().isdigit():
+            interval = max(interval, int(retry_after))
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
@@ -0,0 +1,170 @@
+import heapq
+from operator import attrgetter
+from typing import Callable, Iterable
+from src.constants import RANKING_GRAVITY, RANKING_GRAVITY_AGE_OFFSET_HOURS
+from src.models.hn_entry import HackerNewsEntry
+
+# Signature of scoring functions: higher scores rank first
+ScoreFunction = Callable[[HackerNewsEntry], float]
+
+# Entry fields that can be used as sort keys by name
+FIELD_KEYS: dict[str, Callable[[HackerNewsEntry], int]] = {
+    'comments': attrgetter('comment_count'),
+    'comment_count': attrgetter('comment_count'),
+    'points': attrgetter('points'),
+    'order_num': attrgetter('order_num'),
+    'word_count': attrgetter('word_count'),
+}
+
+def gravity_score(age: Callable[[HackerNewsEntry], float | None] | None = None, gravity: float = RANKING_GRAVITY,
+                  age_offset_hours: float = RANKING_GRAVITY_AGE_OFFSET_HOURS) -> ScoreFunction:
+    """
+    Builds the Hacker News front page formula, (points - 1) / (age in hours + age_offset_hours) ** gravity, so that
+    stories sink as they get older.
+
+    Args:
+        age (Callable[[HackerNewsEntry], float | None] | None): Returns the age of an entry in seconds, or None if
+            it is unknown. Defaults to the time since the entry's posted_at. Entries of unknown age score
+            negative infinity, so that they rank after every dated entry instead of as brand new stories.
+        gravity (float): How quickly scores decay with age.
+        age_offset_hours (float): Added to the age so that brand new stories do not get unbounded scores.
+
+    Returns:
+        ScoreFunction: The scoring function.
+
+    Raises:
+        TypeError: If age is neither callable nor None.
+    """
+    if age is None:
+        age = _age_since_posted
+    elif not callable(age):
+        raise TypeError("Expected 'age' to be callable.")
+
+    def score(entry: HackerNewsEntry) -> float:
+        entry_age = age(entry)
+        if entry_age is None:
+            return float('-inf')
+        return (entry.points - 1) / (max(entry_age, 0) / 3600 + age_offset_hours) ** gravity
+    return score
+
+def _age_since_posted(entry: HackerNewsEntry) -> float | None:
+    return entry.age()
+
+def points_per_comment_score(smoothing: float = 1) -> ScoreFunction:
+    """
+    Builds a score of points per comment, points / (comment_count + smoothing), which favours stories that are
+    upvoted more than they are discussed.
+
+    Args:
+        smoothing (float): Added to the comment count so that stories without comments do not divide by zero.
+
+    Returns:
+        ScoreFunction: The scoring function.
+
+    Raises:
+        ValueError: If smoothing is not greater than 0.
+    """
+    if smoothing <= 0:
+        raise ValueError("Expected 'smoothing' to be greater than 0.")
+    return lambda entry: entry.points / (entry.comment_count + smoothing)
+
+# Built-in scoring formulas by name, called with their keyword arguments to build a ScoreFunction
+SCORE_FORMULAS: dict[str, Callable[..., ScoreFunction]] = {
+    'gravity': gravity_score,
+    'points_per_comment': points_per_comment_score,
+}
+
+def get_score_function(score: str | ScoreFunction, **options) -> ScoreFunction:
+    """
+    Resolves a scoring function from a callable, a field name or a built-in formula name.
+
+    Args:
+        score (str | ScoreFunction): A callable returning a number, a key of FIELD_KEYS, or a key of SCORE_FORMULAS.
+        **options: Keyword arguments of the built-in formula, such as age for 'gravity'.
+
+    Returns:
+        ScoreFunction: The scoring function.
+
+    Raises:
+        ValueError: If score is an unknown name.
+        TypeError: If score is neither a name nor callable, or options are given for a callable or a field.
+    """
+    if isinstance(score, str):
+        if score in SCORE_FORMULAS:
+            return SCORE_FORMULAS[score](**options)
+        if score not in FIELD_KEYS:
+            raise ValueError(f"Unknown score '{score}'. Expected one of {', '.join([*FIELD_KEYS, *SCORE_FORMULAS])}.")
+        score = FIELD_KEYS[score]
+    elif not callable(score):
+        raise TypeError("Expected 'score' to be a name or a callable.")
+    if options:
+        raise TypeError(f"Unexpected options for score: {', '.join(options)}.")
+    return score
+
+def top_k(entries: Iterable[HackerNewsEntry], k: int, score: str | ScoreFunction = 'points',
+          with_scores: bool = False, **options) -> list:
+    """
+    Selects the k highest scoring entries with a heap, in O(n log k) time and O(k) memory, instead of sorting every
+    entry. Entries with equal scores keep their relative order.
+
+    Args:
+        entries (Iterable[HackerNewsEntry]): The entries to rank. They are read once, never modified.
+        k (int): The number of entries to return.
+        score (str | ScoreFunction): The score to rank by, as accepted by get_score_function.
+        with_scores (bool): Return (score, entry) tuples instead of entries.
+        **options: Keyword arguments of a built-in formula.
+
+    Returns:
+        list: The top entries, or (score, entry) tuples, highest score first.
+
+    Raises:
+        TypeError: If k is not an integer.
+        ValueError: If k is negative.
+    """
+    if not isinstance(k, int):
+        raise TypeError("Expected 'k' to be an integer.")
+    if k < 0:
+        raise ValueError("Expected 'k' to be zero or greater.")
+    score = get_score_function(score, **options)
+    if not with_scores:
+        return heapq.nlargest(k, entries, key=score)
+    scored = ((score(entry), entry) for entry in entries)
+    return heapq.nlargest(k, scored, key=lambda pair: pair[0])
+
+def sort_entries(entries: Iterable[HackerNewsEntry], *keys: str | ScoreFunction | tuple[str | ScoreFunction, bool],
+                 limit: int | None = None) -> list[HackerNewsEntry]:
+    """
+    Stable sort over several keys, e.g. sort_entries(entries, 'points', ('order_num', False)) sorts by points in
+    descending order, then by order_num in ascending order. Entries equal on every key keep their relative order.
+
+    Args:
+        entries (Iterable[HackerNewsEntry]): The entries to sort. They are read, never modified.
+        *keys: Sort keys, most significant first. Each is a name or callable as accepted by get_score_function,
+            sorted in descending order, or a (key, descending) tuple.
+        limit (int | None): Keep only the first limit entries, selected with a heap instead of a full sort.
+            Keys must then return numbers.
+
+    Returns:
+        list[HackerNewsEntry]: A new sorted list.
+
+    Raises:
+        ValueError: If no key is given, or limit is negative.
+    """
+    if not keys:
+        raise ValueError("Expected at least one sort key.")
+    resolved = []
+    for key in keys:
+        key, descending = key if isinstance(key, tuple) else (key, True)
+        resolved.append((get_score_function(key), descending))
+
+    if limit is None:
+        # Sorting from the least to the most significant key relies on each pass being stable
+        rows = list(entries)
+        for key, descending in reversed(resolved):
+            rows.sort(key=key, reverse=descending)
+        return rows
+    if limit < 0:
+        raise ValueError("Expected 'limit' to be zero or greater.")
+    # nsmallest breaks ties by input position, so negating descending keys keeps the selection stable
+    return heapq.nsmallest(limit, entries,
+                           key=lambda entry: tuple(-key(entry) if descending else key(entry) for key, descending in resolved))
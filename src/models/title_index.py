@@ -0,0 +1,117 @@
+from bisect import bisect_right
+from heapq import merge
+from src.models.hn_entry import HackerNewsEntry
+
+class TitleLengthIndex:
+    """
+    Sorted index of entries by the number of words in their titles.
+
+    Title length queries are answered with two bisections over the sorted word counts instead of a scan over every
+    entry. Queries follow the same rules as the scraper's title length filters: a title matches a minimum when it has
+    more than min_words words, a maximum when it has at most max_words words, and a bound less than or equal to zero
+    matches nothing. Results are returned in the order the entries were added.
+    """
+    __slots__ = ('_entries', '_word_counts', '_positions')
+
+    def __init__(self, entries: list[HackerNewsEntry] | None = None):
+        """
+        Args:
+            entries (list[HackerNewsEntry] | None): The entries to index.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        self._entries: list[HackerNewsEntry] = []
+        # Sorted word counts, and the position in _entries of the entry each one belongs to
+        self._word_counts: list[int] = []
+        self._positions: list[int] = []
+        if entries is not None:
+            self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: HackerNewsEntry) -> None:
+        """
+        Adds a single entry to the index.
+
+        Raises:
+            TypeError: If entry is not a HackerNewsEntry.
+        """
+        if not isinstance(entry, HackerNewsEntry):
+            raise TypeError("Expected a HackerNewsEntry, but got a different type.")
+        # Inserting to the right of equal word counts keeps ties in insertion order
+        i = bisect_right(self._word_counts, entry.word_count)
+        self._word_counts.insert(i, entry.word_count)
+        self._positions.insert(i, len(self._entries))
+        self._entries.append(entry)
+
+    def extend(self, entries: list[HackerNewsEntry]) -> None:
+        """
+        Adds several entries to the index. Only the new entries are sorted; they are then merged into the sorted
+        index in linear time, so adding a batch to a large index does not re-sort it.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        if not isinstance(entries, list) or not all(isinstance(entry, HackerNewsEntry) for entry in entries):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        start = len(self._entries)
+        self._entries.extend(entries)
+        # New positions are all greater than the indexed ones, so ties stay in insertion order
+        added = sorted((entry.word_count, start + i) for i, entry in enumerate(entries))
+        merged = list(merge(zip(self._word_counts, self._positions), added))
+        self._word_counts = [word_count for word_count, _ in merged]
+        self._positions = [position for _, position in merged]
+
+    def longer_than(self, min_words: int) -> list[HackerNewsEntry]:
+        """
+        Returns the entries whose titles have more than min_words words.
+        """
+        return self.between(min_words, None)
+
+    def at_most(self, max_words: int) -> list[HackerNewsEntry]:
+        """
+        Returns the entries whose titles have at most max_words words.
+        """
+        return self.between(None, max_words)
+
+    def between(self, min_words: int | None, max_words: int | None) -> list[HackerNewsEntry]:
+        """
+        Returns the entries whose titles have more than min_words and at most max_words words.
+
+        Args:
+            min_words (int | None): The exclusive lower bound, or None for no lower bound.
+            max_words (int | None): The inclusive upper bound, or None for no upper bound.
+
+        Returns:
+            list[HackerNewsEntry]: The matching entries, in the order they were added.
+
+        Raises:
+            TypeError: If a bound is neither an integer nor None.
+        """
+        return [self._entries[position] for position in self.positions_between(min_words, max_words)]
+
+    def positions_between(self, min_words: int | None, max_words: int | None) -> list[int]:
+        """
+        Returns the positions, in insertion order, of the entries that between(min_words, max_words) would return.
+        """
+        lo, hi = self._slice(min_words, max_words)
+        return sorted(self._positions[lo:hi])
+
+    def count_between(self, min_words: int | None, max_words: int | None) -> int:
+        """
+        Returns the number of entries that between(min_words, max_words) would return, without building the list.
+        """
+        lo, hi = self._slice(min_words, max_words)
+        return hi - lo
+
+    def _slice(self, min_words: int | None, max_words: int | None) -> tuple[int, int]:
+        for name, value in (('min_words', min_words), ('max_words', max_words)):
+            if value is not None and not isinstance(value, int):
+                raise TypeError(f"Expected '{name}' to be an integer or None.")
+        if (min_words is not None and min_words <= 0) or (max_words is not None and max_words <= 0):
+            return 0, 0
+        lo = 0 if min_words is None else bisect_right(self._word_counts, min_words)
+        hi = len(self._word_counts) if max_words is None else bisect_right(self._word_counts, max_words)
+        return lo, max(lo, hi)
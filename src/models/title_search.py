@@ -0,0 +1,144 @@
+import re
+from bisect import bisect_left, insort
+from typing import Iterable
+from src.models.hn_entry import HackerNewsEntry
+from src.models.title_index import TitleLengthIndex
+
+# Title tokens: runs of letters, digits and underscores, matched case-insensitively
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into the lowercase tokens used by TitleSearchIndex.
+    """
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+class TitleSearchIndex:
+    """
+    Inverted index over the tokens of entry titles.
+
+    Each entry gets an id, its position in the order entries were added, and every token maps to the sorted list of
+    ids whose titles contain it. Adding entries only appends to these lists, so the index grows with the archive
+    without being rebuilt. A search turns each criterion into a set of ids, including the title length bounds through
+    a TitleLengthIndex kept alongside, and intersects them starting from the smallest set.
+    """
+    __slots__ = ('_entries', '_tokens', '_postings', '_vocabulary', '_lengths')
+
+    def __init__(self, entries: list[HackerNewsEntry] | None = None):
+        """
+        Args:
+            entries (list[HackerNewsEntry] | None): The entries to index.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        self._entries: list[HackerNewsEntry] = []
+        # Tokens of each title, kept to verify phrase matches
+        self._tokens: list[tuple[str, ...]] = []
+        self._postings: dict[str, list[int]] = {}
+        # Sorted distinct tokens, searched with bisect for prefix queries
+        self._vocabulary: list[str] = []
+        self._lengths = TitleLengthIndex()
+        if entries is not None:
+            self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: HackerNewsEntry) -> None:
+        """
+        Adds a single entry to the index.
+
+        Raises:
+            TypeError: If entry is not a HackerNewsEntry.
+        """
+        if not isinstance(entry, HackerNewsEntry):
+            raise TypeError("Expected a HackerNewsEntry, but got a different type.")
+        self._add(entry)
+        self._lengths.add(entry)
+
+    def extend(self, entries: list[HackerNewsEntry]) -> None:
+        """
+        Adds several entries to the index.
+
+        Raises:
+            TypeError: If entries is not a list of HackerNewsEntry objects.
+        """
+        if not isinstance(entries, list) or not all(isinstance(entry, HackerNewsEntry) for entry in entries):
+            raise TypeError("Expected a list of HackerNewsEntry, but got a different type.")
+        for entry in entries:
+            self._add(entry)
+        self._lengths.extend(entries)
+
+    def _add(self, entry: HackerNewsEntry) -> None:
+        entry_id = len(self._entries)
+        tokens = tuple(tokenize(entry.title))
+        self._entries.append(entry)
+        self._tokens.append(tokens)
+        for token in dict.fromkeys(tokens):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = []
+                insort(self._vocabulary, token)
+            postings.append(entry_id)
+
+    def search(self, keywords: str | Iterable[str] = (), phrase: str | None = None, prefix: str | None = None,
+               min_words: int | None = None, max_words: int | None = None) -> list[HackerNewsEntry]:
+        """
+        Returns the entries matching every given criterion.
+
+        Args:
+            keywords (str | Iterable[str]): Words that must all appear in the title. A string is split into words.
+            phrase (str | None): Words that must appear next to each other, in order.
+            prefix (str | None): A word in the title must start with this prefix.
+            min_words (int | None): The title must have more than min_words words, as in filter_by_min_title_length.
+            max_words (int | None): The title must have at most max_words words, as in filter_by_max_title_length.
+
+        Returns:
+            list[HackerNewsEntry]: The matching entries, in the order they were added. With no criteria, every entry.
+                A keyword or phrase without any word, such as "" or "!!!", matches no entry.
+
+        Raises:
+            TypeError: If a word count bound is neither an integer nor None.
+        """
+        return [self._entries[entry_id] for entry_id in self.search_ids(keywords, phrase, prefix, min_words, max_words)]
+
+    def search_ids(self, keywords: str | Iterable[str] = (), phrase: str | None = None, prefix: str | None = None,
+                   min_words: int | None = None, max_words: int | None = None) -> list[int]:
+        """
+        Same as search, but returns the sorted ids of the matching entries.
+        """
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        keyword_tokens = [tokenize(keyword) for keyword in keywords]
+        phrase_tokens = tokenize(phrase) if phrase is not None else []
+        if not all(keyword_tokens) or (phrase is not None and not phrase_tokens):
+            return []
+        words = [token for tokens in keyword_tokens for token in tokens]
+        id_sets = [set(self._postings.get(token, ())) for token in dict.fromkeys(words + phrase_tokens)]
+        if prefix is not None:
+            id_sets.append(self._prefix_ids(prefix.casefold()))
+        if min_words is not None or max_words is not None:
+            id_sets.append(set(self._lengths.positions_between(min_words, max_words)))
+
+        if not id_sets:
+            return list(range(len(self._entries)))
+        id_sets.sort(key=len)
+        ids = id_sets[0].intersection(*id_sets[1:])
+        if len(phrase_tokens) > 1:
+            ids = {entry_id for entry_id in ids if self._contains_phrase(self._tokens[entry_id], phrase_tokens)}
+        return sorted(ids)
+
+    def _prefix_ids(self, prefix: str) -> set[int]:
+        ids = set()
+        vocabulary = self._vocabulary
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix):
+                break
+            ids.update(self._postings[vocabulary[i]])
+        return ids
+
+    @staticmethod
+    def _contains_phrase(tokens: tuple[str, ...], phrase: list[str]) -> bool:
+        length = len(phrase)
+        return any(list(tokens[i:i + length]) == phrase for i in range(len(tokens) - length + 1))
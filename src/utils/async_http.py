@@ -0,0 +1,95 @@
+import asyncio
+import functools
+import threading
+import requests
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from src.constants import (HN_HTTP_REQUEST_HEADER, HTTP_POOL_MAX_CONNECTIONS, HTTP_POOL_MAX_CONNECTIONS_PER_HOST,
+                           HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+from src.utils.http_cache import HttpCache
+
+class AsyncHttpPool:
+    """
+    Pooled HTTP client for use from asyncio code.
+
+    Requests go through a single keep-alive requests.Session, so TCP/TLS connections are reused across pages and
+    across repeated fetches. The blocking request runs in a worker thread so the event loop is never stalled, and
+    a per-host semaphore caps how many requests to the same host are in flight at once. An optional HttpCache adds
+    conditional GET revalidation.
+    """
+    def __init__(self, max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+                 max_connections_per_host: int = HTTP_POOL_MAX_CONNECTIONS_PER_HOST, cache: HttpCache | None = None,
+                 timeout: tuple[float, float] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)):
+        if not isinstance(max_connections, int) or not isinstance(max_connections_per_host, int):
+            raise TypeError("Expected 'max_connections' and 'max_connections_per_host' to be integers.")
+        if max_connections < 1 or max_connections_per_host < 1:
+            raise ValueError("Expected 'max_connections' and 'max_connections_per_host' to be at least 1.")
+        self.max_connections_per_host = max_connections_per_host
+        self.cache = cache
+        # (connect, read) timeouts of every request, so a hung connection cannot hold a worker thread forever
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._session.headers.update(HN_HTTP_REQUEST_HEADER)
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._host_semaphores: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Semaphore] = {}
+
+    async def get(self, url: str, params: dict | None = None) -> bytes:
+        """
+        Fetches a URL through the pool.
+
+        Args:
+            url (str): The URL to fetch.
+            params (dict | None): Optional query parameters.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            HTTPError: If the server responds with an error status.
+            Timeout: If the server does not answer within the timeouts.
+        """
+        async with self._host_semaphore(urlsplit(url).netloc):
+            if self.cache is not None:
+                http_get = functools.partial(self._session.get, timeout=self.timeout)
+                return await asyncio.to_thread(self.cache.get, http_get, url, params)
+            response = await asyncio.to_thread(self._session.get, url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection.
+        """
+        self._session.close()
+        self._host_semaphores.clear()
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        # Semaphores are bound to the event loop that first uses them, so keep one per loop and host
+        loop = asyncio.get_running_loop()
+        key = (loop, host)
+        semaphore = self._host_semaphores.get(key)
+        if semaphore is None:
+            # Drop semaphores left behind by event loops that have since been closed
+            for stale_key in [k for k in self._host_semaphores if k[0].is_closed()]:
+                del self._host_semaphores[stale_key]
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[key] = semaphore
+        return semaphore
+
+_shared_pool: AsyncHttpPool | None = None
+_shared_pool_lock = threading.Lock()
+
+def get_shared_pool() -> AsyncHttpPool:
+    """
+    Returns the process-wide AsyncHttpPool, creating it on first use.
+
+    Returns:
+        AsyncHttpPool: The shared pool.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = AsyncHttpPool()
+        return _shared_pool
@@ -0,0 +1,30 @@
+def _extract_numeric_chars(s: str) -> str:
+    return ''.join(filter(str.isdigit, s))
+
+def parse_int(s: str) -> int | None:
+    """
+    Returns the integer formed by the digits in s, or None if s contains no digits.
+    """
+    digits = _extract_numeric_chars(s)
+    return int(digits) if digits else None
+
+def parse_item_id(s: str | None) -> int | None:
+    """
+    Returns the item id in the id attribute of an entry or comment row, or None if it is missing or not numeric.
+    """
+    return int(s) if s and s.isascii() and s.isdigit() else None
+
+def has_class(attrs: list[tuple[str, str | None]], class_name: str) -> bool:
+    """
+    Returns whether the class attribute in a list of HTMLParser attributes contains class_name.
+    """
+    for name, value in attrs:
+        if name == 'class':
+            return value is not None and class_name in value.split()
+    return False
+
+def decode_content(content: bytes | str) -> str:
+    """
+    Returns the text of a page, decoding bytes as UTF-8 and replacing invalid sequences.
+    """
+    return content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
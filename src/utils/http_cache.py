@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlencode
+from src.constants import HTTP_CACHE_MAX_MEMORY_ENTRIES, HTTP_CACHE_MAX_DISK_ENTRIES
+from src.utils.log_config import setup_logger
+
+logger = setup_logger(__name__)
+
+def content_hash(content: bytes | str) -> str:
+    """
+    Returns a hex digest identifying a response body.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+class CachedResponse:
+    """
+    A cached response body together with the validators needed to revalidate it.
+    """
+    __slots__ = ('etag', 'last_modified', 'content', 'content_hash')
+
+    def __init__(self, etag: str | None, last_modified: str | None, content: bytes, content_hash: str):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+        self.content_hash = content_hash
+
+class HttpCache:
+    """
+    HTTP response cache with conditional GET revalidation.
+
+    Cached responses are kept in a bounded in-memory LRU and, when a cache directory is given, in a bounded on-disk
+    store that survives restarts. Every request for a cached URL is sent with If-None-Match/If-Modified-Since so an
+    unchanged page costs a 304 with no body. The cache is safe to share between threads.
+    """
+    def __init__(self, cache_dir: str | Path | None = None, max_memory_entries: int = HTTP_CACHE_MAX_MEMORY_ENTRIES,
+                 max_disk_entries: int = HTTP_CACHE_MAX_DISK_ENTRIES):
+        """
+        Args:
+            cache_dir (str | Path | None): Directory for the on-disk store, or None to only cache in memory.
+            max_memory_entries (int): Maximum number of responses kept in memory.
+            max_disk_entries (int): Maximum number of responses kept on disk.
+
+        Raises:
+            TypeError: If a size limit is not an integer.
+            ValueError: If a size limit is less than 1.
+        """
+        if not isinstance(max_memory_entries, int) or not isinstance(max_disk_entries, int):
+            raise TypeError("Expected 'max_memory_entries' and 'max_disk_entries' to be integers.")
+        if max_memory_entries < 1 or max_disk_entries < 1:
+            raise ValueError("Expected 'max_memory_entries' and 'max_disk_entries' to be at least 1.")
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, http_get: Callable, url: str, params: dict | None = None, headers: dict | None = None) -> bytes:
+        """
+        Fetches a URL through the cache.
+
+        Args:
+            http_get (Callable): A requests.get compatible function used to send the request.
+            url (str): The URL to fetch.
+            params (dict | None): Optional query parameters.
+            headers (dict | None): Optional request headers.
+
+        Returns:
+            bytes: The response body, either fresh or revalidated from the cache.
+
+        Raises:
+            HTTPError: If the server responds with an error status.
+        """
+        key = self._key(url, params)
+        cached = self.lookup(key)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                request_headers['If-Modified-Since'] = cached.last_modified
+        response = http_get(url, params=params, headers=request_headers)
+        if cached is not None and response.status_code == 304:
+            return cached.content
+        response.raise_for_status()
+        self.store(key, CachedResponse(response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                                       response.content, content_hash(response.content)))
+        return response.content
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        """
+        Returns the cached response for a key, or None if there is none.
+        """
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                return cached
+        cached = self._read_disk(key)
+        if cached is not None:
+            with self._lock:
+                self._remember(key, cached)
+        return cached
+
+    def store(self, key: str, cached: CachedResponse) -> None:
+        """
+        Stores a response, evicting the least recently used ones if the cache is full. Responses without an ETag or
+        Last-Modified validator cannot be revalidated and are not stored.
+        """
+        if not cached.etag and not cached.last_modified:
+            return
+        with self._lock:
+            self._remember(key, cached)
+        self._write_disk(key, cached)
+
+    def clear(self) -> None:
+        """
+        Removes every cached response from memory and disk.
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob('*.json'):
+                self._remove_disk_entry(path)
+
+    @staticmethod
+    def _key(url: str, params: dict | None) -> str:
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+
+    def _remember(self, key: str, cached: CachedResponse) -> None:
+        self._memory[key] = cached
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _read_disk(self, key: str) -> CachedResponse | None:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            metadata = json.loads(path.with_suffix('.json').read_text(encoding='utf-8'))
+            content = path.with_suffix('.body').read_bytes()
+            if metadata.get('key') != key or metadata.get('content_hash') != content_hash(content):
+                return None
+            # Touch the metadata file so its modification time tracks the last use for LRU eviction
+            os.utime(path.with_suffix('.json'))
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(metadata.get('etag'), metadata.get('last_modified'), content, metadata['content_hash'])
+
+    def _write_disk(self, key: str, cached: CachedResponse) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(key)
+        metadata = {'key': key, 'etag': cached.etag, 'last_modified': cached.last_modified,
+                    'content_hash': cached.content_hash}
+        try:
+            path.with_suffix('.body').write_bytes(cached.content)
+            path.with_suffix('.json').write_text(json.dumps(metadata), encoding='utf-8')
+        except OSError as e:
+            logger.error(f"Failed to write to the HTTP cache directory: {e}")
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        metadata_paths = list(self.cache_dir.glob('*.json'))
+        if len(metadata_paths) <= self.max_disk_entries:
+            return
+        metadata_paths.sort(key=self._mtime)
+        for path in metadata_paths[:len(metadata_paths) - self.max_disk_entries]:
+            self._remove_disk_entry(path)
+
+    @staticmethod
+    def _mtime(path: Path) -> float:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    @staticmethod
+    def _remove_disk_entry(metadata_path: Path) -> None:
+        for path in (metadata_path, metadata_path.with_suffix('.body')):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -1,31 +1,244 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
-from src.constants import LOG_FILE_NAME, LOG_FILE_MAX_BYTES, LOG_FILE_MAX_NUM
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
+from src.constants import (LOG_FILE_NAME, LOG_FILE_MAX_BYTES, LOG_FILE_MAX_NUM, LOG_QUEUE_BATCH_SIZE,
+                           LOG_DEDUP_INTERVAL, LOG_DEDUP_BURST, LOG_DEDUP_MAX_KEYS)
+
+class _DeferredFlushMixin:
+    """
+    Lets QueueLogWriter flush a stream handler once per batch instead of once per record.
+    """
+    _deferring = False
+
+    def flush(self):
+        if not self._deferring:
+            super().flush()
+
+class _BatchStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+class _BatchRotatingFileHandler(_DeferredFlushMixin, RotatingFileHandler):
+    pass
+
+def _create_handlers(logger: logging.Logger, batched: bool = False) -> list[logging.Handler]:
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = []
+
+    # Create a console handler to log messages to the console
+    console_handler = _BatchStreamHandler() if batched else logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+
+    # Try to create a rotating file handler to log messages to a file
+    try:
+        file_handler_type = _BatchRotatingFileHandler if batched else RotatingFileHandler
+        file_handler = file_handler_type(LOG_FILE_NAME, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_MAX_NUM)
+        file_handler.setLevel(logging.WARNING)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except PermissionError:
+        logger.error("Permission denied: Unable to write to the log file.", exc_info=1)
+    except OSError:
+        logger.error("OS error (e.g., disk full): Failed to create or write to the log file.", exc_info=1)
+    except Exception as e:
+        logger.error(f"Unexpected error with the log file: {e}", exc_info=1)
+    return handlers
+
+class RateLimitedDedupFilter(logging.Filter):
+    """
+    Drops repeats of the same message beyond a burst within a time window.
+
+    Records are considered repeats when they come from the same logger with the same level and message template,
+    whatever their arguments, so the validation warnings of one malformed page collapse into a few lines. The first
+    record let through after a window ends reports how many records were dropped during it. Records above max_level
+    are never dropped.
+    """
+    def __init__(self, interval: float = LOG_DEDUP_INTERVAL, burst: int = LOG_DEDUP_BURST,
+                 max_level: int = logging.WARNING, max_keys: int = LOG_DEDUP_MAX_KEYS):
+        """
+        Args:
+            interval (float): Length of a window in seconds.
+            burst (int): Number of records with the same template let through per window.
+            max_level (int): Highest level that may be dropped.
+            max_keys (int): Maximum number of message templates tracked at once.
+        """
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.max_level = max_level
+        self.max_keys = max_keys
+        # Per (logger name, level, template): [window start, records seen in the window, records dropped]
+        self._windows: dict[tuple[str, int, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                dropped = window[2] if window is not None else 0
+                if window is None and len(self._windows) >= self.max_keys:
+                    self._prune(now)
+                self._windows[key] = [now, 1, 0]
+                if dropped:
+                    record.msg = f"{record.msg} ({dropped} similar messages suppressed)"
+                return True
+            window[1] += 1
+            if window[1] > self.burst:
+                window[2] += 1
+                return False
+            return True
+
+    def _prune(self, now: float) -> None:
+        expired = [key for key, window in self._windows.items() if now - window[0] >= self.interval]
+        for key in expired or list(self._windows)[:len(self._windows) // 2]:
+            del self._windows[key]
+
+class _ThreadQueueHandler(QueueHandler):
+    """
+    QueueHandler for a writer thread in the same process. Records are queued as they are, leaving the message
+    formatting to the writer thread instead of the thread that logged them.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Marks the end of the queue for QueueLogWriter
+_STOP = object()
+
+class QueueLogWriter:
+    """
+    Background thread that writes queued log records to a set of handlers.
+
+    Records are taken from the queue in batches of everything available, up to batch_size, and handlers are
+    flushed once per batch.
+    """
+    def __init__(self, handlers: list[logging.Handler], batch_size: int = LOG_QUEUE_BATCH_SIZE):
+        """
+        Args:
+            handlers (list[logging.Handler]): The handlers records are written to.
+            batch_size (int): Maximum number of records written between two flushes.
+        """
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Starts the writer thread.
+        """
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Writes every record queued so far, then stops the writer thread.
+        """
+        if self._thread is not None:
+            self.queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(record is _STOP for record in batch)
+            self._write([record for record in batch if record is not _STOP])
+            if stop:
+                return
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        if not records:
+            return
+        for handler in self.handlers:
+            handler._deferring = True
+            try:
+                for record in records:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                handler._deferring = False
+                handler.flush()
+
+# Loggers set up by setup_logger, so they can be switched between direct and queued handlers
+_configured_loggers: list[logging.Logger] = []
+_queue_handler: QueueHandler | None = None
+_queue_writer: QueueLogWriter | None = None
+_queue_lock = threading.RLock()
 
 def setup_logger(name):
     # Set up the logger
     logger = logging.getLogger(name)
-    if not logger.hasHandlers():
-        logger.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-        # Create a console handler to log messages to the console
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-        # Try to create a rotating file handler to log messages to a file
-        try:
-            file_handler = RotatingFileHandler(LOG_FILE_NAME, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_MAX_NUM)
-            file_handler.setLevel(logging.WARNING)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-        except PermissionError:
-            logger.error("Permission denied: Unable to write to the log file.", exc_info=1)
-        except OSError:
-            logger.error("OS error (e.g., disk full): Failed to create or write to the log file.", exc_info=1)
-        except Exception as e:
-            logger.error(f"Unexpected error with the log file: {e}", exc_info=1)
-
-    return logger
\ No newline at end of file
+    with _queue_lock:
+        if not logger.hasHandlers():
+            logger.setLevel(logging.INFO)
+            if _queue_handler is not None:
+                logger.addHandler(_queue_handler)
+            else:
+                for handler in _create_handlers(logger):
+                    logger.addHandler(handler)
+            _configured_loggers.append(logger)
+
+    return logger
+
+def enable_queue_logging(batch_size: int = LOG_QUEUE_BATCH_SIZE, dedup: RateLimitedDedupFilter | None = None) -> None:
+    """
+    Moves every logger set up by setup_logger, and those set up later, to a queue written by a background thread,
+    so logging calls never block on console or file I/O. Repeated warnings are dropped by a RateLimitedDedupFilter
+    before they are queued.
+
+    Args:
+        batch_size (int): Maximum number of records written between two flushes.
+        dedup (RateLimitedDedupFilter | None): The deduplication filter. Defaults to one with the default limits.
+    """
+    global _queue_handler, _queue_writer
+    with _queue_lock:
+        if _queue_handler is not None:
+            return
+        writer = QueueLogWriter(_create_handlers(logging.getLogger(__name__), batched=True), batch_size)
+        handler = _ThreadQueueHandler(writer.queue)
+        handler.addFilter(dedup or RateLimitedDedupFilter())
+        for logger in _configured_loggers:
+            for direct_handler in list(logger.handlers):
+                logger.removeHandler(direct_handler)
+                direct_handler.close()
+            logger.addHandler(handler)
+        writer.start()
+        _queue_handler, _queue_writer = handler, writer
+
+def disable_queue_logging() -> None:
+    """
+    Writes out every queued record, stops the background thread and gives the loggers their direct handlers back.
+    """
+    global _queue_handler, _queue_writer
+    with _queue_lock:
+        if _queue_handler is None:
+            return
+        for logger in _configured_loggers:
+            logger.removeHandler(_queue_handler)
+        _queue_writer.stop()
+        for handler in _queue_writer.handlers:
+            handler.close()
+        _queue_handler, _queue_writer = None, None
+        for logger in _configured_loggers:
+            for handler in _create_handlers(logger):
+                logger.addHandler(handler)
+
+@atexit.register
+def _flush_queue_at_exit() -> None:
+    # Make sure queued records are written before the interpreter exits
+    with _queue_lock:
+        if _queue_writer is not None:
+            _queue_writer.stop()
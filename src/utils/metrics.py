@@ -0,0 +1,298 @@
+import functools
+import math
+import threading
+import time
+from typing import Callable
+from src.constants import METRICS_ENABLED, METRICS_HISTOGRAM_BUCKETS
+
+# Signature of metric listeners: (metric name, labels, value), called for every counter increment and observation
+MetricListener = Callable[[str, dict[str, str], float], None]
+
+class _Metric:
+    """
+    Base class of metrics. Values are kept per combination of label values.
+    """
+    kind = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, help: str, label_names: tuple[str, ...]):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if labels.keys() != set(self.label_names):
+            raise ValueError(f"Expected labels {self.label_names} for metric '{self.name}', but got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _format_labels(self, values: tuple[str, ...], extra: tuple[tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.label_names, values)) + list(extra)
+        if not pairs:
+            return ''
+        escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+        return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count, such as the number of validation failures.
+    """
+    kind = 'counter'
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, help: str, label_names: tuple[str, ...] = ()):
+        super().__init__(registry, name, help, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Adds amount to the counter. Does nothing while the registry is disabled.
+
+        Raises:
+            ValueError: If the labels do not match the label names of the counter.
+        """
+        if not self.registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        self.registry._notify(self.name, labels, amount)
+
+    def value(self, **labels: str) -> float:
+        """
+        Returns the current count for the given labels.
+        """
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{self._format_labels(key)} {_format_value(value)}")
+        return lines
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values, such as durations in seconds, counted into cumulative buckets.
+    """
+    kind = 'histogram'
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, help: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = METRICS_HISTOGRAM_BUCKETS):
+        super().__init__(registry, name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket..., count above the last bucket], sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Records a value. Does nothing while the registry is disabled.
+
+        Raises:
+            ValueError: If the labels do not match the label names of the histogram.
+        """
+        if not self.registry.enabled:
+            return
+        key = self._label_values(labels)
+        position = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[position] += 1
+            total[0] += value
+        self.registry._notify(self.name, labels, value)
+
+    def time(self, **labels: str) -> '_Timer':
+        """
+        Returns a context manager that observes the seconds spent inside it.
+        """
+        return _Timer(self, labels)
+
+    def count(self, **labels: str) -> int:
+        """
+        Returns the number of values observed for the given labels.
+        """
+        with self._lock:
+            values = self._values.get(self._label_values(labels))
+            return sum(values[0]) if values else 0
+
+    def sum(self, **labels: str) -> float:
+        """
+        Returns the sum of the values observed for the given labels.
+        """
+        with self._lock:
+            values = self._values.get(self._label_values(labels))
+            return values[1][0] if values else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += count
+                    le = '+Inf' if bound == math.inf else _format_value(bound)
+                    lines.append(f"{self.name}_bucket{self._format_labels(key, (('le', le),))} {cumulative}")
+                lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_value(total[0])}")
+                lines.append(f"{self.name}_count{self._format_labels(key)} {cumulative}")
+        return lines
+
+class _Timer:
+    __slots__ = ('_histogram', '_labels', '_start')
+
+    def __init__(self, histogram: Histogram, labels: dict[str, str]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class MetricsRegistry:
+    """
+    Collection of counters and histograms that can be rendered in the Prometheus text exposition format or
+    forwarded to listeners as they are recorded.
+
+    While the registry is disabled, recording a value returns immediately, and instrumented code checks enabled
+    before reading any clock, so leaving the instrumentation in place costs next to nothing.
+    """
+    def __init__(self, enabled: bool = METRICS_ENABLED):
+        """
+        Args:
+            enabled (bool): Whether values are recorded.
+        """
+        self.enabled = enabled
+        self._metrics: dict[str, _Metric] = {}
+        self._listeners: list[MetricListener] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, label_names: tuple[str, ...] = ()) -> Counter:
+        """
+        Returns the counter with the given name, creating it on first use.
+        """
+        return self._register(Counter, name, help, label_names)
+
+    def histogram(self, name: str, help: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = METRICS_HISTOGRAM_BUCKETS) -> Histogram:
+        """
+        Returns the histogram with the given name, creating it on first use.
+        """
+        return self._register(Histogram, name, help, label_names, buckets=buckets)
+
+    def _register(self, metric_type: type, name: str, help: str, label_names: tuple[str, ...], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_type(self, name, help, tuple(label_names), **kwargs)
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}.")
+            return metric
+
+    def add_listener(self, listener: MetricListener) -> None:
+        """
+        Registers a callback that receives every recorded value as (metric name, labels, value).
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: MetricListener) -> None:
+        """
+        Unregisters a callback added with add_listener.
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def _notify(self, name: str, labels: dict[str, str], value: float) -> None:
+        for listener in self._listeners:
+            listener(name, labels, value)
+
+    def reset(self) -> None:
+        """
+        Clears every recorded value, keeping the metrics and listeners.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+# Process-wide registry used by the scraper instrumentation
+registry = MetricsRegistry()
+
+def enable_metrics() -> MetricsRegistry:
+    """
+    Starts recording the scraper metrics. Returns the process-wide registry.
+    """
+    registry.enabled = True
+    return registry
+
+def disable_metrics() -> None:
+    """
+    Stops recording the scraper metrics. Values recorded so far are kept.
+    """
+    registry.enabled = False
+
+def timed(histogram: Histogram, **labels: str):
+    """
+    Decorator that observes the run time of the decorated function in histogram while the registry is enabled.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not histogram.registry.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, **labels)
+        return wrapper
+    return decorator
+
+# Scraper metrics
+HTTP_REQUEST_SECONDS = registry.histogram(
+    'hn_http_request_seconds',
+    "Time spent fetching a listing page, by phase: 'headers' until the response headers arrived (DNS, connection and "
+    "server time, from response.elapsed), 'transfer' reading the body, and 'total' including caching and rate limits.",
+    ('phase',))
+PARSE_SECONDS = registry.histogram('hn_parse_seconds', "Time spent parsing a listing page.", ('backend',))
+PARSE_SECONDS_PER_ENTRY = registry.histogram(
+    'hn_parse_seconds_per_entry',
+    "Parse time of a listing page divided by the number of entries extracted from it, observed once per page.",
+    ('backend',),
+    buckets=(1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3))
+ROWS_EXTRACTED = registry.counter('hn_rows_extracted_total', "Entries extracted from listing pages.", ('backend',))
+PARSE_CACHE_HITS = registry.counter('hn_parse_cache_hits_total', "Listing pages served from the parse cache.")
+VALIDATION_FAILURES = registry.counter('hn_entry_validation_failures_total',
+                                       "Entry field values rejected by validation.", ('field',))
+ENTRY_OPERATION_SECONDS = registry.histogram('hn_entry_operation_seconds',
+                                             "Time spent in scraper filter and sort calls.", ('operation',))
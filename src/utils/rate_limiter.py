@@ -0,0 +1,260 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable
+from src.constants import HN_HOST_REQUEST_DELAY, FETCH_SCHEDULER_MAX_WORKERS
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at rate tokens per second up to capacity. reserve() always succeeds and returns how long
+    the caller must wait before using its token, so callers that reserve while the bucket is empty are queued one
+    after another instead of all retrying at the same moment.
+    """
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens the bucket can hold.
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Expected 'rate' and 'capacity' to be greater than 0.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket, going into debt if there are not enough.
+
+        Returns:
+            float: Seconds to wait before the reserved tokens may be used.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Takes tokens from the bucket only if they are available right now.
+
+        Returns:
+            bool: True if the tokens were taken, False otherwise.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+class HostRateLimiter:
+    """
+    One TokenBucket per host, so that everything fetching from the same host shares its politeness budget.
+    """
+    def __init__(self, rate: float = 1 / HN_HOST_REQUEST_DELAY, capacity: float = 1):
+        """
+        Args:
+            rate (float): Requests per second allowed for each host.
+            capacity (float): Number of requests each host allows in a burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """
+        Returns the bucket of a host, creating it on first use.
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def reserve(self, host: str) -> float:
+        """
+        Reserves a request to host. Returns the seconds to wait before sending it.
+        """
+        return self.bucket(host).reserve()
+
+    def try_acquire(self, host: str) -> bool:
+        """
+        Takes a request slot for host only if one is available right now.
+        """
+        return self.bucket(host).try_acquire()
+
+class Reschedule(Exception):
+    """
+    Raised by a FetchScheduler job that finds, once it runs, that it is too early to fetch. The job is queued again
+    to run after delay seconds, and its Future stays pending.
+    """
+    def __init__(self, delay: float):
+        super().__init__(f"Job rescheduled in {delay:.2f} seconds.")
+        self.delay = delay
+
+class FetchScheduler:
+    """
+    Queues fetch jobs and runs each one at the earliest time its host's rate limit allows.
+
+    Jobs are identified by a key: submitting a key that is already queued or running returns the pending Future
+    instead of queueing a duplicate. Results can be waited for synchronously with run() or awaited with run_async().
+    A job that raises Reschedule is queued again instead of resolving its Future.
+    """
+    def __init__(self, rate_limiter: HostRateLimiter | None = None, max_workers: int = FETCH_SCHEDULER_MAX_WORKERS):
+        """
+        Args:
+            rate_limiter (HostRateLimiter | None): The per-host rate limiter. Defaults to the shared one.
+            max_workers (int): Maximum number of jobs run at the same time.
+        """
+        self.rate_limiter = rate_limiter or get_host_rate_limiter()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fetch-scheduler')
+        self._pending: dict[Hashable, Future] = {}
+        self._queue: list[tuple[float, int, Hashable, Callable[[], Any], Future]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, key: Hashable, fn: Callable[[], Any], host: str | None = None, not_before: float = 0.0) -> Future:
+        """
+        Queues a job, or returns the Future of the pending job with the same key.
+
+        Args:
+            key (Hashable): Identifies the job for coalescing.
+            fn (Callable[[], Any]): The job. Its return value becomes the result of the Future.
+            host (str | None): The host the job fetches from, or None to skip rate limiting.
+            not_before (float): Earliest time.monotonic() value at which the job may run.
+
+        Returns:
+            Future: Resolves to the result of fn.
+
+        Raises:
+            RuntimeError: If the scheduler has been shut down.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a FetchScheduler that has been shut down.")
+            future = self._pending.get(key)
+            if future is not None and not future.cancelled():
+                return future
+            future = Future()
+            self._pending[key] = future
+            delay = self.rate_limiter.reserve(host) if host is not None else 0.0
+            run_at = max(time.monotonic() + delay, not_before)
+            heapq.heappush(self._queue, (run_at, next(self._sequence), key, fn, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._dispatch, name='fetch-scheduler-dispatch', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def run(self, key: Hashable, fn: Callable[[], Any], host: str | None = None, not_before: float = 0.0) -> Any:
+        """
+        Submits a job and blocks until it has run. Returns its result or raises its exception.
+        """
+        return self.submit(key, fn, host, not_before).result()
+
+    async def run_async(self, key: Hashable, fn: Callable[[], Any], host: str | None = None, not_before: float = 0.0) -> Any:
+        """
+        Submits a job and waits for it without blocking the event loop. Returns its result or raises its exception.
+        """
+        import asyncio
+        return await asyncio.wrap_future(self.submit(key, fn, host, not_before))
+
+    def shutdown(self) -> None:
+        """
+        Cancels every queued job and stops the scheduler once running jobs finish.
+        """
+        with self._condition:
+            self._closed = True
+            for _, _, key, _, future in self._queue:
+                # Rescheduled jobs have already started, so their Future can no longer be cancelled
+                if not future.cancel():
+                    future.set_exception(CancelledError())
+                self._pending.pop(key, None)
+            self._queue.clear()
+            self._condition.notify()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self) -> None:
+        with self._condition:
+            while not self._closed:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                run_at = self._queue[0][0]
+                now = time.monotonic()
+                if run_at > now:
+                    self._condition.wait(run_at - now)
+                    continue
+                _, _, key, fn, future = heapq.heappop(self._queue)
+                self._executor.submit(self._run_job, key, fn, future)
+
+    def _run_job(self, key: Hashable, fn: Callable[[], Any], future: Future) -> None:
+        # A rescheduled job's Future is already running
+        if not future.running() and not future.set_running_or_notify_cancel():
+            self._finish(key, future)
+            return
+        try:
+            result = fn()
+        except Reschedule as e:
+            with self._condition:
+                if not self._closed:
+                    heapq.heappush(self._queue, (time.monotonic() + e.delay, next(self._sequence), key, fn, future))
+                    self._condition.notify()
+                    return
+            self._finish(key, future)
+            future.set_exception(CancelledError())
+        except BaseException as e:
+            self._finish(key, future)
+            future.set_exception(e)
+        else:
+            self._finish(key, future)
+            future.set_result(result)
+
+    def _finish(self, key: Hashable, future: Future) -> None:
+        # Forget the job before resolving it, so a submission made once it is done starts a new fetch
+        with self._condition:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+_shared_rate_limiter: HostRateLimiter | None = None
+_shared_scheduler: FetchScheduler | None = None
+_shared_lock = threading.Lock()
+
+def get_host_rate_limiter() -> HostRateLimiter:
+    """
+    Returns the process-wide HostRateLimiter, creating it on first use.
+    """
+    global _shared_rate_limiter
+    with _shared_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = HostRateLimiter()
+        return _shared_rate_limiter
+
+def get_fetch_scheduler() -> FetchScheduler:
+    """
+    Returns the process-wide FetchScheduler, creating it on first use.
+    """
+    global _shared_scheduler
+    rate_limiter = get_host_rate_limiter()
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = FetchScheduler(rate_limiter)
+        return _shared_scheduler
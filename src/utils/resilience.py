@@ -0,0 +1,304 @@
+import random
+import threading
+import time
+from typing import Any, Callable
+from requests.exceptions import (ChunkedEncodingError, ConnectionError, ContentDecodingError, HTTPError,
+                                 RequestException, Timeout)
+from src.constants import (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, FETCH_RETRY_MAX_ATTEMPTS, FETCH_RETRY_BASE_DELAY,
+                           FETCH_RETRY_MAX_DELAY, FETCH_RETRY_STATUS_CODES, CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                           CIRCUIT_BREAKER_RESET_TIMEOUT)
+from src.utils.log_config import setup_logger
+
+logger = setup_logger(__name__)
+
+class CircuitOpenError(RequestException):
+    """
+    Raised instead of sending a request while the circuit breaker of its host is open.
+
+    It is a RequestException, so code that already handles failed requests handles it the same way.
+    """
+
+# Errors raised while connecting, waiting for or reading a response, which are worth trying again
+_TRANSIENT_ERRORS = (ConnectionError, Timeout, ChunkedEncodingError, ContentDecodingError)
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Returns whether a request error is likely to go away on its own: connection failures, timeouts, truncated bodies
+    and the HTTP status codes in FETCH_RETRY_STATUS_CODES.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, HTTPError):
+        return error.response is not None and error.response.status_code in FETCH_RETRY_STATUS_CODES
+    return isinstance(error, _TRANSIENT_ERRORS)
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: before retry n, the caller waits a random time between 0 and
+    min(max_delay, base_delay * 2 ** n), so that clients failing together do not all retry at the same moment.
+    """
+    def __init__(self, max_attempts: int = FETCH_RETRY_MAX_ATTEMPTS, base_delay: float = FETCH_RETRY_BASE_DELAY,
+                 max_delay: float = FETCH_RETRY_MAX_DELAY):
+        """
+        Args:
+            max_attempts (int): The number of attempts, including the first one. 1 disables retries.
+            base_delay (float): The upper bound of the wait before the first retry in seconds.
+            max_delay (float): The upper bound of any wait in seconds. Responses asking for a longer Retry-After
+                are not retried.
+
+        Raises:
+            TypeError: If max_attempts is not an integer.
+            ValueError: If max_attempts is less than 1, or a delay is negative.
+        """
+        if not isinstance(max_attempts, int):
+            raise TypeError("Expected 'max_attempts' to be an integer.")
+        if max_attempts < 1:
+            raise ValueError("Expected 'max_attempts' to be at least 1.")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("Expected 'base_delay' and 'max_delay' to be zero or greater.")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retry: int, error: BaseException | None = None) -> float | None:
+        """
+        Returns the seconds to wait before a retry, or None if the error should not be retried.
+
+        Args:
+            retry (int): The number of the retry, starting at 0.
+            error (BaseException | None): The error of the failed attempt. A Retry-After header on its response
+                sets the minimum wait.
+        """
+        if retry + 1 >= self.max_attempts or (error is not None and not is_transient(error)):
+            return None
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+        response = error.response if isinstance(error, HTTPError) else None
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None and retry_after.strip().isdigit():
+            if int(retry_after) > self.max_delay:
+                return None
+            delay = max(delay, int(retry_after))
+        return delay
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one host.
+
+    After failure_threshold consecutive transient failures the circuit opens and requests fail at once with
+    CircuitOpenError. Once reset_timeout seconds have passed, a single trial request is let through: the circuit
+    closes if it succeeds and opens again if it fails.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT):
+        """
+        Args:
+            failure_threshold (int): The number of consecutive failures that opens the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a trial request is let through.
+
+        Raises:
+            ValueError: If failure_threshold is less than 1 or reset_timeout is negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Expected 'failure_threshold' to be at least 1.")
+        if reset_timeout < 0:
+            raise ValueError("Expected 'reset_timeout' to be zero or greater.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether a request may be sent now. In the half-open state, only the first caller gets True until
+        the trial request is recorded.
+        """
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """
+        Closes the circuit and clears the failure count.
+        """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """
+        Counts a failure, opening the circuit once the threshold is reached or when a trial request failed.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release_trial(self) -> None:
+        """
+        Ends a trial request that was interrupted by an error unrelated to the host, such as a cancellation. The
+        circuit opens again, so that a later request can be the next trial, and the failure count is left unchanged.
+        """
+        with self._lock:
+            if self._trial_running:
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+
+class FetchPolicy:
+    """
+    Timeouts, retries and one circuit breaker per host, applied around every request of the fetch path.
+
+    Only transient errors are retried and counted by the breakers. Other errors, such as a 404, mean the host
+    answered, so they close its circuit and are raised at once.
+    """
+    def __init__(self, connect_timeout: float = HTTP_CONNECT_TIMEOUT, read_timeout: float = HTTP_READ_TIMEOUT,
+                 retry: RetryPolicy | None = None, failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT):
+        """
+        Args:
+            connect_timeout (float): Seconds to wait for a connection to be established.
+            read_timeout (float): Seconds to wait for each read from the server, not for the whole response.
+            retry (RetryPolicy | None): The retry policy. Defaults to RetryPolicy().
+            failure_threshold (int): The failure threshold of each host's circuit breaker.
+            reset_timeout (float): The reset timeout of each host's circuit breaker in seconds.
+
+        Raises:
+            ValueError: If a timeout is not greater than 0.
+        """
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("Expected 'connect_timeout' and 'read_timeout' to be greater than 0.")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """
+        The (connect, read) timeout tuple accepted by requests.
+        """
+        return self.connect_timeout, self.read_timeout
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """
+        Returns the circuit breaker of a host, creating it on first use.
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def call(self, host: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Calls fn, which sends a request to host, retrying it on transient errors.
+
+        Args:
+            host (str): The host the request is sent to.
+            fn (Callable[..., Any]): The request. It should pass self.timeout to requests.
+            *args, **kwargs: The arguments of fn.
+
+        Returns:
+            Any: The return value of fn.
+
+        Raises:
+            CircuitOpenError: If the circuit of host is open.
+            RequestException: The error of the last attempt, if every attempt failed.
+        """
+        breaker = self.breaker(host)
+        retry = 0
+        while True:
+            self._check_circuit(host, breaker)
+            try:
+                result = fn(*args, **kwargs)
+            except RequestException as e:
+                delay = self._on_failure(host, breaker, retry, e)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            time.sleep(delay)
+            retry += 1
+
+    async def call_async(self, host: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Awaitable variant of call, for a coroutine function fn. Waits between attempts without blocking the event loop.
+        """
+        import asyncio
+        breaker = self.breaker(host)
+        retry = 0
+        while True:
+            self._check_circuit(host, breaker)
+            try:
+                result = await fn(*args, **kwargs)
+            except RequestException as e:
+                delay = self._on_failure(host, breaker, retry, e)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            await asyncio.sleep(delay)
+            retry += 1
+
+    @staticmethod
+    def _check_circuit(host: str, breaker: CircuitBreaker) -> None:
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit breaker for {host} is open, not sending the request.")
+
+    def _on_failure(self, host: str, breaker: CircuitBreaker, retry: int, error: RequestException) -> float | None:
+        if not is_transient(error):
+            breaker.record_success()
+            return None
+        breaker.record_failure()
+        delay = self.retry.delay(retry, error)
+        if delay is not None:
+            logger.warning(f"Request to {host} failed ({error}), retrying in {delay:.2f} seconds.")
+        return delay
+
+_shared_policy: FetchPolicy | None = None
+_shared_policy_lock = threading.Lock()
+
+def get_fetch_policy() -> FetchPolicy:
+    """
+    Returns the process-wide FetchPolicy, creating it on first use.
+    """
+    global _shared_policy
+    with _shared_policy_lock:
+        if _shared_policy is None:
+            _shared_policy = FetchPolicy()
+        return _shared_policy
@@ -4,6 +4,9 @@ from src.models.hn_entry import HackerNewsEntry
 # Platform-indifferent path to the mock yCombinator html file from the local directory
 MOCK_HTML_FILE_RELATIVE_PATH = Path("mocks") / "hn_sample.html"
 
+# Platform-indifferent path to the mock yCombinator item (discussion) page from the local directory
+MOCK_ITEM_HTML_FILE_RELATIVE_PATH = Path("mocks") / "hn_item_sample.html"
+
 # Number of entries in the mock yCombinator html file
 MOCK_HTML_HN_ENTRIES_NUM = 30
 
@@ -32,4 +35,12 @@ MOCK_HTML_EXPECTED_RETURN_VALUE = [
     HackerNewsEntry('Erlang/OTP 26.1 Released', 18, 51, 177),
     HackerNewsEntry('Introduction to Linux interfaces for virtual networking (2018)', 19, 11, 156),
     HackerNewsEntry('Guide to Searching and Annotating Text on Maps', 20, 5, 45)
-]
\ No newline at end of file
+]
+
+# Cumulative import time budgets in milliseconds, several times what a developer machine needs, so that only heavy
+# imports creeping back onto start-up fail the test. The scraper's budget leaves out requests, which every fetch needs.
+CLI_IMPORT_TIME_BUDGET_MS = 100
+SCRAPER_IMPORT_TIME_BUDGET_MS = 150
+
+# Environment variable that skips the import time budget test, for CI hosts too slow or busy to time imports
+SKIP_IMPORT_TIME_BUDGET_ENV = 'HN_SKIP_IMPORT_TIME_BUDGET'
@@ -0,0 +1,72 @@
+import pytest
+import asyncio
+import threading
+import time
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError
+from src.utils.async_http import AsyncHttpPool, get_shared_pool
+
+def test_pool_limits_concurrency_per_host():
+    """
+    Test that AsyncHttpPool never has more than max_connections_per_host requests in flight to the same host.
+    """
+    # Arrange
+    pool = AsyncHttpPool(max_connections=8, max_connections_per_host=2)
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def slow_get(url, params=None, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        response = Mock()
+        response.content = b"ok"
+        return response
+
+    async def fetch_all():
+        return await asyncio.gather(*(pool.get("https://news.ycombinator.com/news", {"p": i}) for i in range(6)))
+
+    # Act
+    with patch.object(pool._session, 'get', side_effect=slow_get):
+        results = asyncio.run(fetch_all())
+    pool.close()
+
+    # Assert
+    assert results == [b"ok"] * 6
+    assert max_in_flight == 2, f"Expected at most 2 concurrent requests, but got {max_in_flight}"
+
+def test_pool_raises_http_errors():
+    """
+    Test that AsyncHttpPool.get raises HTTPError when the response has an error status.
+    """
+    # Arrange
+    pool = AsyncHttpPool()
+    response = Mock()
+    response.raise_for_status.side_effect = HTTPError("Mocked HTTP Error")
+
+    # Act and Assert
+    with patch.object(pool._session, 'get', return_value=response):
+        with pytest.raises(HTTPError):
+            asyncio.run(pool.get("https://news.ycombinator.com/news"))
+    pool.close()
+
+def test_pool_invalid_limits():
+    """
+    Test AsyncHttpPool with invalid connection limits.
+    The constructor should raise TypeError for non-integers and ValueError for values below 1.
+    """
+    with pytest.raises(TypeError):
+        AsyncHttpPool(max_connections="10")
+    with pytest.raises(ValueError):
+        AsyncHttpPool(max_connections_per_host=0)
+
+def test_shared_pool_is_reused():
+    """
+    Test that get_shared_pool always returns the same pool.
+    """
+    assert get_shared_pool() is get_shared_pool()
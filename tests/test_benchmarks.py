@@ -0,0 +1,58 @@
+from benchmarks.bench_suite import find_inversions, find_regressions, relative_to_reference, synthetic_entries
+
+def test_find_regressions_uses_tolerance():
+    """
+    Test that only benchmarks slower than the baseline by more than the tolerance are reported.
+    """
+    # Arrange
+    baseline = {"fast": 10.0, "slow": 10.0, "removed": 5.0}
+    results = {"fast": 12.0, "slow": 13.0, "new": 1.0}
+
+    # Act
+    regressions = find_regressions(results, baseline, tolerance=0.25)
+
+    # Assert
+    assert regressions == {"slow": (10.0, 13.0)}
+
+def test_find_inversions_reports_bulk_paths_not_faster():
+    """
+    Test that a benchmark expected to be faster than another is reported only when it is not, and that missing pairs
+    are skipped.
+    """
+    # Arrange
+    expected_faster = {"bulk": "per_row", "batch": "single", "missing": "per_row"}
+    results = {"bulk": 3.0, "per_row": 5.0, "batch": 4.0, "single": 4.0}
+
+    # Act
+    inversions = find_inversions(results, expected_faster)
+
+    # Assert
+    assert inversions == {"batch": (4.0, 4.0)}
+
+def test_synthetic_entries_are_reproducible():
+    """
+    Test that synthetic benchmark entries are the same for the same seed.
+    """
+    # Act
+    first = synthetic_entries(100)
+    second = synthetic_entries(100)
+
+    # Assert
+    assert len(first) == 100
+    assert first == second
+
+def test_relative_to_reference_cancels_machine_speed():
+    """
+    Test that timings from a machine twice as slow give the same multiples of the reference time.
+    """
+    # Arrange
+    fast = {"filter": 2.0, "sort": 5.0}
+    slow = {"filter": 4.0, "sort": 10.0}
+
+    # Act
+    fast_ratios = relative_to_reference(fast, reference=1.0)
+    slow_ratios = relative_to_reference(slow, reference=2.0)
+
+    # Assert
+    assert fast_ratios == slow_ratios == {"filter": 2.0, "sort": 5.0}
+    assert find_regressions(slow_ratios, fast_ratios) == {}
@@ -0,0 +1,88 @@
+import pickle
+import pytest
+from src.models.bulk_ingest import EntryBatch, ingest_archive
+from tests.constants import *
+from tests.utils import *
+
+def test_ingest_archive_directory(tmp_path):
+    """
+    Test ingest_archive over a directory of saved pages with several worker processes.
+    Every document should produce a batch, in file name order, with the expected entries.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html()
+    for name in ("2023-09-21.html", "2023-09-20.html", "2023-09-22.html"):
+        (tmp_path / name).write_text(mock_html_content, encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not a snapshot", encoding="utf-8")
+
+    # Act
+    batches = list(ingest_archive(tmp_path, max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, max_workers=2, chunk_size=1))
+
+    # Assert
+    assert [batch.source for batch in batches] == ["2023-09-20.html", "2023-09-21.html", "2023-09-22.html"]
+    for batch in batches:
+        assert batch.to_entries() == MOCK_HTML_EXPECTED_RETURN_VALUE
+
+def test_ingest_archive_iterable():
+    """
+    Test ingest_archive over an iterable of HTML documents.
+    """
+    # Act
+    batches = list(ingest_archive([get_mocked_hn_html()] * 2, max_workers=1))
+
+    # Assert
+    assert [len(batch) for batch in batches] == [MOCK_HTML_HN_ENTRIES_NUM] * 2
+
+def test_entry_batch_round_trips_through_pickle():
+    """
+    Test that an EntryBatch survives pickling with its entries and item ids intact.
+    """
+    # Arrange
+    entries = list(MOCK_HTML_EXPECTED_RETURN_VALUE)
+    batch = EntryBatch("snapshot", entries)
+
+    # Act
+    restored = pickle.loads(pickle.dumps(batch))
+
+    # Assert
+    assert restored.to_entries() == entries
+    assert [entry.item_id for entry in restored.to_entries()] == [None] * len(entries)
+
+def test_ingest_archive_invalid_source(tmp_path):
+    """
+    Test ingest_archive with a path that is not a directory, an unknown parser backend and an invalid chunk size.
+    The errors should be raised by the call itself, before iterating.
+    """
+    with pytest.raises(NotADirectoryError):
+        ingest_archive(tmp_path / "missing")
+    with pytest.raises(ValueError):
+        ingest_archive(tmp_path, parser="not a parser")
+    with pytest.raises(ValueError):
+        ingest_archive(tmp_path, chunk_size=0)
+
+def test_ingest_archive_reads_documents_lazily():
+    """
+    Test that ingest_archive reads no document when called, and only max_workers * chunk_size documents before the
+    first batch is yielded.
+    """
+    # Arrange
+    consumed = []
+    content = get_mocked_hn_html()
+
+    def documents():
+        for i in range(10):
+            consumed.append(i)
+            yield content
+
+    # Act
+    batches = ingest_archive(documents(), max_workers=2, chunk_size=2)
+    consumed_on_call = len(consumed)
+    first = next(batches)
+    consumed_on_first_batch = len(consumed)
+    remaining = list(batches)
+
+    # Assert
+    assert consumed_on_call == 0
+    assert consumed_on_first_batch == 4
+    assert first.source == "0"
+    assert [batch.source for batch in remaining] == [str(i) for i in range(1, 10)]
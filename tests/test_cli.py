@@ -0,0 +1,231 @@
+import csv
+import io
+import json
+import os
+import signal
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError
+from src.constants import WATCH_INITIAL_INTERVAL
+from src.main import OUTPUT_FIELDS, main
+from src.models.hn_watcher import EntryStoreSink, print_sink
+from src.utils.rate_limiter import HostRateLimiter
+from tests.constants import *
+from tests.utils import *
+
+# Root of the repository, from which the package is importable in a fresh interpreter
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def _loaded_modules(module: str) -> set[str]:
+    """
+    Imports module in a fresh interpreter and returns the names of the modules loaded once the import is done.
+    """
+    result = subprocess.run([sys.executable, '-c', f"import sys, {module}; print(*sys.modules)"],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+def _import_times(module: str) -> dict[str, float]:
+    """
+    Imports module in a fresh interpreter with -X importtime and returns the cumulative import time in milliseconds
+    of every module imported on the way.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1]) / 1000
+    return times
+
+def _run_cli(argv: list[str], response: Mock | None = None, error: Exception | None = None) -> tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with patch('src.models.hn_scraper.requests.get', return_value=response, side_effect=error), \
+         patch('src.models.hn_scraper.get_host_rate_limiter', return_value=HostRateLimiter(rate=1000, capacity=10)), \
+         patch('src.models.hn_scraper.HN_CRAWL_PAGE_DELAY', 0), \
+         patch('sys.stdout', stdout), patch('sys.stderr', stderr):
+        status = main(argv)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+class _StubWatcher:
+    """
+    Stand-in for HackerNewsWatcher that records how it was built and run. With interrupt set, run() sends SIGINT to
+    the process and returns once stop() has been called.
+    """
+    instances = []
+
+    def __init__(self, scraper, sinks, max_entries, min_interval, max_interval, initial_interval, interrupt=False):
+        self.scraper = scraper
+        self.sinks = sinks
+        self.max_entries = max_entries
+        self.intervals = (min_interval, initial_interval, max_interval)
+        self.interrupt = interrupt
+        self.max_cycles = None
+        self.stopped = False
+        _StubWatcher.instances.append(self)
+
+    def run(self, max_cycles=None):
+        self.max_cycles = max_cycles
+        if self.interrupt:
+            signal.raise_signal(signal.SIGINT)
+            assert self.stopped
+
+    def stop(self):
+        self.stopped = True
+
+def _mock_response() -> Mock:
+    response = Mock(content=get_mocked_hn_html())
+    response.raise_for_status.return_value = None
+    return response
+
+def test_cli_import_defers_heavy_modules():
+    """
+    Test that importing the command line loads neither requests nor the parsers, and that the scraper loads bs4,
+    asyncio, the comment crawler, the snapshot merge and queries only on the code paths that need them.
+    """
+    # Act
+    cli_modules = _loaded_modules('src.main')
+    scraper_modules = _loaded_modules('src.models.hn_scraper')
+
+    # Assert
+    assert not {'requests', 'urllib3', 'bs4', 'asyncio', 'src.models.hn_scraper'} & cli_modules
+    assert not {'bs4', 'lxml', 'asyncio', 'sqlite3', 'src.models.comment_thread', 'src.models.entry_diff',
+                'src.models.entry_query'} & scraper_modules
+
+@pytest.mark.skipif(bool(os.environ.get(SKIP_IMPORT_TIME_BUDGET_ENV)),
+                    reason=f"{SKIP_IMPORT_TIME_BUDGET_ENV} is set")
+def test_cli_import_stays_within_budget():
+    """
+    Test that importing the command line, and the scraper without requests, stays within its cumulative import time
+    budget. The fastest of three runs is used to keep the measurement stable on busy machines.
+    """
+    # Act
+    cli_time = min(_import_times('src.main')['src.main'] for _ in range(3))
+    scraper_time = min(times['src.models.hn_scraper'] - times.get('requests', 0)
+                       for times in (_import_times('src.models.hn_scraper') for _ in range(3)))
+
+    # Assert
+    assert cli_time < CLI_IMPORT_TIME_BUDGET_MS, f"Importing src.main took {cli_time:.1f} ms"
+    assert scraper_time < SCRAPER_IMPORT_TIME_BUDGET_MS, f"Importing the scraper took {scraper_time:.1f} ms"
+
+def test_cli_filters_sorts_and_writes_json():
+    """
+    Test that the filter, sort and limit options are applied before the entries are written as JSON.
+    """
+    # Act
+    status, output, _ = _run_cli(['--min-words', '5', '--sort', 'points', '--limit', '3', '--format', 'json'],
+                                 _mock_response())
+
+    # Assert
+    rows = json.loads(output)
+    assert status == 0
+    assert len(rows) == 3
+    assert list(rows[0]) == list(OUTPUT_FIELDS)
+    assert all(len(row['title'].split()) > 5 for row in rows)
+    assert [row['points'] for row in rows] == sorted((row['points'] for row in rows), reverse=True)
+
+def test_cli_crawls_pages_and_writes_csv():
+    """
+    Test that --pages crawls that many listing pages and that the csv format writes a header and one row per entry.
+    """
+    # Act
+    status, output, _ = _run_cli(['--pages', '2', '--sort', 'order_num', '--ascending', '--format', 'csv'],
+                                 _mock_response())
+
+    # Assert
+    rows = list(csv.DictReader(io.StringIO(output)))
+    assert status == 0
+    assert len(rows) == MOCK_HTML_HN_ENTRIES_NUM * 2
+    assert rows[0]['title'] == MOCK_HTML_EXPECTED_RETURN_VALUE[0].title
+
+def test_cli_without_options_prints_report():
+    """
+    Test that running without options prints the long and short title report of earlier versions.
+    """
+    # Act
+    status, output, _ = _run_cli([], _mock_response())
+
+    # Assert
+    assert status == 0
+    assert "Titles Longer than 5 Words Sorted by Comments" in output
+    assert "Titles Shorter than or Equal to 5 Words Sorted by Points" in output
+
+def test_cli_errors():
+    """
+    Test that a failed fetch exits with status 1 and a message, and that an unknown sort key is a usage error.
+    """
+    # Act
+    status, _, error_output = _run_cli(['--feed', 'ask'], error=HTTPError("Mocked HTTP Error"))
+    with pytest.raises(SystemExit) as usage_error:
+        _run_cli(['--sort', 'nonsense'], _mock_response())
+
+    # Assert
+    assert status == 1
+    assert "'ask'" in error_output
+    assert usage_error.value.code == 2
+
+def test_cli_watch_runs_watcher_with_sinks(tmp_path):
+    """
+    Test that --watch runs the watcher on the chosen feed with the interval options, a print sink and, with --store,
+    an EntryStoreSink.
+    """
+    # Arrange
+    _StubWatcher.instances.clear()
+    store_path = tmp_path / 'watch.db'
+
+    # Act
+    with patch('src.models.hn_watcher.HackerNewsWatcher', _StubWatcher):
+        status, _, _ = _run_cli(['--watch', '--feed', 'newest', '--interval', '45', '--min-interval', '40',
+                                 '--max-interval', '600', '--store', str(store_path), '--cycles', '3'])
+
+    # Assert
+    watcher, = _StubWatcher.instances
+    assert status == 0
+    assert watcher.scraper.feed == 'newest'
+    assert watcher.intervals == (40, 45, 600)
+    assert watcher.max_cycles == 3
+    assert watcher.sinks[0] is print_sink
+    assert isinstance(watcher.sinks[1], EntryStoreSink)
+    assert watcher.sinks[1].url == watcher.scraper.url
+    assert store_path.exists()
+
+def test_cli_watch_stops_on_sigint():
+    """
+    Test that SIGINT stops the watcher instead of raising KeyboardInterrupt, and that the previous handler is restored.
+    """
+    # Arrange
+    _StubWatcher.instances.clear()
+    previous_handler = signal.getsignal(signal.SIGINT)
+
+    # Act
+    with patch('src.models.hn_watcher.HackerNewsWatcher',
+               lambda *args, **kwargs: _StubWatcher(*args, **kwargs, interrupt=True)):
+        status, _, _ = _run_cli(['--watch'])
+
+    # Assert
+    watcher, = _StubWatcher.instances
+    assert status == 0
+    assert watcher.stopped
+    assert watcher.sinks == [print_sink]
+    assert watcher.intervals[1] == WATCH_INITIAL_INTERVAL
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+
+def test_cli_watch_errors():
+    """
+    Test that --watch rejects the one-shot options and intervals out of order, and that --store requires --watch.
+    """
+    # Act
+    with pytest.raises(SystemExit) as format_error:
+        _run_cli(['--watch', '--format', 'json'])
+    with pytest.raises(SystemExit) as interval_error:
+        _run_cli(['--watch', '--min-interval', '60', '--interval', '30'])
+    with pytest.raises(SystemExit) as store_error:
+        _run_cli(['--store', 'entries.db'])
+
+    # Assert
+    assert format_error.value.code == 2
+    assert interval_error.value.code == 2
+    assert store_error.value.code == 2
@@ -0,0 +1,101 @@
+from unittest.mock import patch, Mock
+from requests.exceptions import HTTPError
+from src.models.comment_thread import NO_PARENT, CommentCrawler, parse_comment_page, parse_comment_thread
+from src.models.hn_entry import HackerNewsEntry
+from src.utils.rate_limiter import HostRateLimiter
+from tests.utils import *
+
+def _item_page_with_more_link(next_page: int) -> str:
+    more_link = f'<a href="item?id=37596497&amp;p={next_page}" class="morelink" rel="next">More</a>'
+    return get_mocked_hn_item_html().replace('</body>', more_link + '</body>')
+
+def _page_response(content: str) -> Mock:
+    response = Mock(content=content)
+    response.raise_for_status.return_value = None
+    return response
+
+def test_parse_comment_thread():
+    """
+    Test that the comments of an item page are parsed into parent index arrays in page order.
+    """
+    # Act
+    thread = parse_comment_thread(get_mocked_hn_item_html(), 37596497)
+
+    # Assert
+    assert list(thread.comment_ids) == [37596600, 37596650, 37596680, 37596701]
+    assert list(thread.parents) == [NO_PARENT, 0, 1, NO_PARENT]
+    assert list(thread.depths) == [0, 1, 2, 0]
+    assert thread.authors == ["alice", "bob", "alice", None]
+    assert thread.authors[0] is thread.authors[2]
+    assert thread.bodies[0] == "This is great. I've wanted exactly this.\n\nSecond paragraph with a link."
+    assert thread.bodies[1:] == ["Agreed.", "Thanks!", "[flagged]"]
+    assert thread.roots() == [0, 3]
+    assert thread.children(0) == [1]
+
+def test_comment_crawler_fetches_each_item_once():
+    """
+    Test that the crawler fetches every distinct item once per crawl, skips entries without ids and leaves out
+    items whose page could not be fetched.
+    """
+    # Arrange
+    ok_response = Mock(content=get_mocked_hn_item_html())
+    ok_response.raise_for_status.return_value = None
+    error_response = Mock()
+    error_response.raise_for_status.side_effect = HTTPError("503 Server Error")
+
+    def fake_get(url, params=None, **kwargs):
+        return error_response if params["id"] == 3 else ok_response
+
+    crawler = CommentCrawler(max_workers=2, rate_limiter=HostRateLimiter(rate=1000, capacity=10))
+    items = [1, HackerNewsEntry("Title", 1, 0, 0, item_id=2), 1, HackerNewsEntry("No id", 2, 0, 0), 3]
+
+    # Act
+    with patch('src.models.comment_thread.requests.get', side_effect=fake_get) as mock_get:
+        threads = crawler.crawl(items)
+
+    # Assert
+    assert sorted(call.kwargs["params"]["id"] for call in mock_get.call_args_list) == [1, 2, 3]
+    assert list(threads) == [1, 2]
+    assert threads[2].item_id == 2 and len(threads[2]) == 4
+
+def test_parse_comment_page_reads_more_link():
+    """
+    Test that the number of the next page is read from the 'More' link, and that a page without one has no next page.
+    """
+    # Act
+    thread, next_page = parse_comment_page(_item_page_with_more_link(2), 37596497)
+    thread, last_page = parse_comment_page(get_mocked_hn_item_html(), 37596497, thread)
+
+    # Assert
+    assert next_page == 2
+    assert last_page is None
+    assert len(thread) == 8
+    assert thread.roots() == [0, 3, 4, 7]
+
+def test_comment_crawler_follows_more_links():
+    """
+    Test that the crawler fetches every page of a long thread, and returns it marked as truncated with a warning
+    once max_pages pages were fetched.
+    """
+    # Arrange
+    pages = {1: _item_page_with_more_link(2), 2: _item_page_with_more_link(3), 3: get_mocked_hn_item_html()}
+
+    def fake_get(url, params=None, **kwargs):
+        return _page_response(pages[params.get("p", 1)])
+
+    rate_limiter = HostRateLimiter(rate=1000, capacity=10)
+    crawler = CommentCrawler(rate_limiter=rate_limiter)
+    limited_crawler = CommentCrawler(rate_limiter=rate_limiter, max_pages=2)
+
+    # Act
+    with patch('src.models.comment_thread.requests.get', side_effect=fake_get) as mock_get, \
+         patch('src.models.comment_thread.logger') as mock_logger:
+        complete = crawler.crawl([37596497])[37596497]
+        requested_pages = [call.kwargs["params"].get("p", 1) for call in mock_get.call_args_list]
+        truncated = limited_crawler.crawl([37596497])[37596497]
+
+    # Assert
+    assert requested_pages == [1, 2, 3]
+    assert len(complete) == 12 and not complete.truncated
+    assert len(truncated) == 8 and truncated.truncated
+    mock_logger.warning.assert_called_once()
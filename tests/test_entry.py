@@ -0,0 +1,85 @@
+import pytest
+from src.models.hn_entry import HackerNewsEntry
+
+def test_entry_has_no_instance_dict():
+    """
+    Test that HackerNewsEntry stores its fields in slots.
+    Instances should have no __dict__ and reject unknown attributes.
+    """
+    # Arrange
+    entry = HackerNewsEntry("Title A", 1, 10, 100)
+
+    # Act and Assert
+    assert not hasattr(entry, '__dict__')
+    with pytest.raises(AttributeError):
+        entry.unknown_attribute = 1
+
+def test_entry_invalid_values_use_defaults():
+    """
+    Test HackerNewsEntry with invalid field values, including an invalid title set before order_num.
+    Invalid fields should fall back to the default values instead of raising.
+    """
+    # Act
+    entry = HackerNewsEntry(None, -1, "ten", None)
+
+    # Assert
+    assert entry.title == 'BAD STRING'
+    assert entry.order_num == 0
+    assert entry.comment_count == 0
+    assert entry.points == 0
+
+def test_trusted_entries_equal_validated_entries():
+    """
+    Test that trusted and bulk_trusted build entries equal to, and printed like, those built by the constructor.
+    """
+    # Arrange
+    rows = [("Title A", 1, 10, 100), ("Title B", 2, 20, 200)]
+
+    # Act
+    validated = [HackerNewsEntry(*row) for row in rows]
+    trusted = [HackerNewsEntry.trusted(*row) for row in rows]
+    bulk = HackerNewsEntry.bulk_trusted(rows)
+
+    # Assert
+    assert trusted == validated
+    assert bulk == validated
+    assert [repr(entry) for entry in bulk] == [repr(entry) for entry in validated]
+
+def test_bulk_trusted_row_layouts():
+    """
+    Test that bulk_trusted takes rows with or without the optional fields, and rejects rows of any other length.
+    """
+    # Arrange
+    rows = [("Title A", 1, 10, 100, 7, "https://Example.com/a", "alice", 1000),
+            ("Title B", 2, 20, 200, None, None, None, None)]
+
+    # Act
+    bulk = HackerNewsEntry.bulk_trusted(iter(rows))
+    trusted = [HackerNewsEntry.trusted(*row) for row in rows]
+
+    # Assert
+    assert HackerNewsEntry.bulk_trusted([]) == []
+    assert [(entry.item_id, entry.url, entry.host, entry.author, entry.posted_at) for entry in bulk] == \
+           [(entry.item_id, entry.url, entry.host, entry.author, entry.posted_at) for entry in trusted]
+    assert bulk[0].host == "example.com" and bulk[1].host is None
+    with pytest.raises(ValueError):
+        HackerNewsEntry.bulk_trusted([("Title A", 1, 10, 100, 7)])
+
+def test_entry_optional_fields():
+    """
+    Test the URL, host, author and submission time fields: hosts are interned and invalid values become None.
+    """
+    # Arrange
+    first = HackerNewsEntry("Title", 1, 0, 0, url="https://Example.com/a", author="alice", posted_at=1000)
+    second = HackerNewsEntry.trusted("Title", 2, 0, 0, None, "https://example.com/b", "alice", 2000)
+
+    # Act
+    invalid = HackerNewsEntry("Title", 3, 0, 0, url=42, author=["bob"], posted_at=-5)
+
+    # Assert
+    assert first.host == "example.com" and first.host is second.host
+    assert first.author is second.author
+    assert first.age(now=1600) == 600
+    assert first.copy().url == first.url and first.copy().posted_at == 1000
+    assert (invalid.url, invalid.host, invalid.author, invalid.posted_at) == (None, None, None, None)
+    assert invalid.age() is None
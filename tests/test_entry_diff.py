@@ -0,0 +1,101 @@
+import datetime
+from unittest.mock import patch, Mock
+from src.models.entry_diff import merge_entries
+from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_scraper import HackerNewsScraper
+from tests.constants import *
+from tests.utils import *
+
+def test_merge_entries_reports_changes():
+    """
+    Test merge_entries with entries that are added, moved, updated and dropped.
+    Matching entries should keep their identity and be updated in place.
+    """
+    # Arrange
+    current = [
+        HackerNewsEntry("Title A", 1, 10, 100, item_id=101),
+        HackerNewsEntry("Title B", 2, 20, 200, item_id=102),
+        HackerNewsEntry("Title C", 3, 30, 300, item_id=103),
+    ]
+    entry_a, entry_b = current[0], current[1]
+    fresh = [
+        HackerNewsEntry("Title B", 1, 25, 210, item_id=102),
+        HackerNewsEntry("Title A", 2, 10, 100, item_id=101),
+        HackerNewsEntry("Title D", 3, 0, 1, item_id=104),
+    ]
+
+    # Act
+    merged, changes = merge_entries(current, fresh)
+
+    # Assert
+    assert merged == fresh
+    assert merged[0] is entry_b and merged[1] is entry_a
+    assert [entry.item_id for entry in changes.added] == [104]
+    assert [entry.item_id for entry in changes.moved] == [102, 101]
+    assert [entry.item_id for entry in changes.updated] == [102]
+    assert [entry.item_id for entry in changes.dropped] == [103]
+
+def test_merge_entries_updates_url_author_and_posted_at():
+    """
+    Test merge_entries with an entry whose url, author and submission time changed.
+    The entry should be reported as updated and carry the new values and host.
+    """
+    # Arrange
+    current = [HackerNewsEntry("Title A", 1, 10, 100, item_id=101, url="https://old.example.com/a", author="alice")]
+    fresh = [HackerNewsEntry("Title A", 1, 10, 100, item_id=101, url="https://new.example.com/a", author="bob",
+                             posted_at=1700000000)]
+
+    # Act
+    merged, changes = merge_entries(current, fresh)
+
+    # Assert
+    assert merged[0] is current[0]
+    assert changes.updated == [current[0]]
+    assert merged[0].url == "https://new.example.com/a"
+    assert merged[0].host == "new.example.com"
+    assert merged[0].author == "bob"
+    assert merged[0].posted_at == 1700000000
+
+def test_merge_entries_without_changes():
+    """
+    Test merge_entries with an identical snapshot.
+    The change set should be empty.
+    """
+    # Arrange
+    current = [HackerNewsEntry("Title A", 1, 10, 100, item_id=101)]
+
+    # Act
+    merged, changes = merge_entries(current, [entry.copy() for entry in current])
+
+    # Assert
+    assert merged[0] is current[0]
+    assert not changes
+
+def test_refresh_hn_entries_updates_in_place():
+    """
+    Test refresh_hn_entries against a modified copy of the mock yCombinator html file.
+    Only the entry whose points changed should be reported, and it should keep its identity.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html()
+    mock_response = Mock()
+    mock_response.content = mock_html_content
+    mock_response.raise_for_status.return_value = None
+    updated_response = Mock()
+    updated_response.content = mock_html_content.replace("363 points", "400 points")
+    updated_response.raise_for_status.return_value = None
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+    first_entry = scraper.entries[0]
+    scraper.last_fetch_time = datetime.datetime.min
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=updated_response):
+        changes = scraper.refresh_hn_entries(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+
+    # Assert
+    assert changes.updated == [first_entry]
+    assert not changes.added and not changes.moved and not changes.dropped
+    assert scraper.entries[0] is first_entry
+    assert first_entry.points == 400
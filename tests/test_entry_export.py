@@ -0,0 +1,95 @@
+import io
+import pytest
+from src.models.entry_export import ColumnarEntryFile, load_entries, read_rows, write_columnar, write_rows
+from src.models.hn_entry import HackerNewsEntry
+
+ENTRIES = [
+    HackerNewsEntry("Title A – with a dash", 1, 10, 100, item_id=101, url="https://example.com/a – ü",
+                    author="alice", posted_at=1700000000),
+    HackerNewsEntry("Title B", 2, 0, 200),
+    HackerNewsEntry("", 3, 30, 0, item_id=103, author="bob"),
+]
+
+def _extra_fields(entries: list[HackerNewsEntry]) -> list[tuple]:
+    return [(entry.item_id, entry.url, entry.host, entry.author, entry.posted_at) for entry in entries]
+
+def test_columnar_round_trip(tmp_path):
+    """
+    Test that a columnar export can be memory-mapped, read column by column and rebuilt into entries.
+    """
+    # Arrange
+    path = tmp_path / "entries.hnc"
+
+    # Act
+    count = write_columnar(iter(ENTRIES), path)
+    with ColumnarEntryFile(path) as columnar:
+        points = columnar.column('points')
+        points_values = list(points)
+        item_ids = list(columnar.column('item_id'))
+        posted_ats = list(columnar.column('posted_at'))
+        last = columnar[-1]
+        entries = list(columnar)
+        if isinstance(points, memoryview):
+            points.release()
+
+    # Assert
+    assert count == len(ENTRIES)
+    assert points_values == [100, 200, 0]
+    assert item_ids == [101, -1, 103]
+    assert posted_ats == [1700000000, -1, -1]
+    assert last == ENTRIES[-1]
+    assert entries == ENTRIES
+    assert _extra_fields(entries) == _extra_fields(ENTRIES)
+
+def test_row_round_trip():
+    """
+    Test that the row format streams entries out and back in order.
+    """
+    # Arrange
+    stream = io.BytesIO()
+
+    # Act
+    count = write_rows(iter(ENTRIES), stream)
+    stream.seek(0)
+    entries = list(read_rows(stream))
+
+    # Assert
+    assert count == len(ENTRIES)
+    assert entries == ENTRIES
+    assert _extra_fields(entries) == _extra_fields(ENTRIES)
+
+def test_load_entries_detects_format(tmp_path):
+    """
+    Test that load_entries reads both formats and rejects other files, including files of the first format version.
+    """
+    # Arrange
+    columnar_path = tmp_path / "entries.hnc"
+    row_path = tmp_path / "entries.hnr"
+    other_path = tmp_path / "entries.txt"
+    write_columnar(ENTRIES, columnar_path)
+    with open(row_path, "wb") as stream:
+        write_rows(ENTRIES, stream)
+    other_path.write_bytes(b"not an export")
+    old_path = tmp_path / "entries_v1.hnr"
+    old_path.write_bytes(b"HNROW\x00\x00\x01")
+
+    # Act / Assert
+    assert list(load_entries(columnar_path)) == ENTRIES
+    assert list(load_entries(row_path)) == ENTRIES
+    with pytest.raises(ValueError):
+        list(load_entries(other_path))
+    with pytest.raises(ValueError):
+        list(load_entries(old_path))
+
+def test_truncated_row_stream_is_rejected():
+    """
+    Test that a row stream cut in the middle of a record raises a ValueError.
+    """
+    # Arrange
+    stream = io.BytesIO()
+    write_rows(ENTRIES, stream)
+    truncated = io.BytesIO(stream.getvalue()[:-3])
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        list(read_rows(truncated))
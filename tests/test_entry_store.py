@@ -0,0 +1,88 @@
+import pytest
+import sqlite3
+from src.models.entry_store import EntryStore
+from src.models.hn_entry import HackerNewsEntry
+
+def test_entry_store_records_snapshots_and_trajectories(tmp_path):
+    """
+    Test that snapshots are persisted and that an item's trajectory follows them in fetch order.
+    """
+    # Arrange
+    path = tmp_path / 'entries.db'
+    first = [
+        HackerNewsEntry("Title A", 1, 10, 100, item_id=101),
+        HackerNewsEntry("Title B", 2, 20, 200, item_id=102),
+    ]
+    second = [
+        HackerNewsEntry("Title B", 1, 25, 250, item_id=102),
+        HackerNewsEntry("Title A", 2, 12, 110, item_id=101),
+    ]
+
+    # Act
+    with EntryStore(path) as store:
+        store.record_snapshots([(second, 2000.0, 'https://news.ycombinator.com/'),
+                                (first, 1000.0, 'https://news.ycombinator.com/')])
+    with EntryStore(path) as store:
+        snapshots = store.snapshots()
+        trajectory = store.item_trajectory(102)
+        recent = store.item_trajectory(102, since=1500.0)
+        loaded = store.load_snapshot(snapshots[0][0])
+        top = store.top_items('points', limit=1)
+
+    # Assert
+    assert [fetched_at for _, fetched_at, _ in snapshots] == [1000.0, 2000.0]
+    assert trajectory == [(1000.0, 2, 200, 20), (2000.0, 1, 250, 25)]
+    assert recent == [(2000.0, 1, 250, 25)]
+    assert loaded == first
+    assert [entry.item_id for entry in loaded] == [101, 102]
+    assert top == [(102, "Title B", 250)]
+
+def test_entry_store_rejects_invalid_input():
+    """
+    Test that invalid entries and unknown ranking metrics are rejected without writing anything.
+    """
+    # Arrange
+    store = EntryStore(':memory:')
+
+    # Act / Assert
+    with pytest.raises(TypeError):
+        store.record_snapshot(["not an entry"])
+    with pytest.raises(ValueError):
+        store.top_items('title')
+    assert store.snapshots() == []
+    store.close()
+
+def test_entry_store_migrates_old_databases(tmp_path):
+    """
+    Test that a database written before entries had url, author and posted_at columns is migrated on open, keeping
+    its snapshots and accepting new ones with the added fields.
+    """
+    # Arrange
+    path = tmp_path / 'entries.db'
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE snapshots (id INTEGER PRIMARY KEY, fetched_at REAL NOT NULL, url TEXT NOT NULL);
+        CREATE TABLE entries (snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+                              item_id INTEGER, order_num INTEGER NOT NULL, title TEXT NOT NULL,
+                              points INTEGER NOT NULL, comment_count INTEGER NOT NULL);
+        INSERT INTO snapshots (id, fetched_at, url) VALUES (1, 1000.0, 'https://news.ycombinator.com/');
+        INSERT INTO entries VALUES (1, 101, 1, 'Title A', 10, 100);
+    """)
+    connection.commit()
+    connection.close()
+    entry = HackerNewsEntry("Title B", 1, 20, 200, item_id=102, url="https://example.com/b", author="alice",
+                            posted_at=1695300000)
+
+    # Act
+    with EntryStore(path) as store:
+        snapshot_id = store.record_snapshot([entry], 2000.0)
+    with EntryStore(path) as store:
+        old = store.load_snapshot(1)
+        new = store.load_snapshot(snapshot_id)
+        version = store._connection.execute("PRAGMA user_version").fetchone()[0]
+
+    # Assert
+    assert old == [HackerNewsEntry("Title A", 1, 100, 10, item_id=101)]
+    assert old[0].url is None and old[0].author is None and old[0].posted_at is None
+    assert new[0].url == "https://example.com/b" and new[0].author == "alice" and new[0].posted_at == 1695300000
+    assert version == 2
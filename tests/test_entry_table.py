@@ -0,0 +1,134 @@
+import pytest
+from src.models.entry_table import EntryTable
+from src.models.hn_entry import HackerNewsEntry
+from tests.utils import *
+
+entries = [
+    HackerNewsEntry("Short title", 1, 10, 100),
+    HackerNewsEntry("This is a much longer title than the previous one", 2, 20, 200),
+    HackerNewsEntry("Another short title", 3, 30, 200),
+    HackerNewsEntry("Yet another very long title that exceeds the five-word limit", 4, 40, 400),
+    HackerNewsEntry("Word count equals limit here", 5, 50, 500),
+]
+
+def test_filters_match_list_semantics():
+    """
+    Test filter_by_min_title_length and filter_by_max_title_length on an EntryTable.
+    The views should contain the same entries as the list-based scraper filters.
+    """
+    # Arrange
+    table = EntryTable(entries)
+
+    # Act
+    long_titles = table.filter_by_min_title_length(5)
+    short_titles = table.filter_by_max_title_length(5)
+
+    # Assert
+    assert long_titles.to_entries() == [entry for entry in entries if len(entry.title.split()) > 5]
+    assert short_titles.to_entries() == [entry for entry in entries if len(entry.title.split()) <= 5]
+    assert len(table) == len(entries), "Expected the source table to be left untouched."
+
+def test_filters_with_word_limit_zero():
+    """
+    Test both title length filters with a word limit of zero.
+    The result should always be empty.
+    """
+    table = EntryTable(entries)
+    assert len(table.filter_by_min_title_length(0)) == 0
+    assert len(table.filter_by_max_title_length(-5)) == 0
+
+def test_sorts_are_stable_and_descending():
+    """
+    Test sort_by_points and sort_by_comments on a filtered view.
+    Sorting should be descending, keep the order of ties and only include the rows of the view.
+    """
+    # Arrange
+    table = EntryTable(entries).filter_by_max_title_length(5)
+
+    # Act
+    by_points = table.sort_by_points()
+    by_comments = table.sort_by_comments()
+
+    # Assert
+    assert by_points.column('order_num') == [5, 3, 1]
+    assert by_comments.column('comment_count') == [50, 30, 10]
+    assert validate_hnentry_list_type(by_points.to_entries())
+
+def test_invalid_input():
+    """
+    Test EntryTable with invalid entries and word limit types.
+    The table should raise a TypeError.
+    """
+    with pytest.raises(TypeError):
+        EntryTable("not a list")
+    with pytest.raises(TypeError):
+        EntryTable(entries).filter_by_min_title_length("not an int")
+
+def test_views_cannot_be_extended():
+    """
+    Test extending a view of an EntryTable.
+    The table should raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        EntryTable(entries).sort_by_points().extend(entries)
+
+def test_views_keep_every_field():
+    """
+    Test that entries rebuilt from a sorted view keep their item id, url, author and submission time.
+    """
+    # Arrange
+    detailed = [
+        HackerNewsEntry("First title", 1, 10, 100, item_id=101, url="https://example.com/a", author="alice",
+                        posted_at=1700000000),
+        HackerNewsEntry("Second title", 2, 20, 200),
+    ]
+
+    # Act
+    rebuilt = EntryTable(detailed).sort_by_points().to_entries()
+
+    # Assert
+    assert [entry.item_id for entry in rebuilt] == [None, 101]
+    assert rebuilt[1].url == "https://example.com/a"
+    assert rebuilt[1].host == "example.com"
+    assert rebuilt[1].author == "alice"
+    assert rebuilt[1].posted_at == 1700000000
+    assert rebuilt[0].url is None
+
+def test_slices_are_views():
+    """
+    Test slicing a table and a sorted view.
+    The slices should be views with the selected rows, and filtering them should only consider those rows.
+    """
+    # Arrange
+    table = EntryTable(entries)
+    by_points = table.sort_by_points()
+
+    # Act
+    head = by_points[:2]
+    tail = table[-2:]
+    stepped = table[::2]
+
+    # Assert
+    assert isinstance(head, EntryTable)
+    assert head.column('order_num') == [5, 4]
+    assert tail.to_entries() == entries[-2:]
+    assert stepped.column('order_num') == [1, 3, 5]
+    assert head.filter_by_max_title_length(5).column('order_num') == [5]
+    assert table[-1] == entries[-1]
+
+@pytest.mark.parametrize("rows", [slice(None), slice(0, 1)])
+def test_view_filters_match_list_semantics(rows):
+    """
+    Test the title length filters on a large and a small view of a sorted table, which are masked differently.
+    """
+    # Arrange
+    view = EntryTable(entries).sort_by_comments()[rows]
+    view_entries = view.to_entries()
+
+    # Act
+    long_titles = view.filter_by_min_title_length(5)
+    short_titles = view.filter_by_max_title_length(5)
+
+    # Assert
+    assert long_titles.to_entries() == [entry for entry in view_entries if entry.word_count > 5]
+    assert short_titles.to_entries() == [entry for entry in view_entries if entry.word_count <= 5]
@@ -0,0 +1,78 @@
+import pytest
+import threading
+from unittest.mock import patch, Mock
+from src.constants import HN_FEED_URLS
+from src.models.hn_scraper import HackerNewsScraper, HackerNewsFeedScraper
+from src.utils.rate_limiter import HostRateLimiter
+from tests.constants import *
+from tests.utils import *
+
+def make_mock_response() -> Mock:
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+def test_feed_scrapers_are_independent():
+    """
+    Test that HackerNewsFeedScraper instances are separate objects, each fetching its own feed URL into its own entries.
+    """
+    # Arrange
+    rate_limiter = HostRateLimiter(rate=1000)
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=make_mock_response()) as mocked_get:
+        news = HackerNewsFeedScraper('news', max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, rate_limiter=rate_limiter)
+        ask = HackerNewsFeedScraper('ask', max_entries=5, rate_limiter=rate_limiter)
+
+    # Assert
+    assert news is not ask
+    assert news.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert ask.entries == MOCK_HTML_EXPECTED_RETURN_VALUE[:5]
+    assert [call.args[0] for call in mocked_get.call_args_list] == [HN_FEED_URLS['news'], HN_FEED_URLS['ask']]
+
+def test_feed_scrapers_share_host_rate_limiter():
+    """
+    Test that feed scrapers fetching in parallel threads all reserve their requests on the shared host rate limiter.
+    """
+    # Arrange
+    rate_limiter = HostRateLimiter(rate=1000)
+    scrapers = [HackerNewsFeedScraper(feed, fetch=False, rate_limiter=rate_limiter) for feed in HN_FEED_URLS]
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=make_mock_response()), \
+         patch.object(rate_limiter, 'reserve', wraps=rate_limiter.reserve) as reserve:
+        threads = [threading.Thread(target=scraper.fetch_hn_entries, args=(MOCK_HTML_HN_ENTRIES_NUM,)) for scraper in scrapers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Assert
+    assert reserve.call_count == len(HN_FEED_URLS)
+    assert {call.args[0] for call in reserve.call_args_list} == {'news.ycombinator.com'}
+    for scraper in scrapers:
+        assert len(scraper.entries) == MOCK_HTML_HN_ENTRIES_NUM
+
+def test_feed_scraper_unknown_feed():
+    """
+    Test HackerNewsFeedScraper with an unknown feed name.
+    The constructor should raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        HackerNewsFeedScraper('not a feed', fetch=False)
+
+def test_base_scraper_is_still_a_singleton():
+    """
+    Test that HackerNewsScraper keeps its singleton behaviour alongside feed scrapers.
+    """
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=make_mock_response()):
+        HackerNewsScraper._instance = None
+        first = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+        second = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+        feed = HackerNewsFeedScraper(fetch=False)
+
+    # Assert
+    assert first is second
+    assert feed is not first
@@ -0,0 +1,82 @@
+import datetime
+from unittest.mock import patch, Mock
+from src.models.hn_scraper import HackerNewsScraper
+from src.utils.http_cache import HttpCache
+from tests.constants import *
+from tests.utils import *
+
+def make_response(content: bytes, status_code: int = 200, etag: str | None = '"v1"') -> Mock:
+    response = Mock()
+    response.content = content
+    response.status_code = status_code
+    response.headers = {'ETag': etag} if etag else {}
+    response.raise_for_status.return_value = None
+    return response
+
+def test_cache_revalidates_with_etag():
+    """
+    Test that a cached URL is requested with If-None-Match and that a 304 response returns the cached body.
+    """
+    # Arrange
+    cache = HttpCache()
+    http_get = Mock(side_effect=[make_response(b"page"), make_response(b"", status_code=304)])
+
+    # Act
+    first = cache.get(http_get, "https://news.ycombinator.com/news")
+    second = cache.get(http_get, "https://news.ycombinator.com/news")
+
+    # Assert
+    assert first == second == b"page"
+    assert 'If-None-Match' not in http_get.call_args_list[0].kwargs['headers']
+    assert http_get.call_args_list[1].kwargs['headers']['If-None-Match'] == '"v1"'
+
+def test_cache_skips_responses_without_validators():
+    """
+    Test that responses without ETag or Last-Modified are not cached, so later requests are not conditional.
+    """
+    # Arrange
+    cache = HttpCache()
+    http_get = Mock(return_value=make_response(b"page", etag=None))
+
+    # Act
+    cache.get(http_get, "https://news.ycombinator.com/news")
+    cache.get(http_get, "https://news.ycombinator.com/news")
+
+    # Assert
+    assert 'If-None-Match' not in http_get.call_args_list[1].kwargs['headers']
+
+def test_cache_persists_to_disk_with_lru_eviction(tmp_path):
+    """
+    Test the on-disk store: responses survive a new cache instance, and the least recently used ones are evicted.
+    """
+    # Arrange
+    cache = HttpCache(cache_dir=tmp_path, max_memory_entries=1, max_disk_entries=2)
+    for page in (1, 2, 3):
+        cache.get(Mock(return_value=make_response(f"page {page}".encode())), "https://news.ycombinator.com/news", {'p': page})
+
+    # Act
+    reloaded = HttpCache(cache_dir=tmp_path)
+
+    # Assert
+    assert reloaded.lookup(reloaded._key("https://news.ycombinator.com/news", {'p': 1})) is None
+    assert reloaded.lookup(reloaded._key("https://news.ycombinator.com/news", {'p': 3})).content == b"page 3"
+    assert len(list(tmp_path.glob('*.json'))) == 2
+
+def test_scraper_skips_parsing_identical_bodies():
+    """
+    Test that fetching an unchanged page twice only parses it once.
+    """
+    # Arrange
+    mock_response = make_response(get_mocked_hn_html().encode('utf-8'))
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, http_cache=HttpCache())
+        scraper.last_fetch_time = datetime.datetime.min
+
+        # Act
+        with patch.object(scraper.parser, 'parse', wraps=scraper.parser.parse) as parse:
+            scraper.fetch_hn_entries(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+
+    # Assert
+    assert parse.call_count == 0
+    assert scraper.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
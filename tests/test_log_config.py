@@ -0,0 +1,81 @@
+import logging
+from src.utils import log_config
+from src.utils.log_config import QueueLogWriter, RateLimitedDedupFilter, setup_logger
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+def _record(msg, *args, level=logging.WARNING):
+    return logging.LogRecord('src.models.hn_entry', level, __file__, 1, msg, args, None)
+
+def test_dedup_filter_drops_repeats_and_reports_them():
+    """
+    Test that records sharing a message template are limited per window and that the next window reports drops.
+    """
+    # Arrange
+    dedup = RateLimitedDedupFilter(interval=60, burst=2)
+    template = "order_num %s received invalid %s value: %s."
+
+    # Act
+    passed = [dedup.filter(_record(template, i, "'points'", -1)) for i in range(5)]
+    error_passed = dedup.filter(_record(template, 6, "'points'", -1, level=logging.ERROR))
+    dedup.interval = 0
+    next_window = _record(template, 7, "'points'", -1)
+    dedup.filter(next_window)
+
+    # Assert
+    assert passed == [True, True, False, False, False]
+    assert error_passed
+    assert next_window.getMessage().endswith("(3 similar messages suppressed)")
+
+def test_queue_log_writer_writes_batches():
+    """
+    Test that queued records are formatted and written by the writer thread, with one flush per batch.
+    """
+    # Arrange
+    handler = _ListHandler()
+    writer = QueueLogWriter([handler], batch_size=100)
+    for i in range(10):
+        writer.queue.put(_record("message %s", i))
+
+    # Act
+    writer.start()
+    writer.stop()
+
+    # Assert
+    assert handler.messages == [f"message {i}" for i in range(10)]
+    assert handler.flushes == 1
+
+def test_enable_queue_logging_switches_configured_loggers(tmp_path, monkeypatch):
+    """
+    Test that loggers set up by setup_logger move to the queue handler and back, and that queued warnings reach the
+    log file.
+    """
+    # Arrange
+    log_file = tmp_path / "log.log"
+    monkeypatch.setattr(log_config, 'LOG_FILE_NAME', str(log_file))
+    logging.getLogger('tests.queue_logging').propagate = False
+    logger = setup_logger('tests.queue_logging')
+
+    # Act
+    log_config.enable_queue_logging()
+    try:
+        queued_handlers = list(logger.handlers)
+        logger.warning("order_num %s received invalid %s value: %s.", 1, "'points'", -1)
+    finally:
+        log_config.disable_queue_logging()
+    direct_handlers = list(logger.handlers)
+
+    # Assert
+    assert len(queued_handlers) == 1 and isinstance(queued_handlers[0], logging.handlers.QueueHandler)
+    assert direct_handlers and not any(isinstance(h, logging.handlers.QueueHandler) for h in direct_handlers)
+    assert "order_num 1 received invalid 'points' value: -1." in log_file.read_text()
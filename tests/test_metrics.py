@@ -0,0 +1,89 @@
+import datetime
+import pytest
+from unittest.mock import patch, Mock
+from src.models.hn_entry import HackerNewsEntry
+from src.models.hn_scraper import HackerNewsScraper
+from src.utils import metrics
+from src.utils.metrics import MetricsRegistry
+from tests.constants import *
+from tests.utils import *
+
+@pytest.fixture
+def enabled_metrics():
+    registry = metrics.enable_metrics()
+    registry.reset()
+    yield registry
+    metrics.disable_metrics()
+    registry.reset()
+
+def test_registry_renders_prometheus_text():
+    """
+    Test that counters and histograms are rendered in the Prometheus text format and forwarded to listeners.
+    """
+    # Arrange
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter('requests_total', "Requests.", ('status',))
+    histogram = registry.histogram('latency_seconds', "Latency.", buckets=(0.1, 1))
+    received = []
+    registry.add_listener(lambda name, labels, value: received.append((name, labels, value)))
+
+    # Act
+    counter.inc(status='200')
+    counter.inc(2, status='200')
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    text = registry.render_prometheus()
+
+    # Assert
+    assert 'requests_total{status="200"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'latency_seconds_sum 5.55' in text
+    assert 'latency_seconds_count 3' in text
+    assert received[0] == ('requests_total', {'status': '200'}, 1)
+    assert len(received) == 5
+
+def test_disabled_registry_records_nothing():
+    """
+    Test that a disabled registry ignores values.
+    """
+    # Arrange
+    registry = MetricsRegistry(enabled=False)
+    counter = registry.counter('requests_total', "Requests.")
+
+    # Act
+    counter.inc()
+
+    # Assert
+    assert counter.value() == 0
+
+def test_scraper_records_fetch_parse_and_operation_metrics(enabled_metrics):
+    """
+    Test that fetching, parsing, validation failures and filter/sort calls are recorded while metrics are enabled.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.elapsed = datetime.timedelta(milliseconds=5)
+    mock_response.raise_for_status.return_value = None
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+    scraper.sort_by_points()
+    HackerNewsEntry("Title", 1, -1, 10)
+
+    # Assert
+    assert metrics.HTTP_REQUEST_SECONDS.count(phase='headers') == 1
+    assert metrics.HTTP_REQUEST_SECONDS.sum(phase='headers') == pytest.approx(0.005)
+    assert metrics.HTTP_REQUEST_SECONDS.count(phase='connect') == 0
+    assert metrics.HTTP_REQUEST_SECONDS.count(phase='total') == 1
+    assert metrics.PARSE_SECONDS.count(backend=scraper.parser.name) == 1
+    assert metrics.ROWS_EXTRACTED.value(backend=scraper.parser.name) == MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH
+    assert metrics.PARSE_SECONDS_PER_ENTRY.count(backend=scraper.parser.name) == 1
+    assert metrics.ENTRY_OPERATION_SECONDS.count(operation='sort_by_points') == 1
+    assert metrics.VALIDATION_FAILURES.value(field='comment_count') == 1
+    assert f'hn_parse_seconds_count{{backend="{scraper.parser.name}"}} 1' in enabled_metrics.render_prometheus()
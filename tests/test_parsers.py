@@ -0,0 +1,137 @@
+import pytest
+from unittest.mock import patch
+from src.constants import HN_PARSER_BACKEND, HN_PARSER_FALLBACK_BACKEND
+from src.models.hn_parser import PARSER_BACKENDS, HackerNewsParser, SoupParser, StreamingParser, StreamingEntryExtractor, get_parser
+from tests.constants import *
+from tests.utils import *
+
+def test_streaming_parser_matches_expected_entries():
+    """
+    Test StreamingParser against the mock yCombinator html file.
+    The parser should return the expected entries in page order.
+    """
+    # Arrange
+    parser = StreamingParser()
+
+    # Act
+    entries = parser.parse(get_mocked_hn_html(), MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+
+    # Assert
+    assert validate_hnentry_list_type(entries), "Expected a list of HackerNewsEntry objects."
+    assert entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 512])
+def test_streaming_parser_is_chunk_size_independent(chunk_size):
+    """
+    Test StreamingParser with different chunk sizes.
+    Entries split across chunk boundaries should be extracted exactly as with the BeautifulSoup backend.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html()
+
+    # Act
+    entries = StreamingParser(chunk_size).parse(mock_html_content, MOCK_HTML_HN_ENTRIES_NUM)
+
+    # Assert
+    assert entries == SoupParser().parse(mock_html_content, MOCK_HTML_HN_ENTRIES_NUM)
+
+def test_streaming_extractor_emits_entries_incrementally():
+    """
+    Test that StreamingEntryExtractor makes each entry available as soon as its row pair has been fed.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html()
+    second_entry_start = mock_html_content.index("class='athing'", mock_html_content.index("class='athing'") + 1)
+    extractor = StreamingEntryExtractor()
+
+    # Act
+    extractor.feed(mock_html_content[:second_entry_start])
+    first_entries = extractor.pop_entries()
+
+    # Assert
+    assert first_entries == MOCK_HTML_EXPECTED_RETURN_VALUE[:1]
+
+def test_lxml_parser_matches_expected_entries():
+    """
+    Test LxmlParser against the mock yCombinator html file. Skipped when lxml is not installed.
+    """
+    pytest.importorskip("lxml")
+
+    # Act
+    entries = get_parser('lxml').parse(get_mocked_hn_html().encode('utf-8'), MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+
+    # Assert
+    assert entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+
+def test_parsers_with_no_entries_requested():
+    """
+    Test every parser backend with max_entries of zero.
+    The result should always be an empty list.
+    """
+    assert SoupParser().parse(get_mocked_hn_html(), 0) == []
+    assert StreamingParser().parse(get_mocked_hn_html(), 0) == []
+
+def test_get_parser_unknown_backend():
+    """
+    Test get_parser with an unknown backend name.
+    The function should raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        get_parser('not a parser')
+
+def test_parser_base_class_is_abstract():
+    """
+    Test that HackerNewsParser and subclasses that do not implement parse cannot be instantiated.
+    """
+    class IncompleteParser(HackerNewsParser):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        HackerNewsParser()
+    with pytest.raises(TypeError):
+        IncompleteParser()
+
+def test_get_parser_falls_back_when_default_backend_is_missing():
+    """
+    Test that the default backend falls back to HN_PARSER_FALLBACK_BACKEND when its package cannot be imported,
+    while other backends still raise ImportError.
+    """
+    # Arrange
+    class MissingParser:
+        def __init__(self):
+            raise ImportError("Mocked missing package.")
+    other_backend = next(name for name in PARSER_BACKENDS if name not in (HN_PARSER_BACKEND, HN_PARSER_FALLBACK_BACKEND))
+
+    # Act
+    with patch.dict(PARSER_BACKENDS, {HN_PARSER_BACKEND: MissingParser, other_backend: MissingParser}):
+        parser = get_parser(HN_PARSER_BACKEND)
+        with pytest.raises(ImportError):
+            get_parser(other_backend)
+
+    # Assert
+    assert parser.name == HN_PARSER_FALLBACK_BACKEND
+
+@pytest.mark.parametrize("backend", ["stream", "html.parser", "lxml"])
+def test_parsers_extract_url_author_and_posted_at(backend):
+    """
+    Test that every backend extracts the story URL, host, author and submission time in the same pass.
+    Relative links of Ask HN posts should be resolved against Hacker News.
+    """
+    # Arrange
+    try:
+        parser = get_parser(backend)
+    except ImportError:
+        pytest.skip(f"{backend} is not installed")
+
+    # Act
+    entries = parser.parse(get_mocked_hn_html(), MOCK_HTML_HN_ENTRIES_NUM)
+    ask_entries = [entry for entry in entries if entry.host == "news.ycombinator.com"]
+
+    # Assert
+    first = entries[0]
+    assert first.url.startswith("https://www.splunk.com/en_us/blog/")
+    assert first.host == "www.splunk.com"
+    assert first.author == "siddharthb_"
+    assert first.posted_at == 1695298519
+    assert all(entry.author and entry.posted_at for entry in entries)
+    assert ask_entries and all(entry.url == f"https://news.ycombinator.com/item?id={entry.item_id}" for entry in ask_entries)
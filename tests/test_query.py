@@ -0,0 +1,72 @@
+import pytest
+from src.models.entry_query import EntryQuery
+from src.models.hn_entry import HackerNewsEntry
+
+entries = [
+    HackerNewsEntry("Short title", 1, 10, 100),
+    HackerNewsEntry("This is a much longer title than the previous one", 2, 20, 200),
+    HackerNewsEntry("Another short title", 3, 30, 300),
+    HackerNewsEntry("Yet another very long title that exceeds the five-word limit", 4, 40, 400),
+    HackerNewsEntry("Word count equals limit here", 5, 40, 500),
+]
+
+def test_query_matches_filter_and_sort_methods():
+    """
+    Test a query combining a title length filter with a sort.
+    The result should match applying the scraper's filter and sort methods, without modifying the source list.
+    """
+    # Arrange
+    source = list(entries)
+
+    # Act
+    result = EntryQuery(source).max_words(5).sort_by('comments').execute()
+
+    # Assert
+    expected = sorted([entry for entry in entries if len(entry.title.split()) <= 5], key=lambda x: x.comment_count, reverse=True)
+    assert result == expected
+    assert source == entries, "Expected the source entries to be left untouched."
+
+def test_query_top_k_is_stable():
+    """
+    Test a sorted query with a limit.
+    The heap-based selection should return the same entries as a full stable sort followed by a slice.
+    """
+    # Act
+    result = EntryQuery(entries).sort_by('comments').limit(3).execute()
+
+    # Assert
+    assert result == sorted(entries, key=lambda x: x.comment_count, reverse=True)[:3]
+    assert [entry.order_num for entry in result] == [4, 5, 3]
+
+def test_query_builders_do_not_mutate():
+    """
+    Test that builder methods return new queries and leave the original query unchanged.
+    """
+    # Arrange
+    base = EntryQuery(entries)
+
+    # Act
+    long_titles = base.min_words(5)
+
+    # Assert
+    assert len(base.execute()) == len(entries)
+    assert [entry.order_num for entry in long_titles] == [2, 4]
+
+def test_query_with_non_positive_word_limit():
+    """
+    Test queries with word limits less than or equal to zero.
+    The result should always be empty, as with the scraper's filter methods.
+    """
+    assert EntryQuery(entries).min_words(5).min_words(0).execute() == []
+    assert EntryQuery(entries).max_words(-1).execute() == []
+
+def test_query_invalid_arguments():
+    """
+    Test query builder methods with invalid arguments.
+    """
+    with pytest.raises(TypeError):
+        EntryQuery(entries).min_words("5")
+    with pytest.raises(ValueError):
+        EntryQuery(entries).sort_by("title")
+    with pytest.raises(ValueError):
+        EntryQuery(entries).limit(-1)
@@ -0,0 +1,87 @@
+import pytest
+from src.models.entry_query import EntryQuery
+from src.models.hn_entry import HackerNewsEntry
+from src.models.ranking import gravity_score, sort_entries, top_k
+
+ENTRIES = [
+    HackerNewsEntry("Title A", 1, 10, 100, item_id=101),
+    HackerNewsEntry("Title B", 2, 50, 100, item_id=102),
+    HackerNewsEntry("Title C", 3, 0, 40, item_id=103),
+    HackerNewsEntry("Title D", 4, 5, 300, item_id=104),
+]
+
+def test_top_k_selects_highest_scores_stably():
+    """
+    Test that top_k returns the k best entries, keeping input order between equal scores.
+    """
+    # Act
+    by_points = top_k(ENTRIES, 3, 'points')
+    by_ratio = top_k(ENTRIES, 2, 'points_per_comment', with_scores=True)
+    by_callable = top_k(ENTRIES, 1, lambda entry: -entry.points)
+
+    # Assert
+    assert [entry.item_id for entry in by_points] == [104, 101, 102]
+    assert [(score, entry.item_id) for score, entry in by_ratio] == [(300 / 6, 104), (40.0, 103)]
+    assert [entry.item_id for entry in by_callable] == [103]
+
+def test_gravity_score_decays_with_age():
+    """
+    Test that the gravity formula ranks a newer story above an older one with more points.
+    """
+    # Arrange
+    ages = {101: 3600 * 10, 104: 3600 * 30}
+    score = gravity_score(lambda entry: ages[entry.item_id])
+
+    # Act
+    ranked = top_k([ENTRIES[0], ENTRIES[3]], 2, score)
+
+    # Assert
+    assert [entry.item_id for entry in ranked] == [101, 104]
+    assert score(ENTRIES[0]) == pytest.approx(99 / 12 ** 1.8)
+
+def test_gravity_score_ranks_unknown_ages_last():
+    """
+    Test that entries without a submission time rank after every dated entry, even with more points.
+    """
+    # Arrange
+    now = 1700000000
+    dated = HackerNewsEntry("Dated", 1, 0, 2, item_id=201, posted_at=now - 3600 * 48)
+    undated = HackerNewsEntry("Undated", 2, 0, 500, item_id=202)
+    score = gravity_score(lambda entry: entry.age(now))
+
+    # Act
+    ranked = top_k([undated, dated], 2, score)
+    default_ranked = top_k([undated, dated], 2, 'gravity')
+
+    # Assert
+    assert [entry.item_id for entry in ranked] == [201, 202]
+    assert [entry.item_id for entry in default_ranked] == [201, 202]
+    assert score(undated) == float('-inf')
+
+def test_sort_entries_multi_key():
+    """
+    Test a stable multi-key sort with mixed directions, with and without a limit.
+    """
+    # Act
+    full = sort_entries(ENTRIES, 'points', ('comments', False))
+    limited = sort_entries(ENTRIES, 'points', ('comments', False), limit=2)
+
+    # Assert
+    assert [entry.item_id for entry in full] == [104, 101, 102, 103]
+    assert limited == full[:2]
+    with pytest.raises(ValueError):
+        sort_entries(ENTRIES)
+
+def test_query_rank_by():
+    """
+    Test that EntryQuery.rank_by ranks by a built-in formula and rejects unknown names and stray options.
+    """
+    # Act
+    ranked = EntryQuery(ENTRIES).min_words(1).rank_by('points_per_comment').limit(1).execute()
+
+    # Assert
+    assert [entry.item_id for entry in ranked] == [104]
+    with pytest.raises(ValueError):
+        EntryQuery(ENTRIES).rank_by('unknown')
+    with pytest.raises(TypeError):
+        EntryQuery(ENTRIES).rank_by('points', age=len)
@@ -0,0 +1,139 @@
+import pytest
+import asyncio
+import datetime
+import threading
+import time
+from unittest.mock import patch, Mock
+from src.models.hn_scraper import HackerNewsScraper
+from src.utils.rate_limiter import TokenBucket, HostRateLimiter, FetchScheduler
+from tests.constants import *
+from tests.utils import *
+
+def test_token_bucket_queues_reservations():
+    """
+    Test that reservations on an empty TokenBucket are spaced by the refill interval.
+    """
+    # Arrange
+    bucket = TokenBucket(rate=10, capacity=1)
+
+    # Act
+    delays = [bucket.reserve() for _ in range(3)]
+
+    # Assert
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+    assert not bucket.try_acquire()
+
+def test_scheduler_coalesces_pending_jobs():
+    """
+    Test that submitting a key that is still pending returns the same Future and runs the job once.
+    """
+    # Arrange
+    scheduler = FetchScheduler(HostRateLimiter(rate=1000))
+    release = threading.Event()
+    calls = []
+
+    def job():
+        calls.append(1)
+        release.wait(1)
+        return "entries"
+
+    # Act
+    first = scheduler.submit('fetch', job, host='news.ycombinator.com')
+    second = scheduler.submit('fetch', job, host='news.ycombinator.com')
+    release.set()
+
+    # Assert
+    assert first is second
+    assert first.result(timeout=1) == "entries"
+    assert len(calls) == 1
+    scheduler.shutdown()
+
+def test_scheduler_waits_for_rate_limit():
+    """
+    Test that jobs for the same host run no sooner than the rate limit allows, through both interfaces.
+    """
+    # Arrange
+    scheduler = FetchScheduler(HostRateLimiter(rate=20, capacity=1))
+    start = time.monotonic()
+
+    # Act
+    scheduler.run('first', time.monotonic, host='news.ycombinator.com')
+    second_run_time = asyncio.run(scheduler.run_async('second', time.monotonic, host='news.ycombinator.com'))
+
+    # Assert
+    assert second_run_time - start >= 0.045
+    scheduler.shutdown()
+
+def test_scheduler_propagates_exceptions():
+    """
+    Test that an exception raised by a job is raised to the caller and the key can be submitted again.
+    """
+    # Arrange
+    scheduler = FetchScheduler(HostRateLimiter(rate=1000))
+
+    def failing_job():
+        raise ValueError("Mocked error")
+
+    # Act and Assert
+    with pytest.raises(ValueError):
+        scheduler.run('fetch', failing_job)
+    assert scheduler.run('fetch', lambda: "retried") == "retried"
+    scheduler.shutdown()
+
+def test_schedule_fetch_waits_for_crawl_delay():
+    """
+    Test that schedule_fetch runs a fetch made too soon once the crawl delay has passed, instead of returning early.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.raise_for_status.return_value = None
+    scheduler = FetchScheduler(HostRateLimiter(rate=1000))
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response), \
+         patch('src.models.hn_scraper.HN_FETCH_DELAY', 0.1):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+        fetch_time = scraper.last_fetch_time
+
+        # Act
+        entries = scraper.schedule_fetch(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, scheduler).result(timeout=2)
+
+    # Assert
+    assert entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert scraper.last_fetch_time - fetch_time >= datetime.timedelta(seconds=0.1)
+    scheduler.shutdown()
+
+def test_scheduled_fetches_of_different_sizes_keep_crawl_delay():
+    """
+    Test that two scheduled fetches of different sizes on the same scraper, both queued before the crawl delay
+    passed, run at least HN_FETCH_DELAY apart instead of back to back.
+    """
+    # Arrange
+    fetch_delay = 0.2
+    request_times = []
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.raise_for_status.return_value = None
+
+    def fake_get(*args, **kwargs):
+        request_times.append(time.monotonic())
+        return mock_response
+
+    scheduler = FetchScheduler(HostRateLimiter(rate=1000))
+    with patch('src.models.hn_scraper.requests.get', side_effect=fake_get), \
+         patch('src.models.hn_scraper.HN_FETCH_DELAY', fetch_delay):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(fetch=False)
+
+        # Act
+        first = scraper.schedule_fetch(30, scheduler)
+        second = scraper.schedule_fetch(10, scheduler)
+        first.result(timeout=2)
+        second.result(timeout=2)
+
+    # Assert
+    assert len(request_times) == 2
+    assert request_times[1] - request_times[0] >= fetch_delay
+    scheduler.shutdown()
@@ -0,0 +1,237 @@
+import asyncio
+import datetime
+import socket
+import threading
+import time
+import pytest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+from requests.exceptions import ChunkedEncodingError, ConnectionError, HTTPError, Timeout
+from src.models.hn_scraper import HackerNewsScraper
+from src.utils.resilience import CircuitBreaker, CircuitOpenError, FetchPolicy, RetryPolicy, is_transient
+from tests.constants import *
+from tests.utils import *
+
+class FakeHackerNewsHandler(BaseHTTPRequestHandler):
+    """
+    Serves the mock listing page with the failure selected by the request path:
+    /ok answers at once, /slow waits before answering, /flaky answers 503 twice before succeeding, /down always
+    answers 503, /truncated closes the connection half way through the body and /missing answers 404.
+    """
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        self.server.hits[path] += 1
+        body = get_mocked_hn_html().encode('utf-8')
+        if path == '/slow':
+            time.sleep(0.5)
+        if path == '/down' or (path == '/flaky' and self.server.hits[path] <= 2):
+            self.send_error(503)
+            return
+        if path == '/missing':
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if path == '/truncated':
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def fake_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeHackerNewsHandler)
+    server.daemon_threads = True
+    server.hits = Counter()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _scraper(server: ThreadingHTTPServer, path: str, policy: FetchPolicy) -> HackerNewsScraper:
+    HackerNewsScraper._instance = None
+    host, port = server.server_address
+    return HackerNewsScraper(url=f"http://{host}:{port}{path}", fetch=False, fetch_policy=policy)
+
+def _fetch(scraper: HackerNewsScraper) -> None:
+    scraper.last_fetch_time = datetime.datetime.min
+    scraper.fetch_hn_entries(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+
+def test_transient_failures_are_retried(fake_server):
+    """
+    Test that 503 responses are retried until the server recovers, and that the entries of the final response are kept.
+    """
+    # Arrange
+    scraper = _scraper(fake_server, '/flaky', FetchPolicy(retry=RetryPolicy(max_attempts=3, base_delay=0)))
+
+    # Act
+    _fetch(scraper)
+
+    # Assert
+    assert not scraper.fetch_error
+    assert scraper.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert fake_server.hits['/flaky'] == 3
+
+def test_slow_response_times_out(fake_server):
+    """
+    Test that a server slower than the read timeout makes each attempt fail instead of blocking, and that the
+    scraper flags the failure instead of raising.
+    """
+    # Arrange
+    scraper = _scraper(fake_server, '/slow', FetchPolicy(read_timeout=0.1, retry=RetryPolicy(max_attempts=2, base_delay=0)))
+
+    # Act
+    start = time.monotonic()
+    _fetch(scraper)
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert scraper.fetch_error
+    assert isinstance(scraper.last_fetch_exception, Timeout)
+    assert scraper.entries == []
+    assert fake_server.hits['/slow'] == 2
+    assert elapsed < 0.8
+
+def test_truncated_and_missing_responses(fake_server):
+    """
+    Test that a body cut short is detected and retried, while a 404 is raised at once without retrying.
+    """
+    # Arrange
+    policy = FetchPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0))
+    truncated = _scraper(fake_server, '/truncated', policy)
+
+    # Act
+    _fetch(truncated)
+    truncated_error = truncated.last_fetch_exception
+    missing = _scraper(fake_server, '/missing', policy)
+    _fetch(missing)
+
+    # Assert
+    assert isinstance(truncated_error, ChunkedEncodingError)
+    assert fake_server.hits['/truncated'] == 2
+    assert missing.fetch_error
+    assert missing.last_fetch_exception.response.status_code == 404
+    assert fake_server.hits['/missing'] == 1
+
+def test_circuit_breaker_fails_fast(fake_server):
+    """
+    Test that the circuit opens after failure_threshold consecutive failures, so that requests to the host fail
+    without being sent, and that a successful trial request after reset_timeout closes it again.
+    """
+    # Arrange
+    policy = FetchPolicy(retry=RetryPolicy(max_attempts=1), failure_threshold=2, reset_timeout=0.2)
+    down = _scraper(fake_server, '/down', policy)
+
+    # Act
+    for _ in range(3):
+        _fetch(down)
+    open_error = down.last_fetch_exception
+    time.sleep(0.25)
+    healthy = _scraper(fake_server, '/ok', policy)
+    _fetch(healthy)
+
+    # Assert
+    assert isinstance(open_error, CircuitOpenError)
+    assert fake_server.hits['/down'] == 2
+    assert not healthy.fetch_error
+    assert healthy.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert policy.breaker(f"127.0.0.1:{fake_server.server_address[1]}").state == CircuitBreaker.CLOSED
+
+def test_interrupted_trial_is_released():
+    """
+    Test that a trial request ending with an error that is not a RequestException does not leave the circuit stuck:
+    the next request is let through as a new trial and closes the circuit.
+    """
+    # Arrange
+    policy = FetchPolicy(retry=RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=0)
+    request = Mock(side_effect=[ConnectionError(), ValueError(), 'ok'])
+
+    # Act
+    with pytest.raises(ConnectionError):
+        policy.call('example.com', request)
+    with pytest.raises(ValueError):
+        policy.call('example.com', request)
+    result = policy.call('example.com', request)
+
+    # Assert
+    assert result == 'ok'
+    assert request.call_count == 3
+    assert policy.breaker('example.com').state == CircuitBreaker.CLOSED
+
+def test_cancelled_async_trial_is_released():
+    """
+    Test that a trial request cancelled while awaited releases the circuit, so that the next request is let through.
+    """
+    # Arrange
+    policy = FetchPolicy(retry=RetryPolicy(max_attempts=1), failure_threshold=1, reset_timeout=0)
+    outcomes = [ConnectionError(), asyncio.CancelledError(), 'ok']
+
+    async def request():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def scenario():
+        with pytest.raises(ConnectionError):
+            await policy.call_async('example.com', request)
+        with pytest.raises(asyncio.CancelledError):
+            await policy.call_async('example.com', request)
+        return await policy.call_async('example.com', request)
+
+    # Act
+    result = asyncio.run(scenario())
+
+    # Assert
+    assert result == 'ok'
+    assert policy.breaker('example.com').state == CircuitBreaker.CLOSED
+
+def test_connection_refused_is_handled():
+    """
+    Test that a connection error, which used to escape fetch_hn_entries, is retried and then flagged.
+    """
+    # Arrange
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    HackerNewsScraper._instance = None
+    scraper = HackerNewsScraper(url=f"http://127.0.0.1:{port}/news", fetch=False,
+                                fetch_policy=FetchPolicy(retry=RetryPolicy(max_attempts=2, base_delay=0)))
+
+    # Act
+    _fetch(scraper)
+
+    # Assert
+    assert scraper.fetch_error
+    assert isinstance(scraper.last_fetch_exception, ConnectionError)
+
+def test_retry_policy_delays():
+    """
+    Test that retry delays are jittered within the exponential bound, honour Retry-After, and stop after
+    max_attempts or for errors that are not transient.
+    """
+    # Arrange
+    policy = RetryPolicy(max_attempts=4, base_delay=1, max_delay=3)
+    throttled = HTTPError(response=Mock(status_code=429, headers={'Retry-After': '2'}))
+    throttled_long = HTTPError(response=Mock(status_code=429, headers={'Retry-After': '60'}))
+    missing = HTTPError(response=Mock(status_code=404, headers={}))
+
+    # Act
+    delays = [policy.delay(retry, Timeout()) for retry in range(3) for _ in range(50)]
+
+    # Assert
+    assert all(0 <= delay <= 3 for delay in delays)
+    assert max(delays[:50]) <= 1
+    assert policy.delay(3, Timeout()) is None
+    assert policy.delay(0, throttled) >= 2
+    assert policy.delay(0, throttled_long) is None
+    assert policy.delay(0, missing) is None
+    assert not is_transient(CircuitOpenError())
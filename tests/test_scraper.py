@@ -1,9 +1,13 @@
 import pytest
+import asyncio
+import datetime
 from unittest.mock import patch, Mock
 from requests.exceptions import HTTPError
 from tests.constants import *
 from tests.utils import *
 from src.models.hn_scraper import HackerNewsScraper
+from src.constants import HN_PAGE_PARAM
+from src.utils.async_http import AsyncHttpPool
 
 def test_fetch_hn_entries():
     """
@@ -58,4 +62,147 @@ def test_fetch_hn_entries_http_error():
             HackerNewsScraper(max_entries=expected_num_entries)
             # Assert
         except HTTPError:
-            pytest.fail("The method did not handle the HTTPError.")
\ No newline at end of file
+            pytest.fail("The method did not handle the HTTPError.")
+
+def test_crawl_hn_entries_follows_pagination():
+    """
+    Test crawl_hn_entries over several mocked pages.
+    The function should request consecutive pages, keep the entries in page order and stop at the first empty page.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html()
+    mock_response = Mock()
+    mock_response.content = mock_html_content
+    mock_response.raise_for_status.return_value = None
+    empty_response = Mock()
+    empty_response.content = "<html><body></body></html>"
+    empty_response.raise_for_status.return_value = None
+    responses = {None: mock_response, 2: mock_response}
+
+    def mock_get(url, params=None, **kwargs):
+        page = params[HN_PAGE_PARAM] if params else None
+        return responses.get(page, empty_response)
+
+    with patch('src.models.hn_scraper.requests.get', side_effect=mock_get) as mocked_get, \
+         patch('src.models.hn_scraper.HN_CRAWL_PAGE_DELAY', 0):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+        scraper.last_fetch_time = datetime.datetime.min
+
+        # Act
+        scraper.crawl_hn_entries(max_entries=MOCK_HTML_HN_ENTRIES_NUM * 4, max_workers=2)
+
+    # Assert
+    assert not scraper.fetch_error
+    assert validate_hnentry_list_type(scraper.entries), "Expected a list of HackerNewsEntry objects."
+    assert len(scraper.entries) == MOCK_HTML_HN_ENTRIES_NUM * 2, f"Expected {MOCK_HTML_HN_ENTRIES_NUM * 2} entries, but got {len(scraper.entries)}"
+    assert scraper.entries[:len(MOCK_HTML_EXPECTED_RETURN_VALUE)] == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert scraper.entries[MOCK_HTML_HN_ENTRIES_NUM] == MOCK_HTML_EXPECTED_RETURN_VALUE[0]
+    assert mocked_get.call_count <= 5, "Expected the crawl to stop shortly after the first empty page."
+
+def test_crawl_hn_entries_limits_entries():
+    """
+    Test crawl_hn_entries with a max_entries value that is not a multiple of the page size.
+    The function should return exactly max_entries entries.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.raise_for_status.return_value = None
+    expected_num_entries = MOCK_HTML_HN_ENTRIES_NUM + MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH
+
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response), \
+         patch('src.models.hn_scraper.HN_CRAWL_PAGE_DELAY', 0):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+        scraper.last_fetch_time = datetime.datetime.min
+
+        # Act
+        scraper.crawl_hn_entries(max_entries=expected_num_entries)
+
+    # Assert
+    assert len(scraper.entries) == expected_num_entries, f"Expected {expected_num_entries} entries, but got {len(scraper.entries)}"
+
+def test_fetch_hn_entries_async():
+    """
+    Test fetch_hn_entries_async with a mocked connection pool session.
+    The function should produce the same entries as fetch_hn_entries.
+    """
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = get_mocked_hn_html()
+    mock_response.raise_for_status.return_value = None
+    pool = AsyncHttpPool()
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+    scraper.last_fetch_time = datetime.datetime.min
+    scraper.entries = []
+
+    # Act
+    with patch.object(pool._session, 'get', return_value=mock_response):
+        asyncio.run(scraper.fetch_hn_entries_async(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, pool=pool))
+    pool.close()
+
+    # Assert
+    assert not scraper.fetch_error
+    assert scraper.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+
+def test_fetch_hn_entries_async_http_error():
+    """
+    Test fetch_hn_entries_async when an HTTP error occurs.
+    The function should handle the error, flag it and leave an empty list of entries.
+    """
+    # Arrange
+    pool = AsyncHttpPool()
+    with patch('src.models.hn_scraper.requests.get', side_effect=HTTPError("Mocked HTTP Error")):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(max_entries=MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH)
+    scraper.last_fetch_time = datetime.datetime.min
+
+    # Act
+    with patch.object(pool._session, 'get', side_effect=HTTPError("Mocked HTTP Error")):
+        asyncio.run(scraper.fetch_hn_entries_async(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH, pool=pool))
+    pool.close()
+
+    # Assert
+    assert scraper.fetch_error
+    assert scraper.entries == []
+
+def test_iter_entries_streams_and_stops_early():
+    """
+    Test iter_entries with a response body delivered in small chunks.
+    The generator should yield the expected entries and stop reading the body once max_entries is reached.
+    """
+    # Arrange
+    mock_html_content = get_mocked_hn_html().encode('utf-8')
+    chunk_size = 1024
+    chunks_read = []
+
+    num_chunks = -(-len(mock_html_content) // chunk_size)
+
+    def iter_content(chunk_size=chunk_size):
+        for start in range(0, len(mock_html_content), chunk_size):
+            chunks_read.append(start)
+            yield mock_html_content[start:start + chunk_size]
+
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.iter_content.side_effect = iter_content
+    with patch('src.models.hn_scraper.requests.get', return_value=mock_response):
+        HackerNewsScraper._instance = None
+        scraper = HackerNewsScraper(fetch=False)
+
+        # Act
+        first_entry = next(scraper.iter_entries(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH))
+        chunks_for_first_entry = len(chunks_read)
+        scraper.last_fetch_time = datetime.datetime.min
+        entries = list(scraper.iter_entries(MOCK_HTML_HN_ENTRIES_NUM_TO_FETCH))
+
+    # Assert
+    assert first_entry == MOCK_HTML_EXPECTED_RETURN_VALUE[0]
+    assert chunks_for_first_entry < num_chunks // 4, "Expected the first entry before most of the body was read."
+    assert entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert scraper.entries == MOCK_HTML_EXPECTED_RETURN_VALUE
+    assert len(chunks_read) - chunks_for_first_entry < num_chunks, "Expected reading to stop once max_entries was reached."
+    mock_response.close.assert_called()
@@ -0,0 +1,66 @@
+import pytest
+from src.models.hn_entry import HackerNewsEntry
+from src.models.title_index import TitleLengthIndex
+
+entries = [
+    HackerNewsEntry("Short title", 1, 10, 100),
+    HackerNewsEntry("This is a much longer title than the previous one", 2, 20, 200),
+    HackerNewsEntry("Another short title", 3, 30, 300),
+    HackerNewsEntry("Yet another very long title that exceeds the five-word limit", 4, 40, 400),
+    HackerNewsEntry("Word count equals limit here", 5, 50, 500),
+]
+
+def test_word_count_follows_title():
+    """
+    Test that HackerNewsEntry.word_count is computed on construction and updated when the title changes.
+    """
+    # Arrange
+    entry = HackerNewsEntry("Short title", 1, 10, 100)
+
+    # Act
+    entry.title = "A slightly longer title"
+
+    # Assert
+    assert HackerNewsEntry.trusted("Short title", 1, 10, 100).word_count == 2
+    assert entry.word_count == 4
+
+@pytest.mark.parametrize("min_words, max_words", [(None, 5), (5, None), (2, 5), (3, 3), (None, None)])
+def test_index_matches_linear_scan(min_words, max_words):
+    """
+    Test TitleLengthIndex range queries against a linear scan, for entries added in bulk, one at a time and
+    in several batches.
+    """
+    # Arrange
+    bulk_index = TitleLengthIndex(entries)
+    incremental_index = TitleLengthIndex()
+    for entry in entries:
+        incremental_index.add(entry)
+    batched_index = TitleLengthIndex(entries[:2])
+    batched_index.extend(entries[2:4])
+    batched_index.extend(entries[4:])
+    expected = [entry for entry in entries
+                if (min_words is None or entry.word_count > min_words) and (max_words is None or entry.word_count <= max_words)]
+
+    # Act and Assert
+    assert bulk_index.between(min_words, max_words) == expected
+    assert incremental_index.between(min_words, max_words) == expected
+    assert batched_index.between(min_words, max_words) == expected
+    assert bulk_index.count_between(min_words, max_words) == len(expected)
+
+def test_index_with_non_positive_bounds():
+    """
+    Test TitleLengthIndex with bounds less than or equal to zero.
+    The result should always be empty, as with the scraper's filter methods.
+    """
+    index = TitleLengthIndex(entries)
+    assert index.longer_than(0) == []
+    assert index.at_most(-5) == []
+
+def test_index_invalid_input():
+    """
+    Test TitleLengthIndex with invalid entries and bound types.
+    """
+    with pytest.raises(TypeError):
+        TitleLengthIndex("not a list")
+    with pytest.raises(TypeError):
+        TitleLengthIndex(entries).at_most("five")
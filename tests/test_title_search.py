@@ -0,0 +1,59 @@
+import pytest
+from src.models.hn_entry import HackerNewsEntry
+from src.models.title_search import TitleSearchIndex
+
+ENTRIES = [
+    HackerNewsEntry("Show HN: A tiny Rust compiler", 1, 10, 100),
+    HackerNewsEntry("Why we moved from Python to Rust", 2, 50, 100),
+    HackerNewsEntry("HN show and tell", 3, 0, 40),
+    HackerNewsEntry("Show HN: Rusty, a Python linter", 4, 5, 300),
+]
+
+def test_keyword_phrase_and_prefix_queries():
+    """
+    Test keyword, phrase and prefix queries, alone and combined.
+    """
+    # Arrange
+    index = TitleSearchIndex(ENTRIES[:2])
+    index.add(ENTRIES[2])
+    index.extend(ENTRIES[3:])
+
+    # Act / Assert
+    assert index.search("rust") == [ENTRIES[0], ENTRIES[1]]
+    assert index.search(["show", "hn"]) == [ENTRIES[0], ENTRIES[2], ENTRIES[3]]
+    assert index.search(phrase="Show HN") == [ENTRIES[0], ENTRIES[3]]
+    assert index.search(prefix="Rus") == [ENTRIES[0], ENTRIES[1], ENTRIES[3]]
+    assert index.search("python", prefix="rust") == [ENTRIES[1], ENTRIES[3]]
+    assert index.search("golang") == []
+    assert index.search() == ENTRIES
+
+def test_search_combines_title_length_filters():
+    """
+    Test that title length bounds follow the scraper's filter rules and intersect with the text criteria.
+    """
+    # Arrange
+    index = TitleSearchIndex(ENTRIES)
+
+    # Act / Assert
+    assert index.search(phrase="show hn", min_words=5) == [ENTRIES[0], ENTRIES[3]]
+    assert index.search(phrase="show hn", max_words=5) == []
+    assert index.search(max_words=5) == [ENTRIES[2]]
+    assert index.search("rust", min_words=0) == []
+    with pytest.raises(TypeError):
+        index.search(min_words="5")
+    with pytest.raises(TypeError):
+        index.add("not an entry")
+
+def test_queries_without_words_match_nothing():
+    """
+    Test that keywords and phrases made only of punctuation or empty match no entry instead of every entry.
+    """
+    # Arrange
+    index = TitleSearchIndex(ENTRIES)
+
+    # Act / Assert
+    assert index.search("!!!") == []
+    assert index.search("") == []
+    assert index.search(["rust", "?"]) == []
+    assert index.search(phrase="...") == []
+    assert index.search([]) == ENTRIES
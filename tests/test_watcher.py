@@ -0,0 +1,113 @@
+import threading
+from unittest.mock import patch, Mock
+from requests.exceptions import ConnectionError, HTTPError
+from src.models.hn_scraper import HackerNewsScraper
+from src.models.hn_watcher import HackerNewsWatcher
+from src.utils.resilience import FetchPolicy, RetryPolicy
+from tests.utils import *
+
+def _ok_response() -> Mock:
+    response = Mock(content=get_mocked_hn_html())
+    response.raise_for_status.return_value = None
+    return response
+
+def _error_response(status_code: int, headers: dict | None = None) -> Mock:
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.raise_for_status.side_effect = HTTPError(f"{status_code} Error", response=response)
+    return response
+
+def _new_scraper() -> HackerNewsScraper:
+    HackerNewsScraper._instance = None
+    # Without retries, each poll sends exactly one request, and a fresh policy keeps the shared circuit breakers closed
+    return HackerNewsScraper(fetch=False, fetch_policy=FetchPolicy(retry=RetryPolicy(max_attempts=1)))
+
+def test_watcher_slows_down_on_quiet_front_page():
+    """
+    Test that the first cycle only sets the baseline, and that identical pages after it lengthen the interval up to
+    max_interval. Every result should reach the sinks, even when an earlier sink fails.
+    """
+    # Arrange
+    results = []
+    failing_sink = Mock(side_effect=RuntimeError("sink failed"))
+    watcher = HackerNewsWatcher(_new_scraper(), sinks=[failing_sink, results.append], min_interval=30,
+                                max_interval=100, initial_interval=60)
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=_ok_response()), \
+         patch.object(HackerNewsScraper, '_fetch_delay_elapsed', return_value=True):
+        intervals = [watcher.poll_once().next_interval for _ in range(3)]
+
+    # Assert
+    assert intervals == [60, 90, 100]
+    assert [result.cycle for result in results] == [1, 2, 3]
+    assert len(results[0].changes.added) == len(results[0].entries) > 0
+    assert not results[1].changes
+    assert failing_sink.call_count == 3
+
+def test_watcher_speeds_up_on_busy_front_page():
+    """
+    Test that a cycle in which many entries were added, moved or dropped halves the interval, down to min_interval.
+    """
+    # Arrange
+    first_page = get_mocked_hn_html()
+    # Swapping the ids of the listed items makes every entry look new on the second page
+    second_page = first_page.replace("class='athing' id='", "class='athing' id='9")
+    responses = [Mock(content=first_page), Mock(content=second_page)]
+    watcher = HackerNewsWatcher(_new_scraper(), min_interval=40, initial_interval=60)
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', side_effect=responses), \
+         patch.object(HackerNewsScraper, '_fetch_delay_elapsed', return_value=True):
+        watcher.poll_once()
+        result = watcher.poll_once()
+
+    # Assert
+    assert result.changes.added and result.changes.dropped
+    assert result.next_interval == 40
+
+def test_watcher_backs_off_on_errors():
+    """
+    Test that failed cycles back off exponentially, faster when the server throttles with 429 or 503 and at least
+    as long as its Retry-After header, and that the first success restores the interval in effect before the errors.
+    """
+    # Arrange
+    responses = [ConnectionError("Connection refused"), _error_response(500),
+                 _error_response(429, {'Retry-After': '700'}), _error_response(503), _ok_response()]
+    watcher = HackerNewsWatcher(_new_scraper(), min_interval=30, max_interval=1000, initial_interval=60)
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', side_effect=responses), \
+         patch.object(HackerNewsScraper, '_fetch_delay_elapsed', return_value=True):
+        results = [watcher.poll_once() for _ in responses]
+
+    # Assert
+    assert [result.next_interval for result in results] == [120, 240, 960, 1000, 60]
+    assert isinstance(results[0].error, ConnectionError)
+    assert results[2].error.response.status_code == 429
+    assert all(result.changes is None for result in results[:4])
+    assert results[4].error is None and watcher.consecutive_errors == 0
+
+def test_watcher_run_stops():
+    """
+    Test that run() returns after max_cycles cycles, and that stop() interrupts the wait between two cycles.
+    """
+    # Arrange
+    polled = threading.Event()
+    watcher = HackerNewsWatcher(_new_scraper(), sinks=[lambda result: polled.set()], min_interval=30,
+                                initial_interval=30)
+
+    # Act
+    with patch('src.models.hn_scraper.requests.get', return_value=_ok_response()), \
+         patch.object(HackerNewsScraper, '_fetch_delay_elapsed', return_value=True):
+        watcher.run(max_cycles=1)
+        cycles_after_limit = watcher.cycle
+        polled.clear()
+        runner = threading.Thread(target=watcher.run)
+        runner.start()
+        polled.wait(timeout=5)
+        watcher.stop()
+        runner.join(timeout=5)
+
+    # Assert
+    assert cycles_after_limit == 1
+    assert not runner.is_alive()
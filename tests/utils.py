@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from tests.constants import MOCK_HTML_FILE_RELATIVE_PATH
+from tests.constants import MOCK_HTML_FILE_RELATIVE_PATH, MOCK_ITEM_HTML_FILE_RELATIVE_PATH
 from src.models.hn_entry import HackerNewsEntry
 
 # Auxiliary Functions
@@ -23,3 +23,9 @@ def get_mocked_hn_html() -> str:
     mock_file_path = current_file_dir / MOCK_HTML_FILE_RELATIVE_PATH
     with open(mock_file_path, "r", encoding="utf-8") as file:
         return file.read()
+
+def get_mocked_hn_item_html() -> str:
+    current_file_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+    mock_file_path = current_file_dir / MOCK_ITEM_HTML_FILE_RELATIVE_PATH
+    with open(mock_file_path, "r", encoding="utf-8") as file:
+        return file.read()